@@ -0,0 +1,206 @@
+"""Import time benchmark and regression guard.
+
+Every scenario runs in a fresh interpreter, so nothing is cached between runs:
+
+- ``package``: ``import confflow``
+- ``loads``: import `Manager` and a few fields, build a schema and load data with
+  `Manager.loads` into views, as a short-lived command or serverless handler would
+- ``loads-eager``: the same with the default, eager, mode that builds dataclasses
+
+Besides timing them, every scenario checks that modules it doesn't need, like
+PyYAML, were not imported.
+
+Wall-clock times depend on the machine, so they are only compared to a baseline
+measured on the same machine, e.g. on the main branch::
+
+    git switch main && python -m benchmarks.import_time --output base.json
+    git switch - && python -m benchmarks.import_time --baseline base.json
+
+Exits with status 1 if a scenario imported a module it shouldn't have or if the
+median time of a scenario exceeds its baseline median by more than the
+threshold (20% by default, fresh interpreters are noisy).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import typing
+from pathlib import Path
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_SCENARIOS: dict[str, str] = {
+    "package": "import confflow",
+    "loads": """
+from confflow import IntegerField, Manager, Schema, StringField
+
+manager = Manager(
+    Schema("service", description="Service")
+    .add(StringField("name", description="Name", min_length=1))
+    .add(IntegerField("port", description="Port", ge=1, le=65535)),
+)
+manager.loads({"service": {"name": "api", "port": 8080}}, mode="view")
+""",
+    "loads-eager": """
+from confflow import IntegerField, Manager, Schema, StringField
+
+manager = Manager(
+    Schema("service", description="Service")
+    .add(StringField("name", description="Name", min_length=1))
+    .add(IntegerField("port", description="Port", ge=1, le=65535)),
+)
+manager.loads({"service": {"name": "api", "port": 8080}})
+""",
+}
+
+# Modules a scenario must not import, they are only needed by other features
+_FORBIDDEN: dict[str, tuple[str, ...]] = {
+    "package": (
+        "yaml",
+        "dataclasses",
+        "typing_extensions",
+        "confflow._schema",
+        "confflow.manager",
+    ),
+    "loads": (
+        "yaml",
+        "json",
+        "pickle",
+        "mmap",
+        "logging",
+        "hashlib",
+        "threading",
+        "pathlib",
+        "graphlib",
+        "confflow._include",
+    ),
+    "loads-eager": (
+        "yaml",
+        "json",
+        "pickle",
+        "mmap",
+        "logging",
+        "hashlib",
+        "threading",
+        "pathlib",
+        "graphlib",
+        "confflow._include",
+    ),
+}
+
+# json is only imported for the report, after the forbidden modules are checked
+_TEMPLATE: str = """
+import sys
+import time
+
+start = time.perf_counter()
+{code}
+seconds = time.perf_counter() - start
+imported = sorted(name for name in {forbidden!r} if name in sys.modules)
+
+import json
+
+sys.stdout.write(json.dumps({{"seconds": seconds, "imported": imported}}))
+"""
+
+
+def _measure(scenario: str) -> dict[str, typing.Any]:
+    code = _TEMPLATE.format(code=_SCENARIOS[scenario], forbidden=_FORBIDDEN[scenario])
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    return typing.cast("dict[str, typing.Any]", json.loads(output))
+
+
+def run(repeat: int) -> dict[str, typing.Any]:
+    """Time every scenario in `repeat` fresh interpreters.
+
+    Args:
+        repeat: Number of interpreters started per scenario.
+
+    Returns:
+        Minimum and median seconds and the forbidden modules that were imported,
+        per scenario.
+
+    """
+    results: dict[str, typing.Any] = {}
+    for scenario in _SCENARIOS:
+        runs = [_measure(scenario) for _ in range(repeat)]
+        timings = [run["seconds"] for run in runs]
+        results[scenario] = {
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "imported": sorted({name for run in runs for name in run["imported"]}),
+        }
+
+    return results
+
+
+def _slower(
+    results: dict[str, typing.Any],
+    baseline: dict[str, typing.Any],
+    threshold: float,
+) -> list[str]:
+    """Describe the scenarios whose median exceeds the baseline plus threshold."""
+    return [
+        f"{scenario} took {result['median'] * 1000:.1f} ms, more than "
+        f"{baseline[scenario]['median'] * 1000:.1f} ms at baseline + {threshold:.0%}"
+        for scenario, result in results.items()
+        if scenario in baseline
+        and result["median"] > baseline[scenario]["median"] * (1 + threshold)
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks.import_time")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="write the results to this file, to be used as a baseline later",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="results of an earlier run on the same machine to compare against",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed slowdown relative to the baseline, 0.2 for 20%%",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    report = json.dumps(results, indent=2) + "\n"
+    sys.stdout.write(report)
+    if args.output is not None:
+        args.output.write_text(report, encoding="utf-8")
+
+    failures = [
+        f"{scenario} imported {', '.join(result['imported'])}"
+        for scenario, result in results.items()
+        if result["imported"]
+    ]
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        failures.extend(_slower(results, baseline, args.threshold))
+
+    for failure in failures:
+        sys.stderr.write(f"REGRESSION {failure}\n")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
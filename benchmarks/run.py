@@ -0,0 +1,180 @@
+"""Benchmark suite for the load, validate, materialize and template paths.
+
+Each phase is timed separately on a synthetic configuration:
+
+- ``parse``: `yaml.safe_load` of the configuration as YAML text
+- ``validate``: `Manager.validate`
+- ``materialize``: building the eager Config from validated data, as
+  `Manager.loads` does after validation
+- ``templates``: `Manager.create_templates`
+
+Usage::
+
+    python -m benchmarks.run --width 20 --depth 3 --output new.json
+    python -m benchmarks.run compare old.json new.json --threshold 0.1
+
+The comparison exits with status 1 if any phase got slower than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import typing
+from importlib import metadata
+from pathlib import Path
+
+import yaml
+
+from confflow import Manager
+
+from .synthetic import Shape, build
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+def _time(function: Callable[[], object], repeat: int) -> dict[str, float]:
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings),
+    }
+
+
+def run(shape: Shape, repeat: int) -> dict[str, typing.Any]:
+    """Time every phase on a configuration of the given shape.
+
+    Args:
+        shape: Size parameters of the synthetic configuration.
+        repeat: Number of timed runs per phase.
+
+    Returns:
+        Machine-readable results including the environment and parameters.
+
+    """
+    schemas, data = build(shape)
+    manager = Manager(*schemas)
+    text = yaml.safe_dump(data, sort_keys=False)
+
+    with tempfile.TemporaryDirectory() as directory:
+        phases = {
+            "parse": _time(lambda: yaml.safe_load(text), repeat),
+            "validate": _time(lambda: manager.validate(data), repeat),
+            "materialize": _time(
+                lambda: manager._materialize(data, mode="eager"),  # noqa: SLF001
+                repeat,
+            ),
+            "templates": _time(lambda: manager.create_templates(directory), repeat),
+        }
+
+    try:
+        version = metadata.version("confflow")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+
+    return {
+        "environment": {
+            "confflow": version,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "parameters": {**shape._asdict(), "repeat": repeat, "yaml_bytes": len(text)},
+        "phases": phases,
+    }
+
+
+def compare(
+    old: dict[str, typing.Any],
+    new: dict[str, typing.Any],
+    threshold: float,
+) -> list[dict[str, typing.Any]]:
+    """Compare two benchmark results phase by phase.
+
+    Phases are compared on their minimum time, which is the least noisy statistic.
+
+    Args:
+        old: Baseline results as produced by `run`.
+        new: Results to check against the baseline.
+        threshold: Relative slowdown (e.g. ``0.1`` for 10%) reported as regression.
+
+    Returns:
+        One entry per phase present in both results.
+
+    """
+    if old["parameters"] != new["parameters"]:
+        sys.stderr.write("warning: benchmark parameters differ between runs\n")
+
+    report: list[dict[str, typing.Any]] = []
+    for phase, timings in new["phases"].items():
+        if phase not in old["phases"]:
+            continue
+
+        before: float = old["phases"][phase]["min"]
+        after: float = timings["min"]
+        change = (after - before) / before if before else 0.0
+        report.append(
+            {
+                "phase": phase,
+                "old": before,
+                "new": after,
+                "change": change,
+                "regression": change > threshold,
+            },
+        )
+
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    arguments = list(sys.argv[1:] if argv is None else argv)
+
+    if arguments[:1] == ["compare"]:
+        parser = argparse.ArgumentParser(prog="benchmarks.run compare")
+        parser.add_argument("old", type=Path)
+        parser.add_argument("new", type=Path)
+        parser.add_argument("--threshold", type=float, default=0.1)
+        args = parser.parse_args(arguments[1:])
+
+        report = compare(
+            json.loads(args.old.read_text(encoding="utf-8")),
+            json.loads(args.new.read_text(encoding="utf-8")),
+            args.threshold,
+        )
+        sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+        return 1 if any(entry["regression"] for entry in report) else 0
+
+    defaults = Shape()
+    parser = argparse.ArgumentParser(prog="benchmarks.run")
+    for name, default in defaults._asdict().items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=default)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(arguments)
+
+    shape = Shape(**{name: getattr(args, name) for name in defaults._fields})
+    results = json.dumps(run(shape, args.repeat), indent=2) + "\n"
+
+    if args.output is None:
+        sys.stdout.write(results)
+    else:
+        args.output.write_text(results, encoding="utf-8")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""Stress test for sharing a concurrent `Manager` between threads.
+
+Reader threads continuously read `Manager.current` while a writer thread reloads
+the configuration from disk as fast as it can. Every published configuration is
+internally consistent (its fields are derived from one generation number), so a
+reader that sees a mix of two generations, or a generation going backwards, has
+observed a torn or out of order publish.
+
+Usage::
+
+    python -m benchmarks.stress --readers 16 --seconds 5
+
+Exits with status 1 if any inconsistency or unexpected error was observed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+import typing
+from pathlib import Path
+
+import yaml
+
+from confflow import IntegerField, Integerlist, Manager, Schema, StringField
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from confflow._shared import YamlDict
+
+
+def _schema() -> Schema:
+    return (
+        Schema("stress", description="Stress test configuration")
+        .add(IntegerField("generation", description="Reload counter", ge=0))
+        .add(IntegerField("double", description="Twice the generation", ge=0))
+        .add(StringField("label", description="Generation as text", min_length=1))
+        .add(Integerlist("history", description="Previous generations", item_ge=0))
+        .add(
+            Schema("nested", description="Nested section").add(
+                IntegerField("generation", description="Reload counter", ge=0),
+            ),
+        )
+    )
+
+
+def _data(generation: int, history: int) -> YamlDict:
+    return {
+        "stress": {
+            "generation": generation,
+            "double": 2 * generation,
+            "label": f"generation-{generation}",
+            "history": list(range(max(0, generation - history), generation)),
+            "nested": {"generation": generation},
+        },
+    }
+
+
+def _consistent(config: typing.Any, generation: int) -> bool:  # noqa: ANN401
+    section = config.stress
+
+    return (
+        section.double == 2 * generation
+        and section.label == f"generation-{generation}"
+        and section.nested.generation == generation
+        and (not section.history or section.history[-1] == generation - 1)
+    )
+
+
+def _read(
+    manager: Manager,
+    stop: threading.Event,
+    errors: list[str],
+    reads: list[int],
+) -> None:
+    """Read `Manager.current` until stopped, recording problems in `errors`."""
+    count = 0
+    last = -1
+    try:
+        while not stop.is_set():
+            # Config attributes are generated from the schema, unknown to mypy
+            config: typing.Any = manager.current
+            generation: int = config.stress.generation
+            if generation < last:
+                errors.append(f"generation went back from {last} to {generation}")
+            if not _consistent(config, generation):
+                errors.append(f"inconsistent configuration {config.to_dict()!r}")
+            last = generation
+            count += 1
+            time.sleep(0)  # Yield the GIL, so the writer keeps reloading
+    except Exception as error:  # noqa: BLE001
+        errors.append(f"reader failed: {error!r}")
+
+    reads.append(count)
+
+
+def run(readers: int, seconds: float, history: int) -> dict[str, typing.Any]:
+    """Run the stress test.
+
+    Args:
+        readers: Number of reader threads.
+        seconds: How long the writer keeps reloading.
+        history: Length of the list field, to make every reload do some work.
+
+    Returns:
+        Counters of reads, reloads and observed problems.
+
+    """
+    schema = _schema()
+    manager = Manager(schema, concurrent=True)
+    stop = threading.Event()
+    # `list.append` is atomic, so the threads can share these
+    errors: list[str] = []
+    reads: list[int] = []
+
+    # Schemas of a concurrent manager must reject modification
+    try:
+        schema.add(IntegerField("late", description="Added too late"))
+    except ValueError:
+        pass
+    else:
+        errors.append("schema was modified after construction")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "stress.yml"
+        path.write_text(yaml.safe_dump(_data(0, history)), encoding="utf-8")
+        manager.reload(path)
+
+        threads = [
+            threading.Thread(target=_read, args=(manager, stop, errors, reads))
+            for _ in range(readers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        generation = 0
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            generation += 1
+            path.write_text(
+                yaml.safe_dump(_data(generation, history)),
+                encoding="utf-8",
+            )
+            manager.reload(path)
+
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    return {
+        "readers": readers,
+        "seconds": seconds,
+        "reloads": generation,
+        "reads": sum(reads),
+        "reads_per_second": sum(reads) / seconds,
+        "errors": errors[:20],
+        "error_count": len(errors),
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks.stress")
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--history", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    results = run(args.readers, args.seconds, args.history)
+    sys.stdout.write(json.dumps(results, indent=2) + "\n")
+
+    return 1 if results["error_count"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
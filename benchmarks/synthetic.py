@@ -0,0 +1,131 @@
+"""Synthetic schemas and configurations for the benchmark suite.
+
+The generated schemas are built from the real `Schema` and field classes, so the
+benchmarks exercise the same validation and template code paths as user code.
+"""
+
+from __future__ import annotations
+
+import typing
+from datetime import datetime, timezone
+
+from confflow import (
+    BooleanField,
+    DateField,
+    FloatField,
+    IntegerField,
+    Integerlist,
+    Schema,
+    StringField,
+    Stringlist,
+)
+
+if typing.TYPE_CHECKING:
+    from confflow._shared import YamlDict, YamlValue
+
+
+class Shape(typing.NamedTuple):
+    """Size parameters of a synthetic configuration.
+
+    Attributes:
+        schemas: Number of top-level schemas.
+        width: Number of fields per schema level.
+        depth: Number of nested schema levels below each top-level schema.
+        branching: Number of nested schemas per level.
+        list_size: Number of items in every list field.
+
+    """
+
+    schemas: int = 4
+    width: int = 10
+    depth: int = 2
+    branching: int = 2
+    list_size: int = 20
+
+
+_TIMESTAMP = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _field(index: int, list_size: int) -> tuple[typing.Any, YamlValue]:  # noqa: PLR0911
+    """Return a field and a valid value for it, cycling through field types."""
+    name = f"field_{index}"
+    kind = index % 8
+
+    if kind == 0:
+        return (
+            StringField(name, description=name, min_length=1, max_length=64),
+            f"value-{index}",
+        )
+    if kind == 1:
+        return (
+            StringField(name, description=name, regex=r"^[a-z]+-\d+$"),
+            f"value-{index}",
+        )
+    if kind == 2:  # noqa: PLR2004
+        return IntegerField(name, description=name, ge=0, le=1_000_000), index
+    if kind == 3:  # noqa: PLR2004
+        return FloatField(name, description=name, gt=0.0, lt=1e9), index + 0.5
+    if kind == 4:  # noqa: PLR2004
+        return BooleanField(name, description=name), index % 2 == 0
+    if kind == 5:  # noqa: PLR2004
+        return (
+            Stringlist(
+                name,
+                description=name,
+                max_length=list_size,
+                item_enum=["alpha", "beta", "gamma"],
+            ),
+            [["alpha", "beta", "gamma"][item % 3] for item in range(list_size)],
+        )
+    if kind == 6:  # noqa: PLR2004
+        return (
+            Integerlist(
+                name,
+                description=name,
+                max_length=list_size,
+                item_ge=0,
+                item_lt=list_size,
+            ),
+            list(range(list_size)),
+        )
+
+    return DateField(name, description=name), _TIMESTAMP
+
+
+def _build(name: str, shape: Shape, depth: int) -> tuple[Schema, YamlDict]:
+    schema = Schema(name, description=f"Synthetic schema {name}")
+    data: YamlDict = {}
+
+    for index in range(shape.width):
+        field, value = _field(index, shape.list_size)
+        schema.add(field)
+        data[field.name] = value
+
+    if depth > 0:
+        for branch in range(shape.branching):
+            nested, nested_data = _build(f"{name}_{branch}", shape, depth - 1)
+            schema.add(nested)
+            data[nested.name] = nested_data
+
+    return schema, data
+
+
+def build(shape: Shape) -> tuple[list[Schema], YamlDict]:
+    """Build synthetic schemas together with a configuration that satisfies them.
+
+    Args:
+        shape: Size parameters of the generated configuration.
+
+    Returns:
+        The top-level schemas and the matching configuration data.
+
+    """
+    schemas: list[Schema] = []
+    data: YamlDict = {}
+
+    for index in range(shape.schemas):
+        schema, schema_data = _build(f"section_{index}", shape, shape.depth)
+        schemas.append(schema)
+        data[schema.name] = schema_data
+
+    return schemas, data
@@ -1,22 +1,38 @@
-from ._schema import (
-    AnyOf,
-    BooleanField,
-    Booleanlist,
-    BytesField,
-    Byteslist,
-    DateField,
-    Datelist,
-    FloatField,
-    Floatlist,
-    Group,
-    IntegerField,
-    Integerlist,
-    OneOf,
-    Schema,
-    StringField,
-    Stringlist,
-)
-from .manager import Manager
+"""Schema-based validation and loading of YAML configuration files.
+
+Public names are imported on first access, so ``import confflow`` stays cheap for
+short-lived processes and only the submodules a program uses are loaded.
+"""
+
+from __future__ import annotations
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from ._diff import Change
+    from ._instrumentation import InMemoryAggregator, Instrumentation, LoggingReporter
+    from ._schema import (
+        AnyOf,
+        BooleanField,
+        Booleanlist,
+        BytesField,
+        Byteslist,
+        DateField,
+        Datelist,
+        FloatField,
+        Floatlist,
+        Group,
+        IntegerField,
+        Integerlist,
+        MapField,
+        OneOf,
+        Schema,
+        SchemaList,
+        StringField,
+        Stringlist,
+    )
+    from .manager import Manager
 
 __all__ = [
     "AnyOf",
@@ -24,16 +40,67 @@ __all__ = [
     "Booleanlist",
     "BytesField",
     "Byteslist",
+    "Change",
     "DateField",
     "Datelist",
     "FloatField",
     "Floatlist",
     "Group",
+    "InMemoryAggregator",
+    "Instrumentation",
     "IntegerField",
     "Integerlist",
+    "LoggingReporter",
     "Manager",
+    "MapField",
     "OneOf",
     "Schema",
+    "SchemaList",
     "StringField",
     "Stringlist",
 ]
+
+# Submodule that defines each public name, relative to this package
+_EXPORTS: dict[str, str] = {
+    "AnyOf": "._schema",
+    "BooleanField": "._schema",
+    "Booleanlist": "._schema",
+    "BytesField": "._schema",
+    "Byteslist": "._schema",
+    "Change": "._diff",
+    "DateField": "._schema",
+    "Datelist": "._schema",
+    "FloatField": "._schema",
+    "Floatlist": "._schema",
+    "Group": "._schema",
+    "InMemoryAggregator": "._instrumentation",
+    "Instrumentation": "._instrumentation",
+    "IntegerField": "._schema",
+    "Integerlist": "._schema",
+    "LoggingReporter": "._instrumentation",
+    "Manager": ".manager",
+    "MapField": "._schema",
+    "OneOf": "._schema",
+    "Schema": "._schema",
+    "SchemaList": "._schema",
+    "StringField": "._schema",
+    "Stringlist": "._schema",
+}
+
+
+def __getattr__(name: str) -> typing.Any:  # noqa: ANN401
+    """Import a public name from its submodule on first access (PEP 562)."""
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None  # noqa: EM102, TRY003
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Later lookups find the name directly and no longer call this function
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
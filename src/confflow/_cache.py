@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+import typing
+from collections import OrderedDict
+
+from ._shared import digest
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from confflow._schema import Schema
+    from confflow._shared import YamlDict
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def content_hash(data: YamlDict) -> str:
+    """Return a hash of the section data.
+
+    Based on `repr`, which tells apart values that compare equal but validate
+    differently (e.g. ``1``, ``1.0`` and ``True``). Data with the same content but
+    a different key order hashes differently, which only costs a cache miss.
+    """
+    return digest(repr(data))
+
+
+@typing.final
+class ValidationCache:
+    """Bounded LRU cache of section data already known to be valid.
+
+    Entries are keyed on the schema fingerprint and the content hash of the data,
+    so a cache hit means the exact same data already passed the exact same schema
+    and `Schema.validate` can be skipped. Failed validations are never cached.
+
+    The cache can be shared between threads. Only the bookkeeping is done under a
+    lock, validations run concurrently.
+
+    Args:
+        maxsize: Maximum number of entries kept. The least recently used entry is
+            evicted when the cache is full.
+
+    Raises:
+        ValueError: If `maxsize` is not positive.
+
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("`maxsize` must be positive")  # noqa: EM101, TRY003
+
+        self._maxsize: int = maxsize
+        self._entries: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def validate(
+        self,
+        schema: Schema,
+        data: YamlDict,
+        validate: Callable[[YamlDict], None] | None = None,
+        /,
+    ) -> bool:
+        """Validate data against a schema unless it is already known to be valid.
+
+        Args:
+            schema: The schema to validate against.
+            data: The section data to validate.
+            validate: Runs instead of `Schema.validate` on a miss, if given.
+
+        Returns:
+            True if `Schema.validate` ran, False on a cache hit.
+
+        """
+        key = (schema.fingerprint, content_hash(data))
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return False
+
+            self._misses += 1
+
+        (schema.validate if validate is None else validate)(data)
+
+        with self._lock:
+            self._entries[key] = None
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+        return True
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._maxsize,
+                len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
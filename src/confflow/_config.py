@@ -1,64 +1,568 @@
-from dataclasses import make_dataclass
-from typing import Any, Protocol, TypeVar, cast
+from __future__ import annotations
 
-from ._shared import YamlValue
+import weakref
+from array import array
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import FrozenInstanceError, fields, is_dataclass, make_dataclass
+from datetime import date
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    NamedTuple,
+    Protocol,
+    TypeAlias,
+    TypeVar,
+    cast,
+)
+
+if TYPE_CHECKING:
+    from ._shared import YamlDict, YamlValue
 
 
 class Config(Protocol):
     def __getitem__(self, key: str) -> YamlValue: ...
     def __setitem__(self, key: str, value: YamlValue) -> None: ...
+    def to_dict(self) -> YamlDict: ...
+    def to_yaml(self) -> str: ...
+    def to_json(self) -> str: ...
 
 
 T = TypeVar("T", bound=Config)
 
+ConfigMode: TypeAlias = Literal["eager", "lazy", "view"]
+
+
+class ConfigLayout(NamedTuple):
+    """Layout of the Config classes of one schema, see `dict_to_dataclass`.
+
+    Attributes:
+        kinds: ``(kind, layout)`` of every field in schema order. The kind is
+            ``"nested"`` for nested schemas, ``"items"`` for `SchemaList`,
+            ``"mapping"`` for `MapField` and ``"field"`` otherwise, the layout is
+            the one of the nested, item or value schema, if any.
+        classes: Classes generated for the schema, by name, frozenness and the
+            fields set.
+
+    """
+
+    kinds: dict[str, tuple[str, ConfigLayout | None]]
+    classes: dict[tuple[str, bool, tuple[str, ...]], type[Any]]
+
+
+# All generated classes by name, frozenness and fields with their kinds, so that
+# unpickled Config objects get the class of the originals while it is in use. Held
+# weakly: layouts keep their classes alive, the others live as long as instances.
+_classes: weakref.WeakValueDictionary[
+    tuple[str, bool, tuple[tuple[str, str], ...]],
+    type[Any],
+] = weakref.WeakValueDictionary()
+# Classes kept per layout, far more than the combinations of optional fields in use
+_MAX_LAYOUT_CLASSES: int = 64
+
+
+def _plain(value: Any) -> Any:  # noqa: ANN401
+    """Return a plain (dict/list) copy of configuration data."""
+    if isinstance(value, Mapping):
+        return {key: _plain(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+
+    if isinstance(value, memoryview):  # A compact numeric list
+        return value.tolist()
+
+    return value
+
+
+def _plain_config(value: Any) -> Any:  # noqa: ANN401
+    """Return plain data of a Config object or value."""
+    return _plain(value.to_dict() if hasattr(value, "to_dict") else value)
+
+
+class _MapData(dict[str, Any]):
+    """Pickled form of a `MapField` mapping, restored as a `MappingProxyType`."""
+
+
+def _picklable(value: Any) -> Any:  # noqa: ANN401
+    """Return plain data of a Config object, marking `MapField` mappings."""
+    if isinstance(value, MappingProxyType):
+        return _MapData({key: _picklable(item) for key, item in value.items()})
+
+    if isinstance(value, Mapping):
+        return {key: _picklable(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [_picklable(item) for item in value]
+
+    if isinstance(value, memoryview):
+        return value.obj  # The `array.array`, memoryviews can't be pickled
+
+    if is_dataclass(value):
+        return {
+            field.name: _picklable(getattr(value, field.name))
+            for field in fields(value)
+        }
+
+    return value
+
+
+def _restore(value: Any) -> Any:  # noqa: ANN401
+    """Undo `_picklable`, turning marked mappings back into read-only ones."""
+    if isinstance(value, _MapData):
+        return MappingProxyType({key: _restore(item) for key, item in value.items()})
+
+    if isinstance(value, dict):
+        return {key: _restore(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [_restore(item) for item in value]
+
+    if isinstance(value, array):
+        return memoryview(value).toreadonly()
+
+    return value
+
+
+def _json_default(value: object) -> str:
+    if isinstance(value, date):  # Also covers datetime
+        return value.isoformat()
+
+    if isinstance(value, bytes):
+        import base64  # noqa: PLC0415
+
+        return base64.b64encode(value).decode("ascii")
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")  # noqa: EM102, TRY003
+
+
+def to_yaml(data: YamlDict) -> str:
+    """Serialize plain configuration data to YAML.
+
+    `datetime` values are written as timestamps and `bytes` as ``!!binary``, so
+    `yaml.safe_load` reads back the very same values.
+    """
+    import yaml  # noqa: PLC0415
+
+    return yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
+
+
+def to_json(data: YamlDict) -> str:
+    """Serialize plain configuration data to JSON.
+
+    JSON has no native types for them, so `datetime` values are written as
+    ISO 8601 strings and `bytes` as base64 strings.
+    """
+    import json  # noqa: PLC0415
+
+    return json.dumps(data, default=_json_default)
+
+
+def _generate_to_dict(kinds: dict[str, str]) -> Callable[[Any], YamlDict]:
+    """Generate a `to_dict` method specialized for one Config class shape."""
+    expressions: dict[str, str] = {
+        "value": "self.{0}",
+        "list": "list(self.{0})",
+        "nested": "self.{0}.to_dict()",
+        "items": "[item.to_dict() for item in self.{0}]",
+        "buffer": "self.{0}.tolist()",
+        "mapping": "{{key: _plain_config(value) for key, value in self.{0}.items()}}",
+    }
+    body: str = ", ".join(
+        f"{name!r}: " + expressions[kind].format(name) for name, kind in kinds.items()
+    )
+    namespace: dict[str, Any] = {"_plain_config": _plain_config}
+    exec(f"def to_dict(self):\n    return {{{body}}}\n", namespace)  # noqa: S102
+
+    return cast("Callable[[Any], YamlDict]", namespace["to_dict"])
+
+
+def _rebuild(name: str, data: dict[str, Any], frozen: bool) -> Config:  # noqa: FBT001
+    """Reconstruct a pickled Config from its name and plain data.
+
+    The generated classes can't be pickled by reference, so pickling stores the
+    plain data and this function rebuilds the class through the shape registry.
+    """
+    return dict_to_dataclass(name, _restore(data), frozen=frozen)
+
+
+def _rewrap(cls: type[T], name: str, data: dict[str, Any]) -> T:
+    """Reconstruct a pickled `LazyConfig` or `ConfigView`."""
+    return cls(name, _restore(data))  # type: ignore[call-arg]
+
+
+def _nested_dataclass(
+    name: str,
+    data: dict[str, Any],
+    *,
+    frozen: bool,
+    memo: dict[tuple[int, str], tuple[Any, Config]] | None,
+    layout: ConfigLayout | None,
+) -> Config:
+    """Convert a nested dictionary, reusing the memoized instance if any."""
+    key = (id(data), name)
+    # The memo keeps `data` alive, so its id can't be reused by another dict
+    if memo is not None and key in memo and memo[key][0] is data:
+        return memo[key][1]
+
+    config = dict_to_dataclass(name, data, frozen=frozen, memo=memo, layout=layout)
+    if memo is not None:
+        memo[key] = (data, config)
+
+    return config
+
+
+def _mapping_to_dataclasses(
+    name: str,
+    mapping: Mapping[str, Any],
+    *,
+    frozen: bool,
+    memo: dict[tuple[int, str], tuple[Any, Config]] | None,
+    layout: ConfigLayout | None,
+) -> MappingProxyType[str, Any]:
+    """Convert the sections in the values of a `MapField` mapping."""
+    return MappingProxyType(
+        {
+            key: dict_to_dataclass(
+                name,
+                value,
+                frozen=frozen,
+                memo=memo,
+                layout=layout,
+            )
+            if isinstance(value, dict)
+            else value
+            for key, value in mapping.items()
+        },
+    )
+
 
 def dict_to_dataclass(
     name: str,
     data: dict[str, Any],
     *,
     frozen: bool = False,
+    memo: dict[tuple[int, str], tuple[Any, Config]] | None = None,
+    layout: ConfigLayout | None = None,
 ) -> Config:
-    fields: list[tuple[str, type[Any], Any]] = []
+    """Convert a nested dictionary into instances of generated dataclasses.
+
+    With the `layout` of the schema the data passed, classes are generated from the
+    schema: fields are in schema order and data setting the same fields shares one
+    class, whatever the types of the values or the order of the keys, e.g. all items
+    of a `SchemaList`. The classes are kept in the layout and freed with the schema.
+    Without a layout, the fields are taken from the data.
+
+    With a `memo`, nested dictionaries that are the same object are converted only
+    once and share the resulting instance, e.g. sections common to several
+    configurations derived from the same base. Reuse `memo` across calls for that.
+    """
     processed_data: dict[str, Any] = {}
+    kinds: dict[str, str] = {}
+    keys = data if layout is None else [key for key in layout.kinds if key in data]
 
-    for k, v in data.items():
+    for k in keys:
+        v = data[k]
+        kind, child = ("field", None) if layout is None else layout.kinds[k]
         if isinstance(v, dict):
-            nested_class = dict_to_dataclass(
+            processed_data[k] = _nested_dataclass(
                 f"{name}_{k.capitalize()}",
-                v,  # type: ignore  # noqa: PGH003
+                v,
                 frozen=frozen,
+                memo=memo,
+                layout=child,
             )
-            fields.append((k, type(nested_class), nested_class))
-            processed_data[k] = nested_class
-        elif isinstance(v, list) and v and isinstance(v[0], dict):
-            nested_items = [
+            kinds[k] = "nested"
+        elif isinstance(v, MappingProxyType):
+            processed_data[k] = _mapping_to_dataclasses(
+                f"{name}_{k.capitalize()}Value",
+                v,
+                frozen=frozen,
+                memo=memo,
+                layout=child,
+            )
+            kinds[k] = "mapping"
+        elif kind == "items" or (isinstance(v, list) and v and isinstance(v[0], dict)):
+            processed_data[k] = [
                 dict_to_dataclass(
                     f"{name}_{k.capitalize()}Item",
-                    item,  # type: ignore  # noqa: PGH003
+                    item,
                     frozen=frozen,
+                    layout=child,
                 )
-                for item in v  # type: ignore  # noqa: PGH003
+                for item in v
             ]
-            fields.append((k, list[Any], nested_items))
-            processed_data[k] = nested_items
+            kinds[k] = "items"
         else:
-            fields.append((k, type(v), v))  # type: ignore  # noqa: PGH003
             processed_data[k] = v
+            kinds[k] = (
+                "list"
+                if isinstance(v, list)
+                else "buffer"
+                if isinstance(v, memoryview)
+                else "value"
+            )
+
+    shape = (name, frozen, tuple(kinds))
+    if layout is None or (cls := layout.classes.get(shape)) is None:
+        cls = _generated_class(name, kinds, frozen=frozen)
+        if layout is not None:
+            # Dropping all classes when full needs no lock, unlike evicting one
+            if len(layout.classes) >= _MAX_LAYOUT_CLASSES:
+                layout.classes.clear()
+            layout.classes[shape] = cls
+
+    return cast("Config", cls(**processed_data))
+
+
+def _generated_class(name: str, kinds: dict[str, str], *, frozen: bool) -> type[Any]:
+    """Return the Config class of a shape, generating it if it isn't in use."""
+    shape = (name, frozen, tuple(kinds.items()))
+    if (cls := _classes.get(shape)) is None:
+
+        def __getitem__(self: str, key: str) -> YamlValue | Config:  # noqa: N807
+            return getattr(self, key)
+
+        def __setitem__(self: str, key: str, value: YamlValue) -> None:  # noqa: N807
+            setattr(self, key, value)
+
+        def __reduce__(  # noqa: N807
+            self: Config,
+        ) -> tuple[Callable[..., Config], tuple[str, YamlDict, bool]]:
+            return _rebuild, (name, _picklable(self), frozen)
+
+        cls = make_dataclass(
+            name,
+            [(field_name, Any) for field_name in kinds],
+            frozen=frozen,
+            namespace={
+                "__getitem__": __getitem__,
+                "__setitem__": __setitem__,
+                "__reduce__": __reduce__,
+                "to_dict": _generate_to_dict(kinds),
+                "to_yaml": lambda self: to_yaml(self.to_dict()),
+                "to_json": lambda self: to_json(self.to_dict()),
+            },
+        )
+        _classes[shape] = cls
+
+    return cls
+
+
+class LazyConfig:
+    """Read-only configuration that materializes nested sections on first access.
+
+    Wraps an already validated dictionary without copying it. Nested dictionaries
+    (and lists of dictionaries) are turned into `LazyConfig` objects only when the
+    attribute is first read, and the result is cached on the instance so later reads
+    are plain attribute lookups.
+
+    Args:
+        name: Name used in the representation, mirroring the class names generated
+            by `dict_to_dataclass` (e.g. ``Config_Deployment``).
+        data: The validated configuration data. It is wrapped, not copied, and
+            must not be mutated afterwards.
+
+    """
 
-    def __getitem__(self: str, key: str) -> YamlValue | Config:  # noqa: N807
+    def __init__(self, name: str, data: dict[str, Any]) -> None:
+        object.__setattr__(self, "_LazyConfig__name", name)
+        object.__setattr__(self, "_LazyConfig__data", data)
+
+    def __getattr__(self, key: str) -> Any:  # noqa: ANN401
+        # Only reached when `key` has not been materialized yet
+        if key.startswith("__") and key.endswith("__"):
+            raise AttributeError(key)
+
+        try:
+            value = self.__data[key]
+        except KeyError:
+            raise AttributeError(  # noqa: TRY003
+                f"{self.__name!r} has no attribute {key!r}",  # noqa: EM102
+            ) from None
+
+        if isinstance(value, dict):
+            value = LazyConfig(f"{self.__name}_{key.capitalize()}", value)
+        elif isinstance(value, MappingProxyType):
+            value = MappingProxyType(
+                {
+                    item_key: LazyConfig(f"{self.__name}_{key.capitalize()}Value", item)
+                    if isinstance(item, dict)
+                    else item
+                    for item_key, item in value.items()
+                },
+            )
+        elif isinstance(value, list) and value and isinstance(value[0], dict):
+            value = [
+                LazyConfig(f"{self.__name}_{key.capitalize()}Item", item)
+                for item in value
+            ]
+        else:
+            return value
+
+        object.__setattr__(self, key, value)
+
+        return value
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401
         return getattr(self, key)
 
-    def __setitem__(self: str, key: str, value: YamlValue) -> None:  # noqa: N807
-        setattr(self, key, value)
+    def __setitem__(self, key: str, value: YamlValue) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {key!r}")  # noqa: EM102, TRY003
 
-    field_definitions: list[tuple[str, type[Any]]] = [
-        (field_name, field_type) for field_name, field_type, _ in fields
-    ]
+    def __setattr__(self, key: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {key!r}")  # noqa: EM102, TRY003
 
-    cls = make_dataclass(
-        name,
-        field_definitions,
-        frozen=frozen,
-        namespace={"__getitem__": __getitem__, "__setitem__": __setitem__},
-    )
-    return cast("Config", cls(**processed_data))
+    def __delattr__(self, key: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {key!r}")  # noqa: EM102, TRY003
+
+    def to_dict(self) -> YamlDict:
+        return cast("YamlDict", _plain(self.__data))
+
+    def to_yaml(self) -> str:
+        return to_yaml(self.to_dict())
+
+    def to_json(self) -> str:
+        return to_json(self.to_dict())
+
+    def __reduce__(
+        self,
+    ) -> tuple[Callable[..., LazyConfig], tuple[type[LazyConfig], str, YamlDict]]:
+        return _rewrap, (LazyConfig, self.__name, _picklable(self.__data))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LazyConfig):
+            return NotImplemented
+
+        return bool(self.__data == other.__data)
+
+    __hash__ = None  # type: ignore  # noqa: PGH003
+
+    def __dir__(self) -> list[str]:
+        return [*super().__dir__(), *self.__data]
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__name}("
+            + ", ".join(f"{key}={getattr(self, key)!r}" for key in self.__data)
+            + ")"
+        )
+
+
+class ConfigView(Mapping[str, Any]):
+    """Read-only, zero-copy view over validated configuration data.
+
+    Exposes the same attribute and subscription access as the other Config objects
+    directly on top of a `types.MappingProxyType` of the data, and is itself a
+    `Mapping`, so dict-like access needs no `dataclasses.asdict` round trip.
+    Nested dictionaries are returned as `ConfigView` objects and lists as tuples;
+    both are created once on first access and reused afterwards.
+
+    Attribute access resolves fields before methods, so a field named e.g. ``keys``
+    or ``items`` returns its value rather than the `Mapping` method. The methods of
+    such a view are still available as ``Mapping.keys(view)``.
+
+    Args:
+        name: Name used in the representation (e.g. ``Config_Deployment``).
+        data: The validated configuration data. It is wrapped, not copied, and
+            must not be mutated afterwards.
+
+    """
+
+    def __init__(self, name: str, data: dict[str, Any]) -> None:
+        object.__setattr__(self, "_ConfigView__name", name)
+        object.__setattr__(self, "_ConfigView__mapping", MappingProxyType(data))
+        object.__setattr__(self, "_ConfigView__cache", {})
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401
+        # Internal attributes are read around `__getattribute__`, which is slower
+        cache = _attribute(self, "_ConfigView__cache")
+        if key in cache:
+            return cache[key]
+
+        value = _attribute(self, "_ConfigView__mapping")[key]
+
+        if isinstance(value, dict):
+            value = ConfigView(f"{self.__name}_{key.capitalize()}", value)
+        elif isinstance(value, MappingProxyType):
+            value = MappingProxyType(
+                {
+                    item_key: ConfigView(f"{self.__name}_{key.capitalize()}Value", item)
+                    if isinstance(item, dict)
+                    else item
+                    for item_key, item in value.items()
+                },
+            )
+        elif isinstance(value, list):
+            value = tuple(
+                ConfigView(f"{self.__name}_{key.capitalize()}Item", item)
+                if isinstance(item, dict)
+                else item
+                for item in value
+            )
+        else:
+            return value
+
+        cache[key] = value
+
+        return value
+
+    def __getattribute__(self, key: str) -> Any:  # noqa: ANN401
+        # Fields first, methods of the class and of `Mapping` must not hide them
+        if key in _attribute(self, "_ConfigView__mapping") and not (
+            key.startswith("__") and key.endswith("__")
+        ):
+            return _view_item(self, key)
+
+        return _attribute(self, key)
+
+    def __getattr__(self, key: str) -> Any:  # noqa: ANN401
+        # Only reached for names that are neither fields nor attributes
+        if key.startswith("__") and key.endswith("__"):
+            raise AttributeError(key)
+
+        raise AttributeError(f"{self.__name!r} has no attribute {key!r}")  # noqa: EM102, TRY003
+
+    def __setitem__(self, key: str, value: YamlValue) -> None:
+        raise TypeError(f"{self.__name!r} does not support item assignment")  # noqa: EM102, TRY003
+
+    def __setattr__(self, key: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {key!r}")  # noqa: EM102, TRY003
+
+    def __delattr__(self, key: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {key!r}")  # noqa: EM102, TRY003
+
+    def to_dict(self) -> YamlDict:
+        return cast("YamlDict", _plain(self.__mapping))
+
+    def to_yaml(self) -> str:
+        return to_yaml(self.to_dict())
+
+    def to_json(self) -> str:
+        return to_json(self.to_dict())
+
+    def __reduce__(
+        self,
+    ) -> tuple[Callable[..., ConfigView], tuple[type[ConfigView], str, YamlDict]]:
+        return _rewrap, (ConfigView, self.__name, _picklable(self.__mapping))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__mapping)
+
+    def __len__(self) -> int:
+        return len(self.__mapping)
+
+    def __dir__(self) -> list[str]:
+        return [*super().__dir__(), *self.__mapping]
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__name}("
+            + ", ".join(f"{key}={self[key]!r}" for key in self.__mapping)
+            + ")"
+        )
+
+
+_attribute: Callable[[object, str], Any] = object.__getattribute__
+_view_item: Callable[[ConfigView, str], Any] = ConfigView.__getitem__
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import typing
+from collections.abc import Mapping
+
+from ._config import _plain_config
+
+if typing.TYPE_CHECKING:
+    from confflow._config import Config
+    from confflow._schema import Schema
+    from confflow._schema.fields.field import Field
+
+_MISSING: typing.Any = object()
+
+
+class Change(typing.NamedTuple):
+    """A single difference between two configurations.
+
+    Attributes:
+        path: Dotted path of the changed field or section.
+        old: Previous value, ``None`` if the path was absent. Sections are given as
+            plain dicts.
+        new: New value, ``None`` if the path was removed.
+
+    """
+
+    path: str
+    old: typing.Any
+    new: typing.Any
+
+
+def _child(config: typing.Any, key: str) -> typing.Any:  # noqa: ANN401
+    try:
+        return config[key]
+    except (KeyError, AttributeError):
+        return _MISSING
+
+
+def _section(config: typing.Any) -> typing.Any:  # noqa: ANN401
+    return None if config is _MISSING else config.to_dict()
+
+
+def _value(value: typing.Any) -> typing.Any:  # noqa: ANN401
+    if value is _MISSING:
+        return None
+
+    # Lists are tuples in view mode and SchemaList items are Config objects
+    if isinstance(value, (list, tuple)):
+        return [_plain_config(item) for item in value]
+
+    if isinstance(value, memoryview):  # A compact numeric list
+        return value.tolist()
+
+    # `MapField` values are read-only mappings
+    if isinstance(value, Mapping):
+        return {key: _plain_config(item) for key, item in value.items()}
+
+    return value
+
+
+def diff_mapping(
+    mapping: Mapping[str, Schema | Field[typing.Any]],
+    old: Config,
+    new: Config,
+    prefix: str,
+    changes: list[Change],
+) -> None:
+    """Append the changes between two sections to `changes`.
+
+    Args:
+        mapping: Schemas and fields of the section by key.
+        old: The previous section.
+        new: The current section.
+        prefix: Dotted path of the section, empty at the top level.
+        changes: List the changes are appended to.
+
+    """
+    from confflow._schema import Schema  # noqa: PLC0415
+
+    for key, node in mapping.items():
+        old_child = _child(old, key)
+        new_child = _child(new, key)
+
+        # Shared subtrees (e.g. from structural sharing) are identical
+        if old_child is new_child:
+            continue
+
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(node, Schema):
+            if old_child is _MISSING or new_child is _MISSING:
+                changes.append(Change(path, _section(old_child), _section(new_child)))
+            else:
+                diff_mapping(
+                    node._mapping,  # noqa: SLF001
+                    old_child,
+                    new_child,
+                    path,
+                    changes,
+                )
+            continue
+
+        old_value = _value(old_child)
+        new_value = _value(new_child)
+        # `1 == True`, but a changed type is still a change
+        if type(old_value) is not type(new_value) or old_value != new_value:
+            changes.append(Change(path, old_value, new_value))
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import contextlib
+import re
+import typing
+from pathlib import Path
+
+import yaml
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from confflow._schema import Schema
+    from confflow._schema.fields.field import Field
+    from confflow._shared import YamlValue
+
+INCLUDE_TAG: str = "!include"
+
+# A top-level ``key:`` line with a plain or simply quoted key. Keys starting with an
+# indicator (anchors, tags, merge keys, complex keys, ...) are left to the parser.
+_TOP_LEVEL_KEY: re.Pattern[str] = re.compile(
+    r"""(?:"([^"\\]*)"|'([^']*)'|([^\s#'"?:,\[\]{}&*!|>%@`<=~-][^#:]*?))\s*:(?:\s|$)""",
+)
+
+
+class _IncludeLoader(yaml.SafeLoader):
+    includes: Includes
+    path: Path
+
+
+def _construct_include(loader: _IncludeLoader, node: yaml.Node) -> YamlValue:
+    if not isinstance(node, yaml.ScalarNode):
+        raise yaml.constructor.ConstructorError(
+            None,
+            None,
+            f"{INCLUDE_TAG} expects a file path",
+            node.start_mark,
+        )
+
+    return loader.includes.include(loader.path, loader.construct_scalar(node))
+
+
+_IncludeLoader.add_constructor(INCLUDE_TAG, _construct_include)
+
+
+def top_level_keys(content: str) -> set[str] | None:
+    """Find the top-level keys of a YAML document without parsing it.
+
+    Only lines starting in the first column are looked at, so the scan costs a
+    fraction of parsing. It is conservative: anything it can't be sure about, like
+    document markers, anchors, flow mappings or an indented document, makes it
+    give up.
+
+    Args:
+        content: YAML text of a configuration file.
+
+    Returns:
+        The top-level keys, or None if they can only be found by parsing.
+
+    """
+    keys: set[str] = set()
+    for line in content.removeprefix("\ufeff").splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if line[0] in " \t":
+            # Block content, unless the whole document is indented
+            if not keys:
+                return None
+            continue
+
+        match = _TOP_LEVEL_KEY.match(line)
+        if match is None:
+            return None
+        keys.add(next(key for key in match.groups() if key is not None))
+
+    return keys
+
+
+@typing.final
+class Includes:
+    """Parses YAML files, resolving ``!include`` tags, for the duration of one load.
+
+    Included paths are relative to the including file. Every fragment is parsed
+    once and the same object is returned for all references to it. The file each
+    top-level value and fragment came from is remembered for error messages.
+
+    Args:
+        root: If given, only files inside this directory may be included.
+
+    """
+
+    def __init__(self, root: str | Path | None = None) -> None:
+        self._root: Path | None = None if root is None else Path(root).resolve()
+        self._fragments: dict[Path, YamlValue] = {}
+        self._loading: list[Path] = []
+        self._origins: dict[int, Path] = {}
+
+    def load(self, content: str, path: Path) -> YamlValue:
+        """Parse the content of a configuration file.
+
+        Args:
+            content: YAML text of the file.
+            path: Path of the file, used to resolve includes.
+
+        Raises:
+            ValueError: If an include is outside the root directory or includes
+                form a cycle.
+            FileNotFoundError: If an included file doesn't exist.
+            yaml.YAMLError: If a file contains invalid YAML.
+
+        """
+        resolved = path.resolve()
+        self._loading.append(resolved)
+        try:
+            data = self._parse(content, resolved)
+        finally:
+            self._loading.pop()
+
+        if isinstance(data, dict):
+            for value in data.values():
+                self._remember(value, path)
+
+        return data
+
+    @contextlib.contextmanager
+    def stream(self, path: Path) -> Iterator[_IncludeLoader]:
+        """Open a configuration file for event-based parsing, see `StreamValidator`.
+
+        The file is read in chunks as the returned loader asks for events, instead
+        of being read and parsed at once like with `load`. Includes are resolved
+        the same way.
+
+        Args:
+            path: Path of the file.
+
+        """
+        resolved = path.resolve()
+        self._loading.append(resolved)
+        try:
+            with path.open(encoding="utf-8") as file:
+                loader = _IncludeLoader(file)
+                loader.includes = self
+                loader.path = resolved
+                try:
+                    yield loader
+                finally:
+                    loader.dispose()
+        finally:
+            self._loading.pop()
+
+    def include(self, parent: Path, reference: str) -> YamlValue:
+        """Return the parsed content of a file referenced from `parent`."""
+        path = (parent.parent / reference).resolve()
+
+        if self._root is not None and not path.is_relative_to(self._root):
+            raise ValueError(  # noqa: TRY003
+                f"Include {reference!r} in {parent} is outside of {self._root}",  # noqa: EM102
+            )
+
+        if path in self._loading:
+            cycle = " -> ".join(
+                str(item) for item in self._loading[self._loading.index(path) :]
+            )
+            raise ValueError(f"Include cycle: {cycle} -> {path}")  # noqa: EM102, TRY003
+
+        if path not in self._fragments:
+            self._loading.append(path)
+            try:
+                fragment = self._parse(path.read_text(encoding="utf-8"), path)
+            finally:
+                self._loading.pop()
+
+            self._fragments[path] = fragment
+            self._remember(fragment, path)
+            if isinstance(fragment, dict):
+                for value in fragment.values():
+                    self._remember(value, path)
+
+        return self._fragments[path]
+
+    def _parse(self, content: str, path: Path) -> YamlValue:
+        loader = _IncludeLoader(content)
+        loader.includes = self
+        loader.path = path
+        try:
+            return loader.get_single_data()  # type: ignore[no-any-return]
+        finally:
+            loader.dispose()
+
+    def _remember(self, value: YamlValue, path: Path) -> None:
+        # Only containers have a stable identity to look up later
+        if isinstance(value, (dict, list)):
+            self._origins.setdefault(id(value), path)
+
+    @property
+    def included(self) -> bool:
+        """Whether any file was included."""
+        return bool(self._fragments)
+
+    def origin(
+        self,
+        schemas: Mapping[str, Schema],
+        data: Mapping[str, YamlValue],
+    ) -> tuple[str, Path] | None:
+        """Find the first invalid value in data and the file it was defined in.
+
+        Only called after validation failed, so the cost of validating field by
+        field again doesn't matter.
+
+        Returns:
+            The dotted path of the invalid value and the file it came from, or None
+            if the value couldn't be located or wasn't included.
+
+        """
+        path = _invalid_path(schemas, data)
+        if not path:
+            return None
+
+        origin: Path | None = None
+        node: typing.Any = data
+        for key in path:
+            node = node[key]
+            origin = self._origins.get(id(node), origin)
+
+        if origin is None or origin not in self._fragments:
+            return None
+
+        return ".".join(path), origin
+
+
+def _invalid_path(
+    schemas: Mapping[str, Schema | Field[typing.Any]],
+    data: Mapping[str, YamlValue],
+) -> list[str] | None:
+    from confflow._schema import Schema  # noqa: PLC0415
+
+    for key, value in data.items():
+        node = schemas.get(key)
+        if node is None:
+            return [key]
+
+        if isinstance(node, Schema):
+            if not isinstance(value, dict):
+                return [key]
+            try:
+                for group in node._groups:  # noqa: SLF001
+                    group(*value.keys())
+            except Exception:  # noqa: BLE001
+                return [key]
+
+            nested = _invalid_path(node._mapping, value)  # noqa: SLF001
+            if nested is not None:
+                return [key, *nested]
+            continue
+
+        try:
+            node.validate(value)
+        except Exception:  # noqa: BLE001
+            return [key]
+
+    return None
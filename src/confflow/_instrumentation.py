@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import typing
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+
+## Base Instrumentation
+class Instrumentation:
+    """Receives timings and counters from a `Manager`.
+
+    Register instances with `Manager.add_instrumentation`. All hooks are no-ops, so
+    subclasses only override the ones they need. When no instrumentation is
+    registered the Manager skips reporting entirely.
+    """
+
+    def on_phase(self, phase: str, seconds: float) -> None:
+        """Handle the end of a phase.
+
+        Args:
+            phase: One of ``"read"`` (file I/O), ``"parse"`` (YAML parsing),
+                ``"override"`` (applying overrides), ``"interpolate"`` (resolving
+                references), ``"validate"``, ``"stream"`` (parsing and validating
+                a file at once, see `Manager.validate_stream`) or
+                ``"materialize"`` (building the Config object).
+            seconds: Duration of the phase.
+
+        """
+
+    def on_file(self, path: Path, size: int) -> None:
+        """Handle a configuration file that was read.
+
+        Args:
+            path: Path of the file.
+            size: Size of the file in bytes.
+
+        """
+
+    def on_schema(self, name: str, seconds: float, evaluations: int) -> None:
+        """Handle a top-level section that was validated.
+
+        Args:
+            name: Name of the schema.
+            seconds: Time spent validating the section.
+            evaluations: Number of constraint and group evaluations performed,
+                ``0`` if the section was served from the validation cache.
+
+        """
+
+
+## Instrumentations
+@dataclasses.dataclass
+class Timing:
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+
+
+@typing.final
+class InMemoryAggregator(Instrumentation):
+    """Aggregates all reported timings and counters in memory."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, Timing] = {}
+        self.schemas: dict[str, Timing] = {}
+        self.evaluations: dict[str, int] = {}
+        self.files: dict[str, int] = {}
+
+    def on_phase(self, phase: str, seconds: float) -> None:
+        self.phases.setdefault(phase, Timing()).add(seconds)
+
+    def on_file(self, path: Path, size: int) -> None:
+        self.files[str(path)] = self.files.get(str(path), 0) + size
+
+    def on_schema(self, name: str, seconds: float, evaluations: int) -> None:
+        self.schemas.setdefault(name, Timing()).add(seconds)
+        self.evaluations[name] = self.evaluations.get(name, 0) + evaluations
+
+    def summary(self) -> dict[str, typing.Any]:
+        """Return all aggregated values as plain, JSON-serializable data."""
+        return {
+            "phases": {
+                name: dataclasses.asdict(timing) for name, timing in self.phases.items()
+            },
+            "schemas": {
+                name: {
+                    **dataclasses.asdict(timing),
+                    "evaluations": self.evaluations[name],
+                }
+                for name, timing in self.schemas.items()
+            },
+            "files": dict(self.files),
+        }
+
+    def reset(self) -> None:
+        self.phases.clear()
+        self.schemas.clear()
+        self.evaluations.clear()
+        self.files.clear()
+
+
+@typing.final
+class LoggingReporter(Instrumentation):
+    """Reports every event through the `logging` module.
+
+    Args:
+        logger: Logger to report to. Defaults to the ``confflow`` logger.
+        level: Level the events are logged at.
+
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        level: int = logging.DEBUG,
+    ) -> None:
+        self._logger: logging.Logger = logger or logging.getLogger("confflow")
+        self._level: int = level
+
+    def on_phase(self, phase: str, seconds: float) -> None:
+        self._logger.log(self._level, "%s took %.3f ms", phase, seconds * 1e3)
+
+    def on_file(self, path: Path, size: int) -> None:
+        self._logger.log(self._level, "read %s (%d bytes)", path, size)
+
+    def on_schema(self, name: str, seconds: float, evaluations: int) -> None:
+        self._logger.log(
+            self._level,
+            "validated %r in %.3f ms (%d evaluations)",
+            name,
+            seconds * 1e3,
+            evaluations,
+        )
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import re
+import typing
+from datetime import datetime
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from confflow._schema.fields.field import Field
+    from confflow._shared import YamlDict, YamlValue
+
+# ``${a.b}`` is a reference, ``$${a.b}`` a literal ``${a.b}``
+REFERENCE = re.compile(r"\$(\$?)\{([^{}]*)\}")
+
+# A key or a list index (``[0]``) of a path like ``service.upstreams[0].host``
+_STEP = re.compile(r"([^.\[\]]+)|\[(\d+)\]")
+
+_TYPES: dict[str, type | tuple[type, ...]] = {
+    "string": str,
+    "integer": int,
+    "float": (int, float),
+    "floating": (int, float),
+    "date": datetime,
+    "bytes": bytes,
+    "bool": bool,
+    "boolean": bool,
+}
+
+
+def _collect(value: YamlValue, path: str, templates: dict[str, str]) -> None:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _collect(item, f"{path}.{key}" if path else key, templates)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            _collect(item, f"{path}[{index}]", templates)
+    elif isinstance(value, str) and "${" in value:
+        templates[path] = value
+
+
+def _steps(path: str) -> list[str | int]:
+    return [int(index) if index else key for key, index in _STEP.findall(path)]
+
+
+def _references(template: str) -> set[str]:
+    return {
+        match.group(2).strip()
+        for match in REFERENCE.finditer(template)
+        if not match.group(1)
+    }
+
+
+def _lookup(data: YamlDict, reference: str, path: str) -> YamlValue:
+    node: typing.Any = data
+    for step in _steps(reference):
+        if isinstance(step, int):
+            found = isinstance(node, list) and step < len(node)
+        else:
+            found = isinstance(node, dict) and step in node
+        if not found:
+            raise ValueError(f"Unknown reference ${{{reference}}} in {path!r}")  # noqa: EM102, TRY003
+        node = node[step]
+
+    if isinstance(node, dict):
+        raise ValueError(  # noqa: TRY003, TRY004
+            f"Reference ${{{reference}}} in {path!r} is a section, not a field",  # noqa: EM102
+        )
+
+    return node  # type: ignore[no-any-return]
+
+
+def _render(value: YamlValue) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+
+    return str(value)
+
+
+def _field_at(
+    path: str,
+    get_field: Callable[[str], Field[typing.Any]],
+) -> tuple[Field[typing.Any], bool]:
+    """Return the field of the value at `path` and whether the value is a list item.
+
+    Items of `SchemaList` fields are looked up in the item schema.
+
+    Raises:
+        KeyError: If there is no field for the path.
+
+    """
+    from confflow._schema import SchemaList  # noqa: PLC0415
+
+    head, bracket, tail = path.partition("[")
+    if not bracket:
+        return get_field(path), False
+
+    field = get_field(head)
+    rest = tail.partition("]")[2]
+    if not rest:
+        return field, True
+    if not isinstance(field, SchemaList) or not rest.startswith("."):
+        raise KeyError(path)
+
+    return _field_at(rest[1:], field.schema.get_field)
+
+
+def _check(
+    path: str,
+    value: YamlValue,
+    get_field: Callable[[str], Field[typing.Any]],
+) -> YamlValue:
+    """Convert an interpolated value to the type of the field at `path`."""
+    try:
+        field, item = _field_at(path, get_field)
+    except KeyError:
+        return value  # Unknown keys are reported by the validation
+
+    dtype: str = field._dtype  # noqa: SLF001
+    if item:
+        dtype = dtype.removeprefix("list[").removesuffix("]")
+    if isinstance(value, str) and dtype != "string":
+        try:
+            parsed = field.parse(value)
+            if item:
+                if len(parsed) != 1:
+                    raise ValueError(f"expected one item, got {len(parsed)}")  # noqa: EM102, TRY003, TRY301
+                parsed = parsed[0]
+        except ValueError as error:
+            raise ValueError(  # noqa: TRY003
+                f"Invalid interpolated value for {path!r}: {error}",  # noqa: EM102
+            ) from error
+        value = parsed
+
+    expected = list if dtype.startswith("list") else _TYPES.get(dtype, object)
+    if not isinstance(value, expected) or (
+        isinstance(value, bool) and dtype in {"integer", "float", "floating"}
+    ):
+        raise ValueError(  # noqa: TRY003
+            f"Interpolated value for {path!r} is of type {type(value).__name__}, "  # noqa: EM102
+            f"expected {dtype}",
+        )
+
+    return value
+
+
+def _replace(
+    node: typing.Any,  # noqa: ANN401
+    assignments: list[tuple[list[str | int], YamlValue]],
+) -> typing.Any:  # noqa: ANN401
+    """Return a copy of node with the values assigned at the given steps.
+
+    Only the dicts and lists along the assigned paths are copied.
+    """
+    nested: dict[str | int, list[tuple[list[str | int], YamlValue]]] = {}
+    for steps, value in assignments:
+        nested.setdefault(steps[0], []).append((steps[1:], value))
+
+    copy: typing.Any = list(node) if isinstance(node, list) else dict(node)
+    for step, below in nested.items():
+        copy[step] = below[0][1] if not below[0][0] else _replace(node[step], below)
+
+    return copy
+
+
+def resolve_references(
+    data: YamlDict,
+    get_field: Callable[[str], Field[typing.Any]],
+) -> YamlDict:
+    """Return a copy of data with all ``${a.b}`` references resolved.
+
+    References are absolute dotted paths and may point to values that contain
+    references themselves. The dependency graph of all references is ordered
+    topologically, so every value is resolved exactly once. A string consisting of
+    a single reference takes the value of the referenced field, otherwise the
+    references are formatted into the string. Results are then converted to, and
+    checked against, the type of the target field.
+
+    List items are walked as well and addressed by index, e.g.
+    ``service.upstreams[0].host``; references may point to them the same way. An
+    item of a scalar list field is converted to the item type.
+
+    Args:
+        data: The configuration data. It is not modified.
+        get_field: Returns the field at a dotted path.
+
+    Returns:
+        The data with references resolved, sharing all unchanged sections.
+
+    Raises:
+        ValueError: If a reference is unknown, points to a section, references form
+            a cycle, or a result doesn't fit the target field.
+
+    """
+    templates: dict[str, str] = {}
+    _collect(data, "", templates)
+    if not templates:
+        return data
+
+    import graphlib  # noqa: PLC0415
+
+    graph = {path: _references(template) for path, template in templates.items()}
+    try:
+        order = list(graphlib.TopologicalSorter(graph).static_order())
+    except graphlib.CycleError as error:
+        cycle = " -> ".join(f"${{{path}}}" for path in error.args[1])
+        raise ValueError(f"Interpolation cycle: {cycle}") from None  # noqa: EM102, TRY003
+
+    resolved: dict[str, YamlValue] = {}
+    for path in order:
+        if path not in templates:
+            continue  # A referenced value without references itself
+
+        template = templates[path]
+
+        def value_of(reference: str, path: str = path) -> YamlValue:
+            if reference in resolved:
+                return resolved[reference]
+            return _lookup(data, reference, path)
+
+        whole = REFERENCE.fullmatch(template.strip())
+        if whole is not None and not whole.group(1):
+            value = value_of(whole.group(2).strip())
+        else:
+            value = REFERENCE.sub(
+                lambda match: (
+                    "${" + match.group(2) + "}"
+                    if match.group(1)
+                    else _render(value_of(match.group(2).strip()))
+                ),
+                template,
+            )
+
+        resolved[path] = _check(path, value, get_field)
+
+    return typing.cast(
+        "YamlDict",
+        _replace(data, [(_steps(path), value) for path, value in resolved.items()]),
+    )
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from confflow._schema.fields.field import Field
+    from confflow._shared import YamlDict, YamlValue
+
+ENV_SEPARATOR: str = "__"
+
+
+def env_name(prefix: str, path: str) -> str:
+    """Return the environment variable that overrides the field at `path`.
+
+    ``deployment.canary-weight`` with prefix ``CONFFLOW`` becomes
+    ``CONFFLOW__DEPLOYMENT__CANARY_WEIGHT``.
+    """
+    return ENV_SEPARATOR.join(
+        [prefix, *(key.replace("-", "_").upper() for key in path.split("."))],
+    )
+
+
+@typing.final
+class OverrideIndex:
+    """Resolves override strings and environment variables to typed values.
+
+    Args:
+        fields: Every overridable field by dotted path, see `Manager.iter_fields`.
+        env_prefix: Prefix of the environment variables to consider.
+
+    """
+
+    def __init__(
+        self,
+        fields: Mapping[str, Field[typing.Any]],
+        env_prefix: str,
+    ) -> None:
+        self._fields: Mapping[str, Field[typing.Any]] = fields
+        self._env_prefix: str = env_prefix + ENV_SEPARATOR
+        self._env_paths: dict[str, str | None] = {}
+
+        for path in fields:
+            name = env_name(env_prefix, path)
+            # Paths only differing in case or '-' vs '_' can't be told apart
+            self._env_paths[name] = None if name in self._env_paths else path
+
+    def resolve(
+        self,
+        overrides: Iterable[str],
+        environ: Mapping[str, str] | None,
+    ) -> list[tuple[str, YamlValue]]:
+        """Parse all overrides into ``(path, value)`` pairs.
+
+        Environment variables come first, so ``key.path=value`` overrides win.
+
+        Raises:
+            ValueError: If an override is malformed, targets an unknown or ambiguous
+                path, or its value can't be parsed for the target field.
+
+        """
+        assignments: list[tuple[str, YamlValue]] = []
+
+        for name, raw in (environ or {}).items():
+            if not name.startswith(self._env_prefix):
+                continue
+            if name not in self._env_paths:
+                raise ValueError(f"Unknown override variable: {name!r}")  # noqa: EM102, TRY003
+            path = self._env_paths[name]
+            if path is None:
+                raise ValueError(f"Ambiguous override variable: {name!r}")  # noqa: EM102, TRY003
+            assignments.append((path, self._parse(path, raw)))
+
+        for override in overrides:
+            path, separator, raw = override.partition("=")
+            path = path.strip()
+            if not separator:
+                raise ValueError(  # noqa: TRY003
+                    f"Invalid override {override!r}, expected 'key.path=value'",  # noqa: EM102
+                )
+            if path not in self._fields:
+                raise ValueError(f"Unknown override path: {path!r}")  # noqa: EM102, TRY003
+            assignments.append((path, self._parse(path, raw)))
+
+        return assignments
+
+    def _parse(self, path: str, raw: str) -> YamlValue:
+        try:
+            return self._fields[path].parse(raw)  # type: ignore[no-any-return]
+        except ValueError as error:
+            raise ValueError(f"Invalid override for {path!r}: {error}") from error  # noqa: EM102, TRY003
+
+
+def apply_overrides(
+    data: YamlDict,
+    assignments: Iterable[tuple[str, YamlValue]],
+) -> YamlDict:
+    """Return a copy of data with the assignments applied, later ones winning.
+
+    Only the dicts along the overridden paths are copied, everything else is shared
+    with `data`, which is left untouched. Missing sections are created.
+    """
+    tree: dict[str, typing.Any] = {}
+    for path, value in assignments:
+        *parents, leaf = path.split(".")
+        node = tree
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = value
+
+    return deep_merge(data, tree)
+
+
+def deep_merge(data: YamlDict, overlay: YamlDict) -> YamlDict:
+    """Return data with overlay merged into it, section by section.
+
+    Sections (dicts) are merged recursively, any other value in `overlay` replaces
+    the one in `data`. Only the dicts along the overlaid paths are copied, all other
+    sections are shared with `data`, which is left untouched.
+    """
+    merged = dict(data)
+    for key, value in overlay.items():
+        if isinstance(value, dict):
+            current = data.get(key)
+            merged[key] = deep_merge(
+                current if isinstance(current, dict) else {},
+                value,
+            )
+        else:
+            merged[key] = value
+
+    return merged
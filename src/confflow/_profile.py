@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import copy
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from confflow._schema import Schema
+    from confflow._schema.groups.group import Group
+
+
+class ProfileEntry(typing.NamedTuple):
+    path: str
+    kind: str
+    seconds: float
+    calls: int
+    items: int
+
+
+@typing.final
+class ProfileReport:
+    """Ranked result of a validation profile, slowest entries first.
+
+    Entries are fields (``kind="field"``), individual constraints
+    (``kind="constraint"``, path ``<field path>:<constraint>``, or
+    ``<field path>[]:<constraint>`` for item constraints of list fields) and group
+    checks (``kind="group"``). Items of `SchemaList` fields are profiled under
+    ``<field path>[]`` and values of `MapField` fields under ``<field path>.*``.
+    The time of a field is that of its `validate` call, including its constraints
+    and nested items.
+    """
+
+    def __init__(self, entries: list[ProfileEntry]) -> None:
+        self._entries: list[ProfileEntry] = sorted(
+            entries,
+            key=lambda entry: entry.seconds,
+            reverse=True,
+        )
+
+    @property
+    def entries(self) -> list[ProfileEntry]:
+        return list(self._entries)
+
+    def top(self, n: int = 10, /, kind: str | None = None) -> list[ProfileEntry]:
+        """Return the `n` slowest entries, optionally only of the given kind."""
+        entries = [
+            entry for entry in self._entries if kind is None or entry.kind == kind
+        ]
+
+        return entries[:n]
+
+    def __iter__(self) -> Iterator[ProfileEntry]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        width = max((len(entry.path) for entry in self._entries), default=4)
+        header = ("path", "kind", "ms", "calls", "items")
+        lines = [
+            (
+                f"{header[0]:<{width}}  {header[1]:<10}  {header[2]:>10}  "
+                f"{header[3]:>6}  {header[4]:>8}"
+            ),
+        ]
+        lines.extend(
+            f"{entry.path:<{width}}  {entry.kind:<10}  {entry.seconds * 1e3:>10.3f}  "
+            f"{entry.calls:>6}  {entry.items:>8}"
+            for entry in self._entries
+        )
+
+        return "\n".join(lines)
+
+
+def _untimed() -> float:
+    return 0.0
+
+
+class _ObservedConstraint:
+    """Stands in for a constraint of an observed field, timing and counting calls."""
+
+    def __init__(self, constraint: typing.Any, profiler: Profiler, path: str) -> None:  # noqa: ANN401
+        self._constraint = constraint
+        self._profiler = profiler
+        self._path = path
+
+    def __call__(self, value: typing.Any) -> typing.Any:  # noqa: ANN401
+        profiler = self._profiler
+        start = profiler._clock()  # noqa: SLF001
+        result = self._constraint(value)
+        profiler._observed(self._path, "constraint", start, 1)  # noqa: SLF001
+
+        return result
+
+    def validate_many(self, values: typing.Any, /) -> None:  # noqa: ANN401
+        profiler = self._profiler
+        start = profiler._clock()  # noqa: SLF001
+        self._constraint.validate_many(values)
+        profiler._observed(self._path, "constraint", start, len(values), len(values))  # noqa: SLF001
+
+    def __getattr__(self, name: str) -> typing.Any:  # noqa: ANN401
+        return getattr(self._constraint, name)
+
+    def __repr__(self) -> str:
+        return repr(self._constraint)
+
+
+class _ObservedGroup:
+    """Stands in for a group of an observed schema, timing and counting calls."""
+
+    def __init__(self, group: Group, profiler: Profiler, path: str) -> None:
+        self._group = group
+        self._profiler = profiler
+        self._path = path
+
+    def __call__(self, *schemas: str) -> None:
+        profiler = self._profiler
+        start = profiler._clock()  # noqa: SLF001
+        self._group(*schemas)
+        profiler._observed(self._path, "group", start, 1)  # noqa: SLF001
+
+    def __getattr__(self, name: str) -> typing.Any:  # noqa: ANN401
+        return getattr(self._group, name)
+
+
+@typing.final
+class Profiler:
+    """Times and counts what the real validation code runs.
+
+    `observe` returns a copy of a schema whose nodes are the original ones, except
+    that their constraints and groups are wrapped with timers and the `validate`
+    method of every field is timed. Validating with the copy runs the actual
+    `Schema.validate`, `Field.validate` and compiled validators, including
+    overrides of custom fields, so the profile never accepts or rejects different
+    data than `validate`. The schema itself is left untouched.
+
+    Every constraint and group call is counted in `evaluations`, item constraints
+    once per item.
+
+    Args:
+        timed: Whether to time the nodes. Without timing, validating with an
+            observed schema only counts the evaluations.
+
+    """
+
+    def __init__(self, *, timed: bool = True) -> None:
+        self._entries: dict[tuple[str, str], list[float]] = {}
+        self._timed = timed
+        self._clock: Callable[[], float] = time.perf_counter if timed else _untimed
+        self.evaluations = 0
+
+    def _record(self, path: str, kind: str, seconds: float, items: int = 0) -> None:
+        entry = self._entries.setdefault((path, kind), [0.0, 0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+        entry[2] += items
+
+    def _observed(
+        self,
+        path: str,
+        kind: str,
+        start: float,
+        evaluations: int,
+        items: int = 0,
+    ) -> None:
+        self.evaluations += evaluations
+        if self._timed:
+            self._record(path, kind, self._clock() - start, items)
+
+    def observe(self, schema: Schema, path: str) -> Schema:
+        """Return a copy of schema that reports to this profiler, see above.
+
+        Args:
+            schema: The schema to observe, including all nested schemas.
+            path: Dotted path the entries of the schema are recorded under.
+
+        """
+        from confflow._schema import Schema  # noqa: PLC0415
+
+        observed = copy.copy(schema)
+        # Rebuilt from the observed nodes when an item validator is needed
+        vars(observed).pop("_compiled", None)
+        observed._mapping = {  # noqa: SLF001
+            key: (
+                self.observe(node, f"{path}.{key}")
+                if isinstance(node, Schema)
+                else self._field(node, f"{path}.{key}")
+            )
+            for key, node in schema._mapping.items()  # noqa: SLF001
+        }
+        observed._groups = typing.cast(  # noqa: SLF001
+            "set[Group]",
+            {
+                _ObservedGroup(group, self, self._group_path(group, path))
+                for group in schema._groups  # noqa: SLF001
+            },
+        )
+
+        return observed
+
+    def _group_path(self, group: Group, path: str) -> str:
+        if not self._timed:
+            return path
+
+        names = ", ".join(sorted(member.name for member in group.schemas))
+        return f"{path}:{type(group).__name__}({names})"
+
+    def _constraint_path(self, constraint: typing.Any, path: str) -> str:  # noqa: ANN401
+        return f"{path}:{constraint!r}" if self._timed else path
+
+    def _field(self, field: typing.Any, path: str) -> typing.Any:  # noqa: ANN401
+        """Return a copy of field with timed constraints and a timed `validate`."""
+        from confflow._schema import MapField, Schema, SchemaList  # noqa: PLC0415
+
+        observed = copy.copy(field)
+        observed._constraints = {  # noqa: SLF001
+            _ObservedConstraint(
+                constraint,
+                self,
+                self._constraint_path(constraint, path),
+            )
+            for constraint in field._constraints  # noqa: SLF001
+        }
+        if hasattr(field, "_item_constraints"):
+            observed._item_constraints = [  # noqa: SLF001
+                _ObservedConstraint(
+                    constraint,
+                    self,
+                    self._constraint_path(constraint, f"{path}[]"),
+                )
+                for constraint in field._item_constraints  # noqa: SLF001
+            ]
+
+        if isinstance(field, SchemaList):
+            observed._schema = self.observe(field.schema, f"{path}[]")  # noqa: SLF001
+        elif isinstance(field, MapField):
+            value = field.value
+            observed._value = (  # noqa: SLF001
+                self.observe(value, f"{path}.*")
+                if isinstance(value, Schema)
+                else self._field(value, f"{path}.*")
+            )
+
+        validate = observed.validate
+        clock = self._clock
+
+        def timed_validate(value: typing.Any, /) -> None:  # noqa: ANN401
+            start = clock()
+            validate(value)
+            if self._timed:
+                items = len(value) if isinstance(value, list | dict) else 0
+                self._record(path, "field", clock() - start, items)
+
+        # Shadows the method, so `Schema.validate` and compiled validators call it
+        vars(observed)["validate"] = timed_validate
+
+        return observed
+
+    def report(self) -> ProfileReport:
+        return ProfileReport(
+            [
+                ProfileEntry(path, kind, seconds, int(calls), int(items))
+                for (path, kind), (seconds, calls, items) in self._entries.items()
+            ],
+        )
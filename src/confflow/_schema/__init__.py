@@ -14,7 +14,9 @@ from .fields import (
     Stringlist,
 )
 from .groups import AnyOf, Group, OneOf
+from .map_field import MapField
 from .schema import Schema
+from .schema_list import SchemaList
 
 __all__ = [
     "AnyOf",
@@ -30,8 +32,10 @@ __all__ = [
     "Group",
     "IntegerField",
     "Integerlist",
+    "MapField",
     "OneOf",
     "Schema",
+    "SchemaList",
     "StringField",
     "Stringlist",
 ]
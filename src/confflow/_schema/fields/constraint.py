@@ -1,19 +1,23 @@
 from __future__ import annotations
 
+import functools
+import operator
 import re
 import typing
 from abc import abstractmethod
+from datetime import date, datetime, time
 from re import Pattern
 
 import typing_extensions
 
 from confflow._mixins import FormattedStringMixin
+from confflow._shared import digest
 
 T = typing.TypeVar("T")
 TList = typing.TypeVar("TList")
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
 
 ## Base Constraint
@@ -27,6 +31,33 @@ class Constraint(FormattedStringMixin, typing.Generic[T]):
     @abstractmethod
     def __repr__(self) -> str: ...
 
+    def validate_many(self, values: Sequence[T], /) -> None:
+        """Check every value, e.g. the items of a list field.
+
+        Raises on the first invalid value, like calling the constraint on each value.
+        Subclasses may override this with a batched check over the whole sequence.
+        """
+        for value in values:
+            self(value)
+
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        """Return the JSON Schema keywords equivalent to this constraint.
+
+        Constraints without an equivalent, like custom ones, return no keywords, so
+        the exported schema accepts a superset of the valid values.
+        """
+        return {}
+
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        """Structural fingerprint of the constraint, derived from its type and repr."""
+        return digest(type(self).__module__, type(self).__qualname__, repr(self))
+
+
+def _base64_length(size: int) -> int:
+    """Return the length of `size` bytes encoded as base64, with padding."""
+    return 4 * -(-size // 3)
+
 
 ## String Constraints
 class MinLength(Constraint[str]):
@@ -51,6 +82,10 @@ class MinLength(Constraint[str]):
     def to_formatted_string(self, indent: int = 0) -> str:
         return f"Minimum length = {self._length}"
 
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        return {"minLength": self._length}
+
 
 class MaxLength(Constraint[str]):
     def __init__(self, length: int) -> None:
@@ -76,6 +111,10 @@ class MaxLength(Constraint[str]):
     def to_formatted_string(self, indent: int = 0) -> str:
         return f"Maximum length = {self._length}"
 
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        return {"maxLength": self._length}
+
 
 class Regex(Constraint[str]):
     def __init__(self, pattern: str) -> None:
@@ -98,13 +137,19 @@ class Regex(Constraint[str]):
     def to_formatted_string(self, indent: int = 0) -> str:
         return f"Regex: {self._pattern}"
 
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        # `re.match` only anchors at the start, JSON Schema patterns don't anchor
+        pattern = self._pattern.pattern
+        return {"pattern": pattern if pattern.startswith("^") else f"^(?:{pattern})"}
 
-class EnumValues(Constraint[str]):
-    def __init__(self, values: Sequence[str]) -> None:
-        self._values: list[str] = list(values)
+
+class EnumValues(Constraint[T]):
+    def __init__(self, values: Sequence[T]) -> None:
+        self._values: list[T] = list(values)
 
     @typing_extensions.override
-    def __call__(self, value: str) -> str:
+    def __call__(self, value: T) -> T:
         if value not in self._values:
             raise ValidationError(f"`{value}` is not one of {self._values!r}")  # noqa: EM102, TRY003
 
@@ -118,6 +163,10 @@ class EnumValues(Constraint[str]):
     def to_formatted_string(self, indent: int = 0) -> str:
         return f"Regex: {self._values!r}"
 
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        return {"enum": list(self._values)}
+
 
 ## Numeric Constraints
 TNumber = typing.TypeVar("TNumber", int, float)
@@ -126,6 +175,11 @@ TNumber = typing.TypeVar("TNumber", int, float)
 class GreaterThan(Constraint[TNumber]):
     def __init__(self, threshold: TNumber) -> None:
         self._threshold: TNumber = threshold
+        # `threshold < item` as a C-level callable for `validate_many`
+        self._accepts: Callable[[TNumber], bool] = functools.partial(
+            operator.lt,
+            threshold,
+        )
 
     @typing_extensions.override
     def __call__(self, value: TNumber) -> TNumber:
@@ -138,14 +192,28 @@ class GreaterThan(Constraint[TNumber]):
     def __repr__(self) -> str:
         return f"GreaterThan({self._threshold!r})"
 
+    @typing_extensions.override
+    def validate_many(self, values: Sequence[TNumber], /) -> None:
+        if not all(map(self._accepts, values)):
+            super().validate_many(values)  # type: ignore[arg-type]
+
     @typing_extensions.override
     def to_formatted_string(self, indent: int = 0) -> str:
         return f"Greater than: {self._threshold!r}"
 
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        return {"exclusiveMinimum": self._threshold}
+
 
 class GreaterThanOrEqual(Constraint[TNumber]):
     def __init__(self, threshold: TNumber) -> None:
         self._threshold: TNumber = threshold
+        # `threshold <= item` as a C-level callable for `validate_many`
+        self._accepts: Callable[[TNumber], bool] = functools.partial(
+            operator.le,
+            threshold,
+        )
 
     @typing_extensions.override
     def __call__(self, value: TNumber) -> TNumber:
@@ -158,14 +226,28 @@ class GreaterThanOrEqual(Constraint[TNumber]):
     def __repr__(self) -> str:
         return f"GreaterThanOrEqual({self._threshold!r})"
 
+    @typing_extensions.override
+    def validate_many(self, values: Sequence[TNumber], /) -> None:
+        if not all(map(self._accepts, values)):
+            super().validate_many(values)  # type: ignore[arg-type]
+
     @typing_extensions.override
     def to_formatted_string(self, indent: int = 0) -> str:
         return f"Greater than or equal: {self._threshold!r}"
 
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        return {"minimum": self._threshold}
+
 
 class LessThan(Constraint[TNumber]):
     def __init__(self, threshold: TNumber) -> None:
         self._threshold: TNumber = threshold
+        # `threshold > item` as a C-level callable for `validate_many`
+        self._accepts: Callable[[TNumber], bool] = functools.partial(
+            operator.gt,
+            threshold,
+        )
 
     @typing_extensions.override
     def __call__(self, value: TNumber) -> TNumber:
@@ -178,14 +260,28 @@ class LessThan(Constraint[TNumber]):
     def __repr__(self) -> str:
         return f"LessThan({self._threshold!r})"
 
+    @typing_extensions.override
+    def validate_many(self, values: Sequence[TNumber], /) -> None:
+        if not all(map(self._accepts, values)):
+            super().validate_many(values)  # type: ignore[arg-type]
+
     @typing_extensions.override
     def to_formatted_string(self, indent: int = 0) -> str:
         return f"Less than: {self._threshold!r}"
 
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        return {"exclusiveMaximum": self._threshold}
+
 
 class LessThanOrEqual(Constraint[TNumber]):
     def __init__(self, threshold: TNumber) -> None:
         self._threshold: TNumber = threshold
+        # `threshold >= item` as a C-level callable for `validate_many`
+        self._accepts: Callable[[TNumber], bool] = functools.partial(
+            operator.ge,
+            threshold,
+        )
 
     @typing_extensions.override
     def __call__(self, value: TNumber) -> TNumber:
@@ -198,10 +294,198 @@ class LessThanOrEqual(Constraint[TNumber]):
     def __repr__(self) -> str:
         return f"LessThanOrEqual({self._threshold!r})"
 
+    @typing_extensions.override
+    def validate_many(self, values: Sequence[TNumber], /) -> None:
+        if not all(map(self._accepts, values)):
+            super().validate_many(values)  # type: ignore[arg-type]
+
     @typing_extensions.override
     def to_formatted_string(self, indent: int = 0) -> str:
         return f"Less than or equal: {self._threshold!r}"
 
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        return {"maximum": self._threshold}
+
+
+## Date Constraints
+def _is_aware(moment: datetime) -> bool:
+    return moment.tzinfo is not None and moment.utcoffset() is not None
+
+
+def _as_datetime(value: date, moment: datetime | None = None) -> datetime:
+    """Return value as a datetime that can be compared to `moment`.
+
+    YAML date-only values are `date` objects; they are taken as midnight, in the
+    timezone of `moment`.
+
+    Raises:
+        ValidationError: If one of value and `moment` has a UTC offset and the other
+            doesn't, as they can't be ordered.
+
+    """
+    tzinfo = None if moment is None else moment.tzinfo
+    if not isinstance(value, datetime):
+        return datetime.combine(value, time(), tzinfo)
+
+    if moment is not None and _is_aware(value) != _is_aware(moment):
+        naive, aware = (value, moment) if _is_aware(moment) else (moment, value)
+        raise ValidationError(  # noqa: TRY003
+            f"`{value}` can't be compared to `{moment}`: `{naive}` has no UTC "  # noqa: EM102
+            f"offset but `{aware}` has one, give both or neither an offset",
+        )
+
+    return value
+
+
+class After(Constraint[datetime]):
+    def __init__(self, moment: datetime) -> None:
+        self._moment: datetime = _as_datetime(moment)
+        # `moment < item` as a C-level callable for `validate_many`
+        self._accepts: Callable[[datetime], bool] = functools.partial(
+            operator.lt,
+            self._moment,
+        )
+
+    @typing_extensions.override
+    def __call__(self, value: datetime) -> datetime:
+        if not _as_datetime(value, self._moment) > self._moment:
+            raise ValidationError(f"`{value}` is not after `{self._moment}`")  # noqa: EM102, TRY003
+
+        return value
+
+    @typing_extensions.override
+    def __repr__(self) -> str:
+        return f"After({self._moment!r})"
+
+    @typing_extensions.override
+    def validate_many(self, values: Sequence[datetime], /) -> None:
+        try:
+            if all(map(self._accepts, values)):
+                return
+        except TypeError:
+            pass  # Dates or mixed UTC offsets, handled item by item below
+
+        super().validate_many(values)
+
+    @typing_extensions.override
+    def to_formatted_string(self, indent: int = 0) -> str:
+        return f"After: {self._moment.isoformat()}"
+
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        # JSON Schema has no date comparison, this is the keyword of ajv-formats
+        return {"formatExclusiveMinimum": self._moment.isoformat()}
+
+
+class Before(Constraint[datetime]):
+    def __init__(self, moment: datetime) -> None:
+        self._moment: datetime = _as_datetime(moment)
+        # `moment > item` as a C-level callable for `validate_many`
+        self._accepts: Callable[[datetime], bool] = functools.partial(
+            operator.gt,
+            self._moment,
+        )
+
+    @typing_extensions.override
+    def __call__(self, value: datetime) -> datetime:
+        if not _as_datetime(value, self._moment) < self._moment:
+            raise ValidationError(f"`{value}` is not before `{self._moment}`")  # noqa: EM102, TRY003
+
+        return value
+
+    @typing_extensions.override
+    def __repr__(self) -> str:
+        return f"Before({self._moment!r})"
+
+    @typing_extensions.override
+    def validate_many(self, values: Sequence[datetime], /) -> None:
+        try:
+            if all(map(self._accepts, values)):
+                return
+        except TypeError:
+            pass  # Dates or mixed UTC offsets, handled item by item below
+
+        super().validate_many(values)
+
+    @typing_extensions.override
+    def to_formatted_string(self, indent: int = 0) -> str:
+        return f"Before: {self._moment.isoformat()}"
+
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        # JSON Schema has no date comparison, this is the keyword of ajv-formats
+        return {"formatExclusiveMaximum": self._moment.isoformat()}
+
+
+## Bytes Constraints
+class MinSize(Constraint[bytes]):
+    def __init__(self, size: int) -> None:
+        self._size: int = size
+        # `size <= len(item)` as a C-level callable for `validate_many`
+        self._accepts: Callable[[int], bool] = functools.partial(operator.le, size)
+
+    @typing_extensions.override
+    def __call__(self, value: bytes) -> bytes:
+        if not len(value) >= self._size:
+            raise ValidationError(  # noqa: TRY003
+                f"Size {len(value)} is not >= minimum size {self._size}",  # noqa: EM102
+            )
+
+        return value
+
+    @typing_extensions.override
+    def __repr__(self) -> str:
+        return f"MinSize({self._size})"
+
+    @typing_extensions.override
+    def validate_many(self, values: Sequence[bytes], /) -> None:
+        if not all(map(self._accepts, map(len, values))):
+            super().validate_many(values)
+
+    @typing_extensions.override
+    def to_formatted_string(self, indent: int = 0) -> str:
+        return f"Minimum size = {self._size} bytes"
+
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        # Bytes are base64 strings in JSON, limit the length of the encoded text
+        return {"minLength": _base64_length(self._size)}
+
+
+class MaxSize(Constraint[bytes]):
+    def __init__(self, size: int) -> None:
+        self._size: int = size
+        # `size >= len(item)` as a C-level callable for `validate_many`
+        self._accepts: Callable[[int], bool] = functools.partial(operator.ge, size)
+
+    @typing_extensions.override
+    def __call__(self, value: bytes) -> bytes:
+        if not len(value) <= self._size:
+            raise ValidationError(  # noqa: TRY003
+                f"Size {len(value)} exceeds maximum size of {self._size}",  # noqa: EM102
+            )
+
+        return value
+
+    @typing_extensions.override
+    def __repr__(self) -> str:
+        return f"MaxSize({self._size})"
+
+    @typing_extensions.override
+    def validate_many(self, values: Sequence[bytes], /) -> None:
+        if not all(map(self._accepts, map(len, values))):
+            super().validate_many(values)
+
+    @typing_extensions.override
+    def to_formatted_string(self, indent: int = 0) -> str:
+        return f"Maximum size = {self._size} bytes"
+
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        # Bytes are base64 strings in JSON, limit the length of the encoded text
+        return {"maxLength": _base64_length(self._size)}
+
 
 ## List Constraints
 class ListMinLength(Constraint[list[TList]]):
@@ -228,6 +512,10 @@ class ListMinLength(Constraint[list[TList]]):
     def to_formatted_string(self, indent: int = 0) -> str:
         return f"Minimum length = {self._length}"
 
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        return {"minItems": self._length}
+
 
 class ListMaxLength(Constraint[list[TList]]):
     def __init__(self, length: int) -> None:
@@ -252,3 +540,7 @@ class ListMaxLength(Constraint[list[TList]]):
     @typing_extensions.override
     def to_formatted_string(self, indent: int = 0) -> str:
         return f"Maximum length = {self._length}"
+
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        return {"maxItems": self._length}
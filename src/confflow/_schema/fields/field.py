@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import array
+import contextlib
+import contextvars
+import functools
 import re
 import typing
 from datetime import datetime
@@ -7,9 +11,11 @@ from datetime import datetime
 import typing_extensions
 
 from confflow._mixins import FormattedStringMixin
-from confflow._shared import yaml_indent
+from confflow._shared import digest, json_value, yaml_indent
 
 from .constraint import (
+    After,
+    Before,
     EnumValues,
     GreaterThan,
     GreaterThanOrEqual,
@@ -18,17 +24,120 @@ from .constraint import (
     ListMaxLength,
     ListMinLength,
     MaxLength,
+    MaxSize,
     MinLength,
+    MinSize,
     Regex,
+    ValidationError,
 )
 
 T = typing.TypeVar("T")
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
     from .constraint import Constraint
 
+_TRUE_STRINGS: frozenset[str] = frozenset({"true", "yes", "on", "1"})
+_FALSE_STRINGS: frozenset[str] = frozenset({"false", "no", "off", "0"})
+
+
+def _parse_bool(raw: str) -> bool:
+    lowered = raw.strip().lower()
+    if lowered in _TRUE_STRINGS:
+        return True
+    if lowered in _FALSE_STRINGS:
+        return False
+
+    raise ValueError(f"Invalid boolean: {raw!r}")  # noqa: EM102, TRY003
+
+
+def _parse_date(raw: str) -> datetime:
+    stripped = raw.strip()
+    # `fromisoformat` only accepts the "Z" suffix from Python 3.11 on
+    if stripped.endswith(("Z", "z")):
+        stripped = stripped[:-1] + "+00:00"
+
+    return datetime.fromisoformat(stripped)
+
+
+def _split_list(raw: str) -> list[str]:
+    """Split a comma separated list, optionally wrapped in brackets (``[a, b]``)."""
+    stripped = raw.strip()
+    if stripped.startswith("[") and stripped.endswith("]"):
+        stripped = stripped[1:-1].strip()
+
+    return [item.strip() for item in stripped.split(",")] if stripped else []
+
+
+def _compact_array(
+    typecode: str,
+    value: Sequence[int] | Sequence[float],
+) -> array.array[typing.Any]:
+    """Copy the items of a numeric list field into an `array.array`."""
+    try:
+        return array.array(typecode, value)
+    except (TypeError, OverflowError) as error:
+        raise ValidationError(f"Invalid item for a compact list: {error}") from error  # noqa: EM102, TRY003
+
+
+# Compact buffers of the current `compact_buffers` block, by list identity
+_buffers: contextvars.ContextVar[
+    dict[int, tuple[typing.Any, array.array[typing.Any]]] | None
+] = contextvars.ContextVar("confflow_compact_buffers", default=None)
+
+
+@contextlib.contextmanager
+def compact_buffers() -> Iterator[None]:
+    """Share the compact buffers built by `validate` with `materialize`.
+
+    Within the block, the buffer of a compact list is built once, when the list is
+    first validated or materialized, and reused for the same list object after
+    that. The lists are kept alive until the block exits.
+    """
+    token = _buffers.set({})
+    try:
+        yield
+    finally:
+        _buffers.reset(token)
+
+
+def _compact_buffer(
+    typecode: str,
+    value: Sequence[int] | Sequence[float],
+) -> array.array[typing.Any]:
+    buffers = _buffers.get()
+    if buffers is None:
+        return _compact_array(typecode, value)
+
+    entry = buffers.get(id(value))
+    if entry is None or entry[0] is not value:
+        entry = (value, _compact_array(typecode, value))
+        buffers[id(value)] = entry
+
+    return entry[1]
+
 
 ## Base Field
+def with_json_constraints(
+    schema: dict[str, typing.Any],
+    constraints: Iterable[Constraint[typing.Any]],
+) -> dict[str, typing.Any]:
+    """Add the JSON Schema keywords of constraints to a schema, in place.
+
+    Keywords that are already set, e.g. by two constraints of the same type, are
+    combined with ``allOf`` so that all of them apply.
+    """
+    for constraint in sorted(constraints, key=repr):
+        keywords = constraint.to_json_schema()
+        if keywords.keys() & schema.keys():
+            schema.setdefault("allOf", []).append(keywords)
+        else:
+            schema.update(keywords)
+
+    return schema
+
+
 class Field(FormattedStringMixin, typing.Generic[T]):
     SAFE_YAML_KEY = re.compile(r"^(?!-)(?!\d)[A-Za-z_][A-Za-z0-9_-]*$")
 
@@ -55,6 +164,8 @@ class Field(FormattedStringMixin, typing.Generic[T]):
         self._default: T | None = default
         self._constraints: set[Constraint[T]] = set(constraints)
         self._dtype: str = "field"
+        # JSON Schema keywords of the field type, see `to_json_schema`
+        self._json_type: dict[str, typing.Any] = {}
 
     @property
     def name(self) -> str:
@@ -68,10 +179,96 @@ class Field(FormattedStringMixin, typing.Generic[T]):
     def default(self) -> T | None:
         return self._default
 
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        """Structural fingerprint of the field, computed once.
+
+        Covers the field type, name, description, default and constraints, so two
+        fields with the same fingerprint validate and format identically.
+        """
+        return digest(
+            type(self).__module__,
+            type(self).__qualname__,
+            self._name,
+            repr(self._description),
+            repr(self._default),
+            *sorted(constraint.fingerprint for constraint in self._constraints),
+            "items",
+            *sorted(
+                constraint.fingerprint
+                for constraint in getattr(self, "_item_constraints", ())
+            ),
+            *(("compact",) if getattr(self, "_compact", False) else ()),
+        )
+
+    def parse(self, raw: str, /) -> T:  # noqa: ARG002
+        """Parse a value for this field from a string, e.g. an environment variable.
+
+        Args:
+            raw: The string to parse. List fields accept comma separated items,
+                optionally wrapped in brackets.
+
+        Returns:
+            The parsed value. It is not validated.
+
+        Raises:
+            ValueError: If the string is not a valid value of the field type.
+
+        """
+        raise ValueError(  # noqa: TRY003
+            f"{type(self).__name__} values can't be parsed from strings",  # noqa: EM102
+        )
+
+    @property
+    def _materializes(self) -> bool:
+        """Whether `materialize` changes values of this field."""
+        return False
+
+    def materialize(self, value: T, /) -> typing.Any:  # noqa: ANN401
+        """Return the value as it is stored in a Config object.
+
+        Called on validated data before the Config object is built. Values are kept
+        as they are unless a field type needs a special representation.
+        """
+        return value
+
     def validate(self, value: T, /) -> None:
         for constraint in self._constraints:
             constraint(value)
 
+    def _item_values(self, value: T, /) -> typing.Any:  # noqa: ANN401
+        """Return the items that item constraints of a list field validate."""
+        return value
+
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        """Return a JSON Schema that accepts the values of this field.
+
+        Combines the keywords of the field type with those of every constraint, see
+        `Constraint.to_json_schema`. Item constraints of list fields apply to
+        ``items``. Dates are strings in ``date-time`` format and bytes base64
+        strings, like `to_json` writes them.
+        """
+        schema: dict[str, typing.Any] = {**self._json_type}
+        if "items" in schema:
+            schema["items"] = with_json_constraints(
+                dict(schema["items"]),
+                getattr(self, "_item_constraints", ()),
+            )
+
+        return self._with_json_details(schema)
+
+    def _with_json_details(
+        self,
+        schema: dict[str, typing.Any],
+    ) -> dict[str, typing.Any]:
+        """Add the constraints, description and default of the field to a schema."""
+        with_json_constraints(schema, self._constraints)
+        schema["description"] = self._description
+        if self._default is not None:
+            schema["default"] = json_value(self._default)
+
+        return schema
+
     @typing_extensions.override
     def to_formatted_string(self, indent: int = 0) -> str:
         description: str = yaml_indent * indent + f"# {self._description}\n"
@@ -149,6 +346,11 @@ class StringField(Field[str]):
         )
 
         self._dtype = "string"
+        self._json_type = {"type": "string"}
+
+    @typing_extensions.override
+    def parse(self, raw: str, /) -> str:
+        return raw
 
 
 class IntegerField(Field[int]):
@@ -195,6 +397,11 @@ class IntegerField(Field[int]):
         )
 
         self._dtype = "integer"
+        self._json_type = {"type": "integer"}
+
+    @typing_extensions.override
+    def parse(self, raw: str, /) -> int:
+        return int(raw)
 
 
 class FloatField(Field[float]):
@@ -241,6 +448,11 @@ class FloatField(Field[float]):
         )
 
         self._dtype = "float"
+        self._json_type = {"type": "number"}
+
+    @typing_extensions.override
+    def parse(self, raw: str, /) -> float:
+        return float(raw)
 
 
 class DateField(Field[datetime]):
@@ -251,6 +463,8 @@ class DateField(Field[datetime]):
         *constraints: Constraint[datetime],
         description: str | None = None,
         default: datetime | None = None,
+        after: datetime | None = None,
+        before: datetime | None = None,
     ) -> None:
         """Initialize a date field with optional constraints.
 
@@ -259,16 +473,29 @@ class DateField(Field[datetime]):
             *constraints (Constraint[datetime]): Variable number of constraint objects to apply to the field.
             description (str | None, optional): A description of the field. Defaults to None.
             default (datetime | None, optional): The default value for the field. Defaults to None.
+            after (datetime | None, optional): Field value must be later than this. Defaults to None.
+            before (datetime | None, optional): Field value must be earlier than this. Defaults to None.
 
         """  # noqa: E501
+        all_constraints: list[Constraint[datetime]] = list(constraints)
+        if after is not None:
+            all_constraints.append(After(after))
+        if before is not None:
+            all_constraints.append(Before(before))
+
         super().__init__(
             name,
-            *constraints,
+            *all_constraints,
             description=description,
             default=default,
         )
 
         self._dtype = "date"
+        self._json_type = {"type": "string", "format": "date-time"}
+
+    @typing_extensions.override
+    def parse(self, raw: str, /) -> datetime:
+        return _parse_date(raw)
 
 
 class BytesField(Field[bytes]):
@@ -279,6 +506,8 @@ class BytesField(Field[bytes]):
         *constraints: Constraint[bytes],
         description: str | None = None,
         default: bytes | None = None,
+        min_size: int | None = None,
+        max_size: int | None = None,
     ) -> None:
         """Initialize a bytes field with optional constraints.
 
@@ -287,16 +516,29 @@ class BytesField(Field[bytes]):
             *constraints (Constraint[bytes]): Variable number of constraint objects to apply to the field.
             description (str | None, optional): A description of the field. Defaults to None.
             default (bytes | None, optional): The default value for the field. Defaults to None.
+            min_size (int | None, optional): Minimum size of the value in bytes. Defaults to None.
+            max_size (int | None, optional): Maximum size of the value in bytes. Defaults to None.
 
         """  # noqa: E501
+        all_constraints: list[Constraint[bytes]] = list(constraints)
+        if min_size is not None:
+            all_constraints.append(MinSize(min_size))
+        if max_size is not None:
+            all_constraints.append(MaxSize(max_size))
+
         super().__init__(
             name,
-            *constraints,
+            *all_constraints,
             description=description,
             default=default,
         )
 
         self._dtype = "bytes"
+        self._json_type = {"type": "string", "contentEncoding": "base64"}
+
+    @typing_extensions.override
+    def parse(self, raw: str, /) -> bytes:
+        return raw.encode("utf-8")
 
 
 class BooleanField(Field[bool]):
@@ -325,6 +567,11 @@ class BooleanField(Field[bool]):
         )
 
         self._dtype = "bool"
+        self._json_type = {"type": "boolean"}
+
+    @typing_extensions.override
+    def parse(self, raw: str, /) -> bool:
+        return _parse_bool(raw)
 
 
 ## List Fields
@@ -373,6 +620,7 @@ class Stringlist(Field[list[str]]):
         )
 
         self._dtype = "list[string]"
+        self._json_type = {"type": "array", "items": {"type": "string"}}
 
         self._item_constraints: list[Constraint[str]] = []
         if item_min_length is not None:
@@ -384,14 +632,17 @@ class Stringlist(Field[list[str]]):
         if item_enum is not None:
             self._item_constraints.append(EnumValues(item_enum))
 
+    @typing_extensions.override
+    def parse(self, raw: str, /) -> list[str]:
+        return _split_list(raw)
+
     @typing_extensions.override
     def validate(self, value: list[str], /) -> None:
         # Validate list-level constraints
         super().validate(value)
         # Validate each item
-        for item in value:
-            for constraint in self._item_constraints:
-                constraint(item)
+        for constraint in self._item_constraints:
+            constraint.validate_many(value)
 
     @typing_extensions.override
     def to_formatted_string(self, indent: int = 0) -> str:
@@ -436,6 +687,7 @@ class Integerlist(Field[list[int]]):
         item_ge: int | None = None,
         item_lt: int | None = None,
         item_le: int | None = None,
+        compact: bool = False,
     ) -> None:
         """Initialize an integer list field with optional constraints.
 
@@ -450,6 +702,7 @@ class Integerlist(Field[list[int]]):
             item_ge (int | None, optional): Each integer item must be greater than or equal to this value. Defaults to None.
             item_lt (int | None, optional): Each integer item must be less than this value. Defaults to None.
             item_le (int | None, optional): Each integer item must be less than or equal to this value. Defaults to None.
+            compact (bool, optional): Store values as a read-only memoryview of an `array.array` of 64-bit integers instead of a list. Defaults to False.
 
         """  # noqa: E501
         all_constraints: list[Constraint[list[int]]] = list(constraints)
@@ -466,6 +719,10 @@ class Integerlist(Field[list[int]]):
         )
 
         self._dtype = "list[integer]"
+        self._json_type = {"type": "array", "items": {"type": "integer"}}
+
+        self._compact: bool = compact
+        self._typecode: str = "q"
 
         self._item_constraints: list[Constraint[int]] = []
         if item_gt is not None:
@@ -477,14 +734,34 @@ class Integerlist(Field[list[int]]):
         if item_le is not None:
             self._item_constraints.append(LessThanOrEqual(item_le))
 
+    @typing_extensions.override
+    def parse(self, raw: str, /) -> list[int]:
+        return [int(item) for item in _split_list(raw)]
+
+    @property
+    def _materializes(self) -> bool:
+        return self._compact
+
+    @typing_extensions.override
+    def materialize(self, value: list[int], /) -> typing.Any:
+        if not self._compact:
+            return value
+
+        return memoryview(_compact_buffer(self._typecode, value)).toreadonly()
+
+    @typing_extensions.override
+    def _item_values(self, value: list[int], /) -> typing.Any:
+        # Validate items directly on the compact buffer if enabled
+        return _compact_buffer(self._typecode, value) if self._compact else value
+
     @typing_extensions.override
     def validate(self, value: list[int], /) -> None:
         # Validate list-level constraints
         super().validate(value)
         # Validate each item
-        for item in value:
-            for constraint in self._item_constraints:
-                constraint(item)
+        items = self._item_values(value)
+        for constraint in self._item_constraints:
+            constraint.validate_many(items)
 
     @typing_extensions.override
     def to_formatted_string(self, indent: int = 0) -> str:
@@ -529,6 +806,7 @@ class Floatlist(Field[list[float]]):
         item_ge: float | None = None,
         item_lt: float | None = None,
         item_le: float | None = None,
+        compact: bool = False,
     ) -> None:
         """Initialize a float list field with optional constraints.
 
@@ -543,6 +821,7 @@ class Floatlist(Field[list[float]]):
             item_ge (float | None, optional): Each float item must be greater than or equal to this value. Defaults to None.
             item_lt (float | None, optional): Each float item must be less than this value. Defaults to None.
             item_le (float | None, optional): Each float item must be less than or equal to this value. Defaults to None.
+            compact (bool, optional): Store values as a read-only memoryview of an `array.array` of 64-bit floats instead of a list. Defaults to False.
 
         """  # noqa: E501
         all_constraints: list[Constraint[list[float]]] = list(constraints)
@@ -559,6 +838,10 @@ class Floatlist(Field[list[float]]):
         )
 
         self._dtype = "list[floating]"
+        self._json_type = {"type": "array", "items": {"type": "number"}}
+
+        self._compact: bool = compact
+        self._typecode: str = "d"
 
         self._item_constraints: list[Constraint[float]] = []
         if item_gt is not None:
@@ -570,14 +853,34 @@ class Floatlist(Field[list[float]]):
         if item_le is not None:
             self._item_constraints.append(LessThanOrEqual(item_le))
 
+    @typing_extensions.override
+    def parse(self, raw: str, /) -> list[float]:
+        return [float(item) for item in _split_list(raw)]
+
+    @property
+    def _materializes(self) -> bool:
+        return self._compact
+
+    @typing_extensions.override
+    def materialize(self, value: list[float], /) -> typing.Any:
+        if not self._compact:
+            return value
+
+        return memoryview(_compact_buffer(self._typecode, value)).toreadonly()
+
+    @typing_extensions.override
+    def _item_values(self, value: list[float], /) -> typing.Any:
+        # Validate items directly on the compact buffer if enabled
+        return _compact_buffer(self._typecode, value) if self._compact else value
+
     @typing_extensions.override
     def validate(self, value: list[float], /) -> None:
         # Validate list-level constraints
         super().validate(value)
         # Validate each item
-        for item in value:
-            for constraint in self._item_constraints:
-                constraint(item)
+        items = self._item_values(value)
+        for constraint in self._item_constraints:
+            constraint.validate_many(items)
 
     @typing_extensions.override
     def to_formatted_string(self, indent: int = 0) -> str:
@@ -609,7 +912,7 @@ class Floatlist(Field[list[float]]):
 
 
 class Booleanlist(Field[list[bool]]):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         name: str,
         /,
@@ -618,6 +921,7 @@ class Booleanlist(Field[list[bool]]):
         default: list[bool] | None = None,
         min_length: int | None = None,
         max_length: int | None = None,
+        item_enum: Sequence[bool] | None = None,
     ) -> None:
         """Initialize a boolean list field with optional constraints.
 
@@ -628,6 +932,7 @@ class Booleanlist(Field[list[bool]]):
             default (list[bool] | None, optional): The default value for the field. Defaults to None.
             min_length (int | None, optional): Minimum number of items allowed in the list. Defaults to None.
             max_length (int | None, optional): Maximum number of items allowed in the list. Defaults to None.
+            item_enum (Sequence[bool] | None, optional): The values every item must be one of, e.g. ``[True]``. Defaults to None.
 
         """  # noqa: E501
         all_constraints: list[Constraint[list[bool]]] = list(constraints)
@@ -644,6 +949,23 @@ class Booleanlist(Field[list[bool]]):
         )
 
         self._dtype = "list[boolean]"
+        self._json_type = {"type": "array", "items": {"type": "boolean"}}
+
+        self._item_constraints: list[Constraint[bool]] = []
+        if item_enum is not None:
+            self._item_constraints.append(EnumValues(item_enum))
+
+    @typing_extensions.override
+    def parse(self, raw: str, /) -> list[bool]:
+        return [_parse_bool(item) for item in _split_list(raw)]
+
+    @typing_extensions.override
+    def validate(self, value: list[bool], /) -> None:
+        # Validate list-level constraints
+        super().validate(value)
+        # Validate each item
+        for constraint in self._item_constraints:
+            constraint.validate_many(value)
 
     @typing_extensions.override
     def to_formatted_string(self, indent: int = 0) -> str:
@@ -675,7 +997,7 @@ class Booleanlist(Field[list[bool]]):
 
 
 class Datelist(Field[list[datetime]]):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         name: str,
         /,
@@ -684,6 +1006,8 @@ class Datelist(Field[list[datetime]]):
         default: list[datetime] | None = None,
         min_length: int | None = None,
         max_length: int | None = None,
+        item_after: datetime | None = None,
+        item_before: datetime | None = None,
     ) -> None:
         """Initialize a datetime list field with optional constraints.
 
@@ -694,6 +1018,8 @@ class Datelist(Field[list[datetime]]):
             default (list[datetime] | None, optional): The default value for the field. Defaults to None.
             min_length (int | None, optional): Minimum number of items allowed in the list. Defaults to None.
             max_length (int | None, optional): Maximum number of items allowed in the list. Defaults to None.
+            item_after (datetime | None, optional): Each item must be later than this. Defaults to None.
+            item_before (datetime | None, optional): Each item must be earlier than this. Defaults to None.
 
         """  # noqa: E501
         all_constraints: list[Constraint[list[datetime]]] = list(constraints)
@@ -710,6 +1036,28 @@ class Datelist(Field[list[datetime]]):
         )
 
         self._dtype = "list[date]"
+        self._json_type = {
+            "type": "array",
+            "items": {"type": "string", "format": "date-time"},
+        }
+
+        self._item_constraints: list[Constraint[datetime]] = []
+        if item_after is not None:
+            self._item_constraints.append(After(item_after))
+        if item_before is not None:
+            self._item_constraints.append(Before(item_before))
+
+    @typing_extensions.override
+    def parse(self, raw: str, /) -> list[datetime]:
+        return [_parse_date(item) for item in _split_list(raw)]
+
+    @typing_extensions.override
+    def validate(self, value: list[datetime], /) -> None:
+        # Validate list-level constraints
+        super().validate(value)
+        # Validate each item
+        for constraint in self._item_constraints:
+            constraint.validate_many(value)
 
     @typing_extensions.override
     def to_formatted_string(self, indent: int = 0) -> str:
@@ -744,7 +1092,7 @@ class Datelist(Field[list[datetime]]):
 
 
 class Byteslist(Field[list[bytes]]):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         name: str,
         /,
@@ -753,6 +1101,8 @@ class Byteslist(Field[list[bytes]]):
         default: list[bytes] | None = None,
         min_length: int | None = None,
         max_length: int | None = None,
+        item_min_size: int | None = None,
+        item_max_size: int | None = None,
     ) -> None:
         """Initialize a bytes list field with optional constraints.
 
@@ -763,6 +1113,8 @@ class Byteslist(Field[list[bytes]]):
             default (list[bytes] | None, optional): The default value for the field. Defaults to None.
             min_length (int | None, optional): Minimum number of items allowed in the list. Defaults to None.
             max_length (int | None, optional): Maximum number of items allowed in the list. Defaults to None.
+            item_min_size (int | None, optional): Minimum size of each item in bytes. Defaults to None.
+            item_max_size (int | None, optional): Maximum size of each item in bytes. Defaults to None.
 
         """  # noqa: E501
         all_constraints: list[Constraint[list[bytes]]] = list(constraints)
@@ -779,6 +1131,28 @@ class Byteslist(Field[list[bytes]]):
         )
 
         self._dtype = "list[bytes]"
+        self._json_type = {
+            "type": "array",
+            "items": {"type": "string", "contentEncoding": "base64"},
+        }
+
+        self._item_constraints: list[Constraint[bytes]] = []
+        if item_min_size is not None:
+            self._item_constraints.append(MinSize(item_min_size))
+        if item_max_size is not None:
+            self._item_constraints.append(MaxSize(item_max_size))
+
+    @typing_extensions.override
+    def parse(self, raw: str, /) -> list[bytes]:
+        return [item.encode("utf-8") for item in _split_list(raw)]
+
+    @typing_extensions.override
+    def validate(self, value: list[bytes], /) -> None:
+        # Validate list-level constraints
+        super().validate(value)
+        # Validate each item
+        for constraint in self._item_constraints:
+            constraint.validate_many(value)
 
     @typing_extensions.override
     def to_formatted_string(self, indent: int = 0) -> str:
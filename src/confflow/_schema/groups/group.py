@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import functools
 import typing
 from abc import abstractmethod
 
 import typing_extensions
 
 from confflow._mixins import FormattedStringMixin
-from confflow._shared import create_frame, yaml_indent
+from confflow._shared import create_frame, digest, yaml_indent
 
 if typing.TYPE_CHECKING:
     from confflow._schema import Schema
@@ -16,11 +17,35 @@ if typing.TYPE_CHECKING:
 class Group(FormattedStringMixin):
     def __init__(self, *schemas: Schema) -> None:
         self._schemas: frozenset[Schema] = frozenset(schemas)
+        for schema in self._schemas:
+            schema._parents.append(self)  # noqa: SLF001
 
     @property
     def schemas(self) -> frozenset[Schema]:
         return self._schemas
 
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        """Structural fingerprint of the group, computed once and cached.
+
+        Derived from the group type and the (cached) fingerprints of its schemas,
+        independent of their order. The cached value is reset whenever one of the
+        schemas is modified.
+        """
+        return digest(
+            type(self).__module__,
+            type(self).__qualname__,
+            *sorted(schema.fingerprint for schema in self._schemas),
+        )
+
+    def _invalidate(self) -> None:
+        """Reset the fingerprint when a schema of the group is modified.
+
+        Schemas containing the group are parents of its schemas themselves, see
+        `Schema.add`, so there is nothing to propagate.
+        """
+        self.__dict__.pop("fingerprint", None)
+
     def __hash__(self) -> int:
         return hash(self._schemas)
 
@@ -33,6 +58,17 @@ class Group(FormattedStringMixin):
     @abstractmethod
     def __call__(self, *schemas: str) -> None: ...
 
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        """Return the JSON Schema keywords equivalent to this group.
+
+        Every schema of the group is represented by a ``required`` clause on its
+        name. Groups without an equivalent return no keywords.
+        """
+        return {}
+
+    def _required(self) -> list[dict[str, typing.Any]]:
+        return [{"required": [name]} for name in sorted(s.name for s in self._schemas)]
+
     @abstractmethod
     def __repr__(self) -> str: ...
 
@@ -49,6 +85,10 @@ class OneOf(Group):
                 f"Expected exactly one of {', '.join([repr(schema) for schema in self._schemas])}, but found {matches} matches",  # noqa: E501, EM102
             )
 
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        return {"oneOf": self._required()}
+
     @typing_extensions.override
     def __repr__(self) -> str:
         return f"OneOf({', '.join([repr(schema) for schema in self._schemas])})"
@@ -81,6 +121,10 @@ class AnyOf(Group):
                 f"Expected at least one of {self._schemas}, but found no matches",  # noqa: EM102
             )
 
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        return {"anyOf": self._required()}
+
     @typing_extensions.override
     def __repr__(self) -> str:
         return f"AnyOf({', '.join([repr(schema) for schema in self._schemas])})"
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import functools
+import re
+import typing
+from types import MappingProxyType
+
+import typing_extensions
+
+from confflow._shared import digest, yaml_indent
+
+from .fields.constraint import Regex, ValidationError
+from .fields.field import Field
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from confflow._shared import YamlValue
+
+    from .fields.constraint import Constraint
+    from .schema import Schema
+
+
+@typing.final
+class MapField(Field[dict[str, "YamlValue"]]):
+    """A mapping with user-defined keys and values of one type.
+
+    Useful for sections keyed by data rather than by the schema, e.g. limits per
+    region. Keys are checked against the key constraints as a set, values with one
+    validator reused for all of them. The mapping is materialized as a read-only
+    `types.MappingProxyType` instead of a generated class.
+
+    Args:
+        name: The name of the field.
+        value: Field or schema every value must match. Its name is only used for
+            documentation.
+        *constraints: Constraints on the mapping as a whole.
+        description: A description of the field. Must not be empty.
+        default: The default value for the field.
+        key_regex: Regular expression pattern every key must match.
+        key_enum: Allowed keys.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str,
+        value: Field[typing.Any] | Schema,
+        /,
+        *constraints: Constraint[dict[str, YamlValue]],
+        description: str | None = None,
+        default: dict[str, YamlValue] | None = None,
+        key_regex: str | None = None,
+        key_enum: Sequence[str] | None = None,
+    ) -> None:
+        from .schema import Schema  # noqa: PLC0415
+
+        super().__init__(
+            name,
+            *constraints,
+            description=description,
+            default=default,
+        )
+
+        self._value: Field[typing.Any] | Schema = value
+        self._key_regex: re.Pattern[str] | None = (
+            None if key_regex is None else re.compile(key_regex)
+        )
+        self._key_enum: frozenset[str] | None = (
+            None if key_enum is None else frozenset(key_enum)
+        )
+        self._dtype = (
+            f"map[string, {value.name if isinstance(value, Schema) else value._dtype}]"  # noqa: SLF001
+        )
+        self._parents: list[Schema] = []
+        if isinstance(value, Schema):
+            value._parents.append(self)  # noqa: SLF001
+
+    @property
+    def value(self) -> Field[typing.Any] | Schema:
+        return self._value
+
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        """Structural fingerprint of the field including key and value rules."""
+        return digest(
+            type(self).__module__,
+            type(self).__qualname__,
+            self._name,
+            repr(self._description),
+            repr(self._default),
+            *sorted(constraint.fingerprint for constraint in self._constraints),
+            "keys",
+            repr(self._key_regex),
+            repr(sorted(self._key_enum or ())),
+            "value",
+            self._value.fingerprint,
+        )
+
+    def _invalidate(self) -> None:
+        """Reset the fingerprint when the value schema is modified."""
+        self.__dict__.pop("fingerprint", None)
+
+        for parent in self._parents:
+            parent._invalidate()  # noqa: SLF001
+
+    @property
+    def _materializes(self) -> bool:
+        return True
+
+    def _value_validator(self) -> Callable[[typing.Any], None]:
+        from .schema import Schema  # noqa: PLC0415
+
+        if isinstance(self._value, Schema):
+            return self._value.compile()
+
+        return self._value.validate
+
+    def _check_keys(self, value: dict[str, YamlValue], /) -> None:
+        """Check that value is a mapping with valid keys."""
+        if not isinstance(value, dict):
+            raise ValidationError(f"`{value}` is not a mapping")  # noqa: EM102, TRY003
+
+        keys = value.keys()
+        if not all(isinstance(key, str) for key in keys):
+            raise ValidationError(f"Keys of {self._name!r} must be strings")  # noqa: EM102, TRY003
+
+        if self._key_enum is not None and (invalid := keys - self._key_enum):
+            raise ValidationError(  # noqa: TRY003
+                f"Keys {sorted(invalid)!r} are not one of {sorted(self._key_enum)!r}",  # noqa: EM102
+            )
+
+        if self._key_regex is not None:
+            match = self._key_regex.match
+            if unmatched := [key for key in keys if not match(key)]:
+                raise ValidationError(  # noqa: TRY003
+                    f"Keys {unmatched!r} do not match `{self._key_regex.pattern}`",  # noqa: EM102
+                )
+
+    @typing_extensions.override
+    def validate(self, value: dict[str, YamlValue], /) -> None:
+        self._check_keys(value)
+        super().validate(value)
+
+        validate_value = self._value_validator()
+        for item in value.values():
+            validate_value(item)
+
+    def materialize(self, value: dict[str, YamlValue], /) -> typing.Any:  # noqa: ANN401
+        """Return the mapping as a read-only `types.MappingProxyType`."""
+        materialize = self._value.materialize
+        return MappingProxyType(
+            {key: materialize(item) for key, item in value.items()},  # type: ignore[arg-type]
+        )
+
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        from .schema import Schema  # noqa: PLC0415
+
+        names: dict[str, typing.Any] = {}
+        if self._key_regex is not None:
+            names.update(Regex(self._key_regex.pattern).to_json_schema())
+        if self._key_enum is not None:
+            names["enum"] = sorted(self._key_enum)
+
+        schema: dict[str, typing.Any] = {
+            "type": "object",
+            "additionalProperties": (
+                self._value._json_object  # noqa: SLF001
+                if isinstance(self._value, Schema)
+                else self._value.to_json_schema()
+            ),
+        }
+        if names:
+            schema["propertyNames"] = names
+
+        return self._with_json_details(schema)
+
+    @typing_extensions.override
+    def to_formatted_string(self, indent: int = 0) -> str:
+        description: str = yaml_indent * indent + f"# {self._description}\n"
+        dtype: str = yaml_indent * indent + f"# type: {self._dtype}\n"
+        rules: list[str] = [cnst.to_formatted_string() for cnst in self._constraints]
+        if self._key_regex is not None:
+            rules.append(f"Key regex: {self._key_regex.pattern}")
+        if self._key_enum is not None:
+            rules.append(f"Keys: {sorted(self._key_enum)!r}")
+        constraints: str = (
+            yaml_indent * indent
+            + "# constraints:\n"
+            + "".join(yaml_indent * indent + f"#  - {rule}\n" for rule in rules)
+            if rules
+            else ""
+        )
+        field: str = (
+            yaml_indent * indent + f"{self.name}: {dict(self.default)}"
+            if self.default
+            else yaml_indent * indent + f"{self.name}: {{}}"
+        )
+
+        return description + dtype + constraints + field
@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import bisect
+import functools
 import re
 import typing
 
 import typing_extensions
 
+from confflow._config import ConfigLayout
 from confflow._mixins import FormattedStringMixin
-from confflow._shared import yaml_indent
+from confflow._profile import Profiler
+from confflow._shared import digest, json_schema_dialect, yaml_indent
 
+from .fields.field import Field
 from .groups.group import Group
+from .map_field import MapField
+from .schema_list import SchemaList
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from confflow._profile import ProfileReport
     from confflow._schema.fields import (
         BooleanField,
         Booleanlist,
@@ -28,6 +38,22 @@ if typing.TYPE_CHECKING:
     from confflow._shared import YamlDict
 
 
+_FIELD_MODULE: str = Field.__module__
+
+
+def _valid(value: object, /) -> None:
+    """Accept any value, used for fields without constraints."""
+
+
+def _validates_more(node: Field[typing.Any], /) -> bool:
+    """Whether a field's `validate` does more than run its constraints.
+
+    True for fields whose class or instance overrides `validate` outside of
+    confflow, e.g. custom field types, so they are never skipped.
+    """
+    return "validate" in vars(node) or type(node).validate.__module__ != _FIELD_MODULE
+
+
 @typing.final
 class Schema(FormattedStringMixin):
     """A schema definition for validating and formatting YAML configuration structures.
@@ -85,7 +111,9 @@ class Schema(FormattedStringMixin):
             | IntegerField
             | Integerlist
             | StringField
-            | Stringlist,
+            | Stringlist
+            | SchemaList
+            | MapField,
         ] = {}
         self._nodes: list[
             Schema
@@ -101,11 +129,15 @@ class Schema(FormattedStringMixin):
             | IntegerField
             | Integerlist
             | StringField
-            | Stringlist,
+            | Stringlist
+            | SchemaList
+            | MapField,
         ] = []
         self._schema_names: set[str] = set()
         self._field_names: set[str] = set()
         self._groups: set[Group] = set()
+        self._parents: list[Schema | SchemaList | MapField | Group] = []
+        self._frozen: bool = False
 
     @property
     def name(self) -> str:
@@ -127,6 +159,39 @@ class Schema(FormattedStringMixin):
         """
         return self._description
 
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        """Structural fingerprint of the schema, computed once and cached.
+
+        Covers the name, description and the fingerprints of all fields, nested
+        schemas and groups, independent of the order they were added in. The cached
+        value is reset whenever this schema or a nested schema is modified.
+
+        Returns:
+            A hex digest that is stable across processes.
+
+        """
+        return digest(
+            "Schema",
+            self._name,
+            repr(self._description),
+            *sorted(node.fingerprint for node in self._nodes),
+        )
+
+    def _invalidate(self) -> None:
+        """Reset cached structural data of this schema and all schemas containing it."""
+        self.__dict__.pop("fingerprint", None)
+        self.__dict__.pop("_field_index", None)
+        self.__dict__.pop("_field_paths", None)
+        self.__dict__.pop("_compiled", None)
+        self.__dict__.pop("_materializes", None)
+        self.__dict__.pop("_json_object", None)
+        self.__dict__.pop("_json_schema", None)
+        self.__dict__.pop("_config_layout", None)
+
+        for parent in self._parents:
+            parent._invalidate()  # noqa: SLF001
+
     def __add_field(
         self,
         field: BooleanField
@@ -140,7 +205,9 @@ class Schema(FormattedStringMixin):
         | IntegerField
         | Integerlist
         | StringField
-        | Stringlist,
+        | Stringlist
+        | SchemaList
+        | MapField,
         /,
     ) -> typing_extensions.Self:
         """Add a field to the schema.
@@ -161,6 +228,9 @@ class Schema(FormattedStringMixin):
         self._mapping[field.name] = field
         self._field_names.add(field.name)
         self._nodes.append(field)
+        if isinstance(field, (SchemaList, MapField)):
+            field._parents.append(self)  # noqa: SLF001
+        self._invalidate()
 
         return self
 
@@ -183,6 +253,8 @@ class Schema(FormattedStringMixin):
         self._mapping[schema.name] = schema
         self._schema_names.add(schema.name)
         self._nodes.append(schema)
+        schema._parents.append(self)
+        self._invalidate()
 
         return self
 
@@ -213,6 +285,9 @@ class Schema(FormattedStringMixin):
         self._schema_names.update([schema.name for schema in group.schemas])
         self._groups.add(group)
         self._nodes.append(group)
+        for schema in group.schemas:
+            schema._parents.append(self)  # noqa: SLF001
+        self._invalidate()
 
         return self
 
@@ -232,7 +307,9 @@ class Schema(FormattedStringMixin):
         | IntegerField
         | Integerlist
         | StringField
-        | Stringlist,
+        | Stringlist
+        | SchemaList
+        | MapField,
         /,
     ) -> typing_extensions.Self: ...
     @typing.overload
@@ -252,7 +329,9 @@ class Schema(FormattedStringMixin):
         | IntegerField
         | Integerlist
         | StringField
-        | Stringlist,
+        | Stringlist
+        | SchemaList
+        | MapField,
         /,
     ) -> typing_extensions.Self:
         """Add a schema, field, or group to this schema.
@@ -270,10 +349,13 @@ class Schema(FormattedStringMixin):
             Self for method chaining.
 
         Raises:
-            ValueError: If an item with the same name already exists, or if a group
-                contains schemas with conflicting names.
+            ValueError: If an item with the same name already exists, if a group
+                contains schemas with conflicting names, or if the schema is frozen.
 
         """
+        if self._frozen:
+            raise ValueError(f"Schema {self._name!r} is frozen")  # noqa: EM102, TRY003
+
         if isinstance(item, Schema):
             return self.__add_schema(item)
 
@@ -282,6 +364,210 @@ class Schema(FormattedStringMixin):
 
         return self.__add_field(item)
 
+    @property
+    def frozen(self) -> bool:
+        """Whether the schema is frozen, see `freeze`."""
+        return self._frozen
+
+    def freeze(self) -> typing_extensions.Self:
+        """Make this schema and all nested schemas immutable.
+
+        `add` raises afterwards, and the cached fingerprint, field index and compiled
+        validator are computed up front, so the schema can be used from several
+        threads without any of them rebuilding shared state. Freezing is permanent.
+
+        Returns:
+            Self for method chaining.
+
+        """
+        for node in self._mapping.values():
+            if isinstance(node, Schema):
+                node.freeze()
+            elif isinstance(node, SchemaList):
+                node.schema.freeze()
+            elif isinstance(node, MapField) and isinstance(node.value, Schema):
+                node.value.freeze()
+
+        self._frozen = True
+        for name in (
+            "fingerprint",
+            "_field_index",
+            "_field_paths",
+            "_compiled",
+            "_materializes",
+            "_config_layout",
+        ):
+            getattr(self, name)
+
+        return self
+
+    @functools.cached_property
+    def _field_index(self) -> dict[str, Field[typing.Any]]:
+        """Fields of this schema and all nested schemas by dotted path."""
+        index: dict[str, Field[typing.Any]] = {}
+
+        for key, node in self._mapping.items():
+            if isinstance(node, Schema):
+                for path, field in node._field_index.items():  # noqa: SLF001
+                    index[f"{key}.{path}"] = field
+            else:
+                index[key] = node
+
+        return index
+
+    @functools.cached_property
+    def _field_paths(self) -> list[str]:
+        return sorted(self._field_index)
+
+    def get_field(self, path: str, /) -> Field[typing.Any]:
+        """Return the field at a dotted path relative to this schema.
+
+        Lookups go through an index of the whole schema tree that is built on first
+        use and reset whenever this schema or a nested schema is modified.
+
+        Args:
+            path: Dotted path of the field, e.g. ``canary.weight``.
+
+        Returns:
+            The field at the path.
+
+        Raises:
+            KeyError: If there is no field at the path.
+
+        """
+        return self._field_index[path]
+
+    def iter_fields(self) -> Iterator[tuple[str, Field[typing.Any]]]:
+        """Iterate over all fields of this schema and its nested schemas.
+
+        Returns:
+            ``(dotted path, field)`` pairs in the order the fields were added.
+
+        """
+        return iter(self._field_index.items())
+
+    def find_fields(self, prefix: str, /) -> list[tuple[str, Field[typing.Any]]]:
+        """Return the fields at or below a dotted path prefix.
+
+        The prefix matches whole keys: ``canary`` matches ``canary.weight`` but not
+        ``canary_weight``. An empty prefix matches all fields.
+
+        Args:
+            prefix: Dotted path of a nested schema or field.
+
+        Returns:
+            ``(dotted path, field)`` pairs sorted by path.
+
+        """
+        index = self._field_index
+        paths = self._field_paths
+
+        if not prefix:
+            return [(path, index[path]) for path in paths]
+
+        matches = [(prefix, index[prefix])] if prefix in index else []
+        start = prefix + "."
+        for position in range(bisect.bisect_left(paths, start), len(paths)):
+            if not paths[position].startswith(start):
+                break
+            matches.append((paths[position], index[paths[position]]))
+
+        return matches
+
+    @functools.cached_property
+    def _compiled(self) -> Callable[[YamlDict], None]:
+        groups = tuple(self._groups)
+        validators: dict[str, Callable[[typing.Any], None]] = {}
+
+        for key, node in self._mapping.items():
+            if isinstance(node, Schema):
+                validators[key] = node._compiled  # noqa: SLF001
+            elif (
+                isinstance(node, (SchemaList, MapField))
+                or node._constraints  # noqa: SLF001
+                or getattr(node, "_item_constraints", None)
+                or node._materializes  # noqa: SLF001
+                or _validates_more(node)
+            ):
+                validators[key] = node.validate
+            else:
+                validators[key] = _valid
+
+        def validate(data: YamlDict, /) -> None:
+            for group in groups:
+                group(*data.keys())
+
+            for key, value in data.items():
+                validators[key](value)
+
+        return validate
+
+    def compile(self) -> Callable[[YamlDict], None]:
+        """Return a validator equivalent to `validate`, built once and cached.
+
+        The validator has the nodes of the whole schema tree resolved up front, which
+        pays off when validating many objects against the same schema, e.g. the items
+        of a `SchemaList`. It is rebuilt after this schema or a nested schema is
+        modified.
+
+        Returns:
+            A function that validates data, raising the same errors as `validate`.
+
+        """
+        return self._compiled
+
+    @functools.cached_property
+    def _materializes(self) -> bool:
+        return any(node._materializes for node in self._mapping.values())  # noqa: SLF001
+
+    @functools.cached_property
+    def _config_layout(self) -> ConfigLayout:
+        """Layout of the Config classes of this schema, keeping the generated ones.
+
+        Reset with the other cached data, so the classes of a modified schema are
+        dropped together with its old layout.
+        """
+        kinds: dict[str, tuple[str, ConfigLayout | None]] = {}
+        for key, node in self._mapping.items():
+            if isinstance(node, Schema):
+                kinds[key] = ("nested", node._config_layout)  # noqa: SLF001
+            elif isinstance(node, SchemaList):
+                kinds[key] = ("items", node.schema._config_layout)  # noqa: SLF001
+            elif isinstance(node, MapField) and isinstance(node.value, Schema):
+                kinds[key] = ("mapping", node.value._config_layout)  # noqa: SLF001
+            else:
+                kinds[key] = ("field", None)
+
+        return ConfigLayout(kinds, {})
+
+    def materialize(self, data: YamlDict, /) -> YamlDict:
+        """Return validated data with every value in its Config representation.
+
+        See `Field.materialize`, e.g. `MapField` values become read-only mappings.
+        Sections without such values are returned as they are, and only the
+        sections containing them are copied.
+
+        Args:
+            data: Data that passed `validate`.
+
+        Returns:
+            The data to build the Config object from.
+
+        """
+        if not self._materializes:
+            return data
+
+        materialized: YamlDict | None = None
+        for key, value in data.items():
+            node = self._mapping[key]
+            new_value = node.materialize(value)  # type: ignore[arg-type]
+            if new_value is not value:
+                if materialized is None:
+                    materialized = dict(data)
+                materialized[key] = new_value
+
+        return data if materialized is None else materialized
+
     def validate(self, data: YamlDict, /) -> None:
         """Validate data against this schema.
 
@@ -316,10 +602,124 @@ class Schema(FormattedStringMixin):
                 | Integerlist
                 | StringField
                 | Stringlist
+                | SchemaList
+                | MapField
             ) = self._mapping[key]
 
             schema_or_field.validate(value)  # type: ignore  # noqa: PGH003
 
+    def revalidate(self, data: YamlDict, previous: YamlDict, /) -> None:
+        """Validate data derived from data that already passed `validate`.
+
+        Sections and values that are the same object in `data` and `previous` are
+        known to be valid and skipped, so only the changed subtrees are validated.
+        Group checks run for every changed section.
+
+        Args:
+            data: The data to validate.
+            previous: Already validated data that `data` shares unchanged
+                sections with.
+
+        Raises:
+            ValidationError: If the data doesn't conform to the schema constraints.
+            KeyError: If unknown fields are present.
+
+        """
+        if data is previous:
+            return
+
+        for group in self._groups:
+            group(*data.keys())
+
+        for key, value in data.items():
+            node = self._mapping[key]
+            previous_value = previous.get(key)
+
+            if value is previous_value:
+                continue
+
+            if (
+                isinstance(node, Schema)
+                and isinstance(value, dict)
+                and isinstance(previous_value, dict)
+            ):
+                node.revalidate(value, previous_value)
+            else:
+                node.validate(value)  # type: ignore  # noqa: PGH003
+
+    def profile(self, data: YamlDict, /) -> ProfileReport:
+        """Validate data against this schema while timing every node.
+
+        Args:
+            data: A dictionary containing the data to validate.
+
+        Returns:
+            A report of the fields, constraints and groups ranked by time spent,
+            addressed by dotted path (e.g. ``deployment.canary.weight``), with call
+            counts and item counts for list fields.
+
+        Raises:
+            ValidationError: If the data doesn't conform to the schema constraints.
+            KeyError: If unknown fields are present.
+
+        """
+        profiler = Profiler()
+        profiler.observe(self, self._name).validate(data)
+
+        return profiler.report()
+
+    @functools.cached_property
+    def _json_object(self) -> dict[str, typing.Any]:
+        """JSON Schema of the data of this schema, for embedding in other schemas."""
+        schema: dict[str, typing.Any] = {
+            "title": self._name,
+            "description": self._description,
+            "type": "object",
+            "properties": {
+                key: (
+                    node._json_object  # noqa: SLF001
+                    if isinstance(node, Schema)
+                    else node.to_json_schema()
+                )
+                for key, node in self._mapping.items()
+            },
+            "additionalProperties": False,
+        }
+
+        groups = [
+            keywords
+            for group in sorted(self._groups, key=lambda group: group.fingerprint)
+            if (keywords := group.to_json_schema())
+        ]
+        if len(groups) == 1:
+            schema.update(groups[0])
+        elif groups:
+            schema["allOf"] = groups
+
+        return schema
+
+    @functools.cached_property
+    def _json_schema(self) -> dict[str, typing.Any]:
+        return {"$schema": json_schema_dialect, **self._json_object}
+
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        """Return a JSON Schema (draft 2020-12) of the data this schema validates.
+
+        Fields, constraints and groups are translated to their JSON Schema keywords,
+        see `Field.to_json_schema`, and unknown keys are rejected with
+        ``additionalProperties``. Constraints without an equivalent are left out,
+        so the JSON Schema may accept more than `validate` does, never less.
+
+        The result is cached until this schema or a nested schema is modified,
+        i.e. per fingerprint, so repeated calls return the same object. Don't
+        modify it, copy it with `copy.deepcopy` first.
+
+        Returns:
+            The JSON Schema, ready for `json.dump`.
+
+        """
+        return self._json_schema
+
     def to_formatted_string(self, indent: int = 0) -> str:
         """Convert the schema to a formatted string representation.
 
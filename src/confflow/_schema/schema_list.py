@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import functools
+import typing
+
+import typing_extensions
+
+from confflow._shared import digest, yaml_indent
+
+from .fields.constraint import ListMaxLength, ListMinLength, ValidationError
+from .fields.field import Field
+
+if typing.TYPE_CHECKING:
+    from confflow._shared import YamlDict
+
+    from .fields.constraint import Constraint
+    from .schema import Schema
+
+
+@typing.final
+class SchemaList(Field[list["YamlDict"]]):
+    """A list of objects that each match a nested schema.
+
+    Every item is validated with the validator compiled once by `Schema.compile`.
+
+    Args:
+        name: The name of the field.
+        schema: The schema every item must match. Its name is only used for
+            documentation.
+        *constraints: Constraints on the list as a whole.
+        description: A description of the field. Must not be empty.
+        default: The default value for the field.
+        min_length: Minimum number of items.
+        max_length: Maximum number of items.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str,
+        schema: Schema,
+        /,
+        *constraints: Constraint[list[YamlDict]],
+        description: str | None = None,
+        default: list[YamlDict] | None = None,
+        min_length: int | None = None,
+        max_length: int | None = None,
+    ) -> None:
+        all_constraints: list[Constraint[list[YamlDict]]] = list(constraints)
+        if min_length is not None:
+            all_constraints.append(ListMinLength[dict[str, typing.Any]](min_length))
+        if max_length is not None:
+            all_constraints.append(ListMaxLength[dict[str, typing.Any]](max_length))
+
+        super().__init__(
+            name,
+            *all_constraints,
+            description=description,
+            default=default,
+        )
+
+        self._dtype = f"list[{schema.name}]"
+        self._schema: Schema = schema
+        self._parents: list[Schema] = []
+        schema._parents.append(self)  # noqa: SLF001
+
+    @property
+    def schema(self) -> Schema:
+        return self._schema
+
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        """Structural fingerprint of the field including the item schema."""
+        return digest(
+            type(self).__module__,
+            type(self).__qualname__,
+            self._name,
+            repr(self._description),
+            repr(self._default),
+            *sorted(constraint.fingerprint for constraint in self._constraints),
+            "schema",
+            self._schema.fingerprint,
+        )
+
+    def _invalidate(self) -> None:
+        """Reset the fingerprint when the item schema is modified."""
+        self.__dict__.pop("fingerprint", None)
+
+        for parent in self._parents:
+            parent._invalidate()  # noqa: SLF001
+
+    @property
+    def _materializes(self) -> bool:
+        return self._schema._materializes  # noqa: SLF001
+
+    @typing_extensions.override
+    def materialize(self, value: list[YamlDict], /) -> typing.Any:
+        if not self._schema._materializes:  # noqa: SLF001
+            return value
+
+        return [self._schema.materialize(item) for item in value]
+
+    def _check_item(self, index: int, item: YamlDict, /) -> None:
+        if not isinstance(item, dict):
+            raise ValidationError(  # noqa: TRY003
+                f"Item {index} of {self._name!r} is not a mapping: `{item}`",  # noqa: EM102
+            )
+
+    @typing_extensions.override
+    def validate(self, value: list[YamlDict], /) -> None:
+        super().validate(value)
+
+        validate_item = self._schema.compile()
+        for index, item in enumerate(value):
+            self._check_item(index, item)
+            validate_item(item)
+
+    @typing_extensions.override
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        schema: dict[str, typing.Any] = {
+            "type": "array",
+            "items": self._schema._json_object,  # noqa: SLF001
+        }
+
+        return self._with_json_details(schema)
+
+    @typing_extensions.override
+    def to_formatted_string(self, indent: int = 0) -> str:
+        description: str = yaml_indent * indent + f"# {self._description}\n"
+        dtype: str = yaml_indent * indent + f"# type: {self._dtype}\n"
+        constraints: str = (
+            yaml_indent * indent
+            + "# constraints:\n"
+            + "".join(
+                [
+                    yaml_indent * indent
+                    + "#  - "
+                    + cnst.to_formatted_string(indent=indent + 1)
+                    + "\n"
+                    for cnst in self._constraints
+                ],
+            )
+            if self._constraints
+            else ""
+        )
+        item: str = (
+            yaml_indent * (indent + 1)
+            + "-\n"
+            + "\n".join(
+                node.to_formatted_string(indent + 2)
+                for node in self._schema._nodes  # noqa: SLF001
+            )
+        )
+
+        return (
+            description
+            + dtype
+            + constraints
+            + f"{yaml_indent * indent}{self.name}:\n"
+            + item
+        )
@@ -19,9 +19,40 @@ YamlDict: typing.TypeAlias = dict[str, YamlValue]
 
 yaml_indent: str = "  "
 
+json_schema_dialect: str = "https://json-schema.org/draft/2020-12/schema"
+
 
 def create_frame(description: str) -> str:
     border: str = "+" + "-" * (len(description) + 2) + "+"
     content = f"| {description} |"
 
     return f"{border}\n{content}\n{border}"
+
+
+def digest(*parts: str) -> str:
+    """Return a stable hex digest of the given string parts."""
+    import hashlib  # noqa: PLC0415
+
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def json_value(value: typing.Any) -> typing.Any:  # noqa: ANN401
+    """Return a YAML value as JSON data, e.g. for defaults in a JSON Schema.
+
+    Like `to_json`, dates are written as ISO 8601 strings and bytes as base64.
+    """
+    if isinstance(value, date):  # Also covers datetime
+        return value.isoformat()
+
+    if isinstance(value, bytes):
+        import base64  # noqa: PLC0415
+
+        return base64.b64encode(value).decode("ascii")
+
+    if isinstance(value, (list, tuple)):
+        return [json_value(item) for item in value]
+
+    if isinstance(value, dict):
+        return {key: json_value(item) for key, item in value.items()}
+
+    return value
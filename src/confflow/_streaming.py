@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import typing
+from collections.abc import Hashable
+
+import yaml
+
+from ._schema import Schema
+from ._schema.fields.constraint import ValidationError
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from ._include import _IncludeLoader
+    from ._schema.fields.field import Field
+    from ._schema.groups import Group
+    from ._shared import YamlDict, YamlValue
+
+    _Node: typing.TypeAlias = "Schema | Field[typing.Any]"
+    _Lookup: typing.TypeAlias = Callable[[typing.Any], "_Node | None"]
+
+_MAP_TAG: str = "tag:yaml.org,2002:map"
+_MERGE_TAG: str = "tag:yaml.org,2002:merge"
+
+
+@typing.final
+class StreamValidator:
+    """Validates a YAML document against schemas while it is being parsed.
+
+    Mappings that match a schema are walked event by event, so an unknown key or an
+    invalid value fails before the rest of the file is read. Only the value of one
+    field at a time is built and validated. Without `retain` it is dropped right
+    away, so memory is bounded by the largest field rather than by the file.
+
+    Anything other than a plain mapping where a schema is expected, e.g. an
+    anchored mapping or an alias, is built as a whole and validated with
+    `Schema.validate`. Merge keys (``<<``) are applied after the explicit keys of
+    their mapping, and group checks run once all keys of a mapping are known.
+
+    Args:
+        loader: Loader positioned at the start of the stream.
+        schemas: Top-level schemas by name, see `Manager`.
+        sections: If given, top-level sections not in it are skipped without being
+            built or validated.
+        retain: Whether to keep the validated data.
+
+    """
+
+    def __init__(
+        self,
+        loader: _IncludeLoader,
+        schemas: Mapping[str, Schema],
+        sections: frozenset[str] | None = None,
+        *,
+        retain: bool = False,
+    ) -> None:
+        self._loader: _IncludeLoader = loader
+        self._schemas: Mapping[str, Schema] = schemas
+        self._sections: frozenset[str] | None = sections
+        self._retain: bool = retain
+        self._mark: yaml.Mark | None = None
+
+    def _next(self) -> typing.Any:  # noqa: ANN401
+        return self._loader.get_event()  # type: ignore[no-untyped-call]
+
+    def _peek(self) -> typing.Any:  # noqa: ANN401
+        return self._loader.peek_event()  # type: ignore[no-untyped-call]
+
+    def _compose(self) -> yaml.Node:
+        return typing.cast("yaml.Node", self._loader.compose_node(None, None))  # type: ignore[arg-type]
+
+    def run(self) -> YamlDict:
+        """Validate the single document of the stream.
+
+        Returns:
+            The validated sections. Their values are None unless `retain` is set.
+
+        Raises:
+            ValidationError: If a value fails validation.
+            ValueError: If a top-level key isn't a schema name, or a group check
+                fails.
+            KeyError: If a key isn't part of its schema.
+            yaml.YAMLError: If the stream isn't a single valid YAML document.
+
+        """
+        try:
+            return self._document()
+        except (ValidationError, ValueError, KeyError) as error:
+            if self._mark is None:
+                raise
+
+            message = f"{self._loader.path}:{self._mark.line + 1}: {error}"
+            raise type(error)(message) from error
+
+    def _document(self) -> YamlDict:
+        loader = self._loader
+        self._next()  # StreamStartEvent
+        if loader.check_event(yaml.StreamEndEvent):
+            return {}
+
+        document = self._next()
+        if self._walkable():
+            data = self._mapping(self._top_level, ())
+        else:
+            data = self._built_sections(self._construct())
+        self._next()  # DocumentEndEvent
+
+        if not loader.check_event(yaml.StreamEndEvent):
+            raise yaml.composer.ComposerError(  # noqa: TRY003
+                "expected a single document in the stream",  # noqa: EM101
+                document.start_mark,
+                "but found another document",
+                self._next().start_mark,
+            )
+
+        return data
+
+    def _top_level(self, key: typing.Any) -> Schema | None:  # noqa: ANN401
+        if not isinstance(key, str) or key not in self._schemas:
+            raise ValueError(  # noqa: TRY003
+                f"Invalid keys found: {[key]}. "  # noqa: EM102
+                f"Valid schema names are: {sorted(self._schemas)}",
+            )
+
+        if self._sections is not None and key not in self._sections:
+            return None
+
+        return self._schemas[key]
+
+    def _built_sections(self, data: typing.Any) -> YamlDict:  # noqa: ANN401
+        """Validate a document that had to be built as a whole."""
+        if data is None:
+            return {}
+        if not isinstance(data, dict):
+            raise TypeError(f"Expected a mapping of sections, got {data!r}")  # noqa: EM102, TRY003
+
+        return self._entries(self._top_level, data.items(), {})
+
+    def _walkable(self) -> bool:
+        """Whether the next node is a plain mapping that can be walked."""
+        event = self._peek()
+
+        return (
+            isinstance(event, yaml.MappingStartEvent)
+            and event.anchor is None
+            and event.tag in (None, _MAP_TAG)
+        )
+
+    def _mapping(self, lookup: _Lookup, groups: Iterable[Group]) -> YamlDict:
+        """Walk a mapping, validating every value as soon as it is complete."""
+        loader = self._loader
+        start = self._next().start_mark
+        data: dict[typing.Any, typing.Any] = {}
+        merged: YamlDict = {}
+
+        while not loader.check_event(yaml.MappingEndEvent):
+            key_node = self._compose()
+            self._mark = key_node.start_mark
+
+            if key_node.tag == _MERGE_TAG:
+                merged.update(self._merged(self._construct(), start))
+                continue
+
+            key = loader.construct_object(key_node, deep=True)
+            if not isinstance(key, Hashable):
+                raise yaml.constructor.ConstructorError(  # noqa: TRY003
+                    "while constructing a mapping",  # noqa: EM101
+                    start,
+                    "found unhashable key",
+                    key_node.start_mark,
+                )
+
+            node = lookup(key)
+            if node is None:
+                self._skip()
+            elif isinstance(node, Schema) and self._walkable():
+                section = self._mapping(node._mapping.__getitem__, node._groups)  # noqa: SLF001
+                data[key] = section if self._retain else None
+            else:
+                value = self._construct()
+                node.validate(value)
+                data[key] = value if self._retain else None
+        self._next()  # MappingEndEvent
+
+        self._entries(lookup, merged.items(), data)
+        self._mark = start
+        for group in groups:
+            group(*data.keys())
+
+        return data
+
+    def _entries(
+        self,
+        lookup: _Lookup,
+        items: Iterable[tuple[typing.Any, YamlValue]],
+        data: dict[typing.Any, typing.Any],
+    ) -> YamlDict:
+        """Validate built values of keys that are not in data yet."""
+        for key, value in items:
+            if key in data or (node := lookup(key)) is None:
+                continue
+            node.validate(value)  # type: ignore[arg-type]
+            data[key] = value if self._retain else None
+
+        return data
+
+    @staticmethod
+    def _merged(value: YamlValue, start: yaml.Mark) -> YamlDict:
+        """Return the mapping a merge key stands for, earlier mappings winning."""
+        if isinstance(value, dict):
+            return value
+
+        if isinstance(value, list) and all(isinstance(item, dict) for item in value):
+            merged: YamlDict = {}
+            for item in reversed(value):
+                merged.update(item)  # type: ignore[arg-type]
+            return merged
+
+        raise yaml.constructor.ConstructorError(  # noqa: TRY003
+            "while constructing a mapping",  # noqa: EM101
+            start,
+            "expected a mapping or list of mappings for merging",
+            None,
+        )
+
+    def _construct(self) -> typing.Any:  # noqa: ANN401
+        """Build the next node, then forget it unless it is anchored."""
+        loader = self._loader
+        node = self._compose()
+        try:
+            return loader.construct_object(node, deep=True)
+        finally:
+            loader.constructed_objects = {}
+            loader.recursive_objects = {}
+
+    def _skip(self) -> None:
+        """Consume the next node without building it.
+
+        Anchored nodes inside are composed, so that later aliases still resolve.
+        """
+        depth = 0
+        while True:
+            event = self._peek()
+            if not isinstance(event, yaml.AliasEvent) and getattr(
+                event,
+                "anchor",
+                None,
+            ):
+                self._compose()
+            else:
+                self._next()
+                if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    depth += 1
+                elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    depth -= 1
+
+            if depth == 0:
+                return
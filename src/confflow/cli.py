@@ -0,0 +1,326 @@
+"""Command line interface, installed as the ``confflow`` script.
+
+Every subcommand takes the `Manager` to use as an import path of the form
+``package.module:attribute``, e.g. ``myapp.settings:manager``::
+
+    confflow validate myapp.settings:manager config/prod config/staging --format junit
+    confflow template myapp.settings:manager ./templates
+    confflow diff myapp.settings:manager config/prod config/staging
+
+Only the standard library modules a subcommand needs are imported, and only when
+it runs, so the script starts quickly in pre-commit hooks.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import typing
+from pathlib import Path
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from confflow._config import Config
+    from confflow.manager import Manager
+
+_FORMATS: tuple[str, ...] = ("text", "json", "junit")
+
+# The manager of a worker process, imported once by `_initialize_worker`
+_worker: dict[str, Manager] = {}
+
+
+class Result(typing.NamedTuple):
+    """Outcome of validating one file or directory.
+
+    Attributes:
+        path: The validated path as given on the command line.
+        error: Description of the error, None if the configuration is valid.
+        seconds: Time it took to load and validate the configuration.
+
+    """
+
+    path: str
+    error: str | None
+    seconds: float
+
+
+def import_manager(reference: str, /) -> Manager:
+    """Import a `Manager` from a ``package.module:attribute`` path.
+
+    The current working directory is searched first, like ``python -m`` does.
+
+    Args:
+        reference: Module and attribute separated by a colon. The attribute may be
+            a dotted path, e.g. ``myapp.settings:Settings.manager``.
+
+    Raises:
+        ValueError: If the reference is malformed or doesn't point to a `Manager`.
+        ImportError: If the module can't be imported.
+
+    """
+    import importlib  # noqa: PLC0415
+
+    from confflow.manager import Manager  # noqa: PLC0415
+
+    module_name, _, attribute = reference.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(  # noqa: TRY003
+            f"Invalid manager reference {reference!r}, expected 'module:attribute'",  # noqa: EM102
+        )
+
+    cwd = str(Path.cwd())
+    if cwd not in sys.path:
+        sys.path.insert(0, cwd)
+
+    target: object = importlib.import_module(module_name)
+    try:
+        for name in attribute.split("."):
+            target = getattr(target, name)
+    except AttributeError:
+        raise ValueError(f"{reference!r} doesn't exist") from None  # noqa: EM102, TRY003
+
+    if not isinstance(target, Manager):
+        raise ValueError(  # noqa: TRY003, TRY004
+            f"{reference!r} is a {type(target).__name__}, not a Manager",  # noqa: EM102
+        )
+
+    return target
+
+
+def _validate(manager: Manager, path: str) -> Result:
+    import time  # noqa: PLC0415
+
+    start = time.perf_counter()
+    try:
+        manager.load(path, mode="view")
+    except Exception as error:  # noqa: BLE001
+        message = f"{type(error).__name__}: {error}"
+        return Result(path, message, time.perf_counter() - start)
+
+    return Result(path, None, time.perf_counter() - start)
+
+
+def _initialize_worker(reference: str) -> None:
+    _worker["manager"] = import_manager(reference)
+
+
+def _validate_in_worker(path: str) -> Result:
+    return _validate(_worker["manager"], path)
+
+
+def validate_paths(reference: str, paths: Sequence[str], jobs: int) -> list[Result]:
+    """Validate every file or directory in `paths` independently.
+
+    With more than one job, the paths are spread over worker processes that each
+    import the manager once.
+
+    Args:
+        reference: Import path of the manager, see `import_manager`.
+        paths: Files or directories, each loaded like `Manager.load` does.
+        jobs: Maximum number of worker processes.
+
+    Returns:
+        One result per path, in the order given.
+
+    """
+    jobs = min(jobs, len(paths))
+    if jobs <= 1:
+        manager = import_manager(reference)
+        return [_validate(manager, path) for path in paths]
+
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    # Fail early, in this process, if the manager can't be imported
+    import_manager(reference)
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_initialize_worker,
+        initargs=(reference,),
+    ) as executor:
+        return list(executor.map(_validate_in_worker, paths))
+
+
+def _format_text(results: Sequence[Result]) -> str:
+    return "".join(
+        f"OK   {result.path}\n"
+        if result.error is None
+        else f"FAIL {result.path}: {result.error}\n"
+        for result in results
+    )
+
+
+def _format_json(results: Sequence[Result]) -> str:
+    import json  # noqa: PLC0415
+
+    return (
+        json.dumps(
+            {
+                "valid": all(result.error is None for result in results),
+                "results": [
+                    {
+                        "path": result.path,
+                        "valid": result.error is None,
+                        "error": result.error,
+                        "seconds": result.seconds,
+                    }
+                    for result in results
+                ],
+            },
+            indent=2,
+        )
+        + "\n"
+    )
+
+
+def _format_junit(results: Sequence[Result]) -> str:
+    from xml.etree import ElementTree as ET  # noqa: PLC0415
+
+    suite = ET.Element(
+        "testsuite",
+        name="confflow",
+        tests=str(len(results)),
+        failures=str(sum(result.error is not None for result in results)),
+        errors="0",
+        time=f"{sum(result.seconds for result in results):.6f}",
+    )
+    for result in results:
+        case = ET.SubElement(
+            suite,
+            "testcase",
+            classname="confflow.validate",
+            name=result.path,
+            time=f"{result.seconds:.6f}",
+        )
+        if result.error is not None:
+            failure = ET.SubElement(case, "failure", message=result.error)
+            failure.text = result.error
+
+    return ET.tostring(suite, encoding="unicode", xml_declaration=True) + "\n"
+
+
+def _command_validate(args: argparse.Namespace) -> int:
+    results = validate_paths(args.manager, args.paths, args.jobs)
+    formatter = {
+        "text": _format_text,
+        "json": _format_json,
+        "junit": _format_junit,
+    }[args.format]
+
+    output = formatter(results)
+    if args.output is None:
+        sys.stdout.write(output)
+    else:
+        Path(args.output).write_text(output, encoding="utf-8")
+
+    return 0 if all(result.error is None for result in results) else 1
+
+
+def _command_template(args: argparse.Namespace) -> int:
+    import_manager(args.manager).create_templates(args.directory)
+
+    return 0
+
+
+def _load_or_report(manager: Manager, path: str) -> Config | None:
+    try:
+        return manager.load(path, mode="view")
+    except Exception as error:  # noqa: BLE001
+        sys.stderr.write(f"confflow: error: {path}: {type(error).__name__}: {error}\n")
+        return None
+
+
+def _command_diff(args: argparse.Namespace) -> int:
+    manager = import_manager(args.manager)
+    old = _load_or_report(manager, args.old)
+    new = _load_or_report(manager, args.new)
+    if old is None or new is None:
+        # Not 1, which means the configurations differ
+        return 2
+
+    changes = manager.diff(old, new)
+
+    if args.format == "json":
+        import json  # noqa: PLC0415
+
+        from confflow._config import _json_default  # noqa: PLC0415
+
+        sys.stdout.write(
+            json.dumps(
+                [change._asdict() for change in changes],
+                indent=2,
+                default=_json_default,
+            )
+            + "\n",
+        )
+    else:
+        for change in changes:
+            sys.stdout.write(f"{change.path}: {change.old!r} -> {change.new!r}\n")
+
+    # Like diff(1): 1 if the configurations differ
+    return 1 if changes else 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="confflow",
+        description="Validate, document and compare YAML configurations.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser(
+        "validate",
+        help="validate configuration files or directories",
+    )
+    validate.add_argument("manager", help="import path of the Manager, module:attr")
+    validate.add_argument("paths", nargs="+", help="files or directories to validate")
+    validate.add_argument("--format", choices=_FORMATS, default="text")
+    validate.add_argument("--output", help="write the results to this file")
+    validate.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    validate.set_defaults(handler=_command_validate)
+
+    template = commands.add_parser("template", help="write configuration templates")
+    template.add_argument("manager", help="import path of the Manager, module:attr")
+    template.add_argument("directory", help="directory to write the templates to")
+    template.set_defaults(handler=_command_template)
+
+    diff = commands.add_parser("diff", help="list the changes between configurations")
+    diff.add_argument("manager", help="import path of the Manager, module:attr")
+    diff.add_argument("old", help="file or directory of the old configuration")
+    diff.add_argument("new", help="file or directory of the new configuration")
+    diff.add_argument("--format", choices=("text", "json"), default="text")
+    diff.set_defaults(handler=_command_diff)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Args:
+        argv: Arguments without the program name, `sys.argv` by default.
+
+    Returns:
+        The exit status: 0 on success, 1 if a configuration is invalid or, for
+        ``diff``, if the configurations differ, 2 on usage errors and, for
+        ``diff``, if a configuration can't be loaded.
+
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    try:
+        return typing.cast("int", args.handler(args))
+    except (ImportError, ValueError) as error:
+        parser.exit(2, f"confflow: error: {error}\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
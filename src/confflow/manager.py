@@ -1,16 +1,37 @@
 from __future__ import annotations
 
+import _thread
+import time
 import typing
-from pathlib import Path
 
-import yaml
+from ._config import Config, ConfigLayout, ConfigView, LazyConfig, dict_to_dataclass
+from ._interpolation import resolve_references
+from ._overrides import OverrideIndex, apply_overrides, deep_merge
+from ._schema.fields.constraint import ValidationError
+from ._schema.fields.field import compact_buffers
+from ._shared import digest, json_schema_dialect
 
-from ._config import Config, dict_to_dataclass
+_SNAPSHOT_MAGIC: bytes = b"CONFFLOW-SNAPSHOT-1\n"
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterable, Iterator, Mapping
+    from pathlib import Path
+
+    from confflow._cache import CacheInfo, ValidationCache
+    from confflow._config import ConfigMode
+    from confflow._diff import Change
+    from confflow._include import Includes
+    from confflow._instrumentation import Instrumentation
+    from confflow._profile import ProfileReport
     from confflow._schema import Schema
+    from confflow._schema.fields.field import Field
     from confflow._shared import YamlDict
 
+    _SectionValidator: typing.TypeAlias = Callable[
+        [Schema, YamlDict, Callable[[YamlDict], None] | None],
+        bool,
+    ]
+
 
 @typing.final
 class Manager:
@@ -23,20 +44,223 @@ class Manager:
     Args:
         *schemas: Variable number of Schema objects to manage. At least one schema
             is required and duplicate schemas are not allowed.
+        validation_cache_size: Maximum number of validated sections to remember.
+            When positive, a section whose data is identical to one that already
+            passed validation skips `Schema.validate`. Disabled by default.
+        env_prefix: Prefix of the environment variables that override fields, see
+            `loads`.
+        include_root: If given, ``!include`` tags in files read by `load` may only
+            reference files inside this directory.
+        concurrent: Whether the manager is shared between threads. The schemas are
+            frozen, see `Schema.freeze`, so they can't be modified while another
+            thread validates against them. This freezes the passed `Schema` objects
+            themselves, permanently, also for other managers using them. Publish
+            configurations with `reload` or `publish` and read them with `current`.
 
     Raises:
-        ValueError: If no schemas are provided or if duplicate schemas are detected.
+        ValueError: If no schemas are provided, if structurally identical schemas are
+            given more than once, or if two schemas share a name.
 
     """
 
-    def __init__(self, *schemas: Schema) -> None:
+    def __init__(
+        self,
+        *schemas: Schema,
+        validation_cache_size: int = 0,
+        env_prefix: str = "CONFFLOW",
+        include_root: str | Path | None = None,
+        concurrent: bool = False,
+    ) -> None:
         if not schemas:
             raise ValueError("At least one schema is required")  # noqa: EM101, TRY003
 
-        if len(schemas) != len(set(schemas)):
-            raise ValueError("Duplicate schemas are not allowed")  # noqa: EM101, TRY003
+        # Identical schemas share their name, so fingerprints (and hashlib) are only
+        # needed to tell the two errors apart
+        if len({schema.name for schema in schemas}) != len(schemas):
+            if len({schema.fingerprint for schema in schemas}) != len(schemas):
+                raise ValueError("Duplicate schemas are not allowed")  # noqa: EM101, TRY003
+
+            raise ValueError("Schema names must be unique")  # noqa: EM101, TRY003
 
         self._schemas: dict[str, Schema] = {schema.name: schema for schema in schemas}
+        self._validation_cache: ValidationCache | None = None
+        if validation_cache_size > 0:
+            from ._cache import ValidationCache  # noqa: PLC0415
+
+            self._validation_cache = ValidationCache(validation_cache_size)
+        self._instrumentations: list[Instrumentation] = []
+        self._env_prefix: str = env_prefix
+        self._override_index: tuple[str, OverrideIndex] | None = None
+        self._json_schema: tuple[str, dict[str, typing.Any]] | None = None
+        self._config_layout: tuple[tuple[ConfigLayout, ...], ConfigLayout] | None = None
+        self._include_root: str | Path | None = include_root
+        self._concurrent: bool = concurrent
+        self._current: Config | None = None
+        # Only taken by writers, reading `current` is a plain attribute access.
+        # `_thread` is built in, unlike `threading` it costs no import at start-up
+        self._publish_lock: _thread.LockType = _thread.allocate_lock()
+
+        if concurrent:
+            for schema in schemas:
+                schema.freeze()
+
+    @property
+    def concurrent(self) -> bool:
+        """Whether the manager was created for use from several threads."""
+        return self._concurrent
+
+    @property
+    def current(self) -> Config:
+        """The configuration last published with `publish` or `reload`.
+
+        Reading it takes no lock. Publishing replaces the reference in a single
+        assignment, so readers get either the previous or the new Config object,
+        never a partially updated one. Config objects are read-only and can be
+        shared between threads.
+
+        Raises:
+            ValueError: If no configuration was published yet.
+
+        """
+        config = self._current
+        if config is None:
+            raise ValueError("No configuration has been published")  # noqa: EM101, TRY003
+
+        return config
+
+    def publish(self, config: Config, /) -> Config | None:
+        """Make a configuration the `current` one.
+
+        Args:
+            config: The configuration to publish, e.g. from `loads`.
+
+        Returns:
+            The previously published configuration, or None.
+
+        """
+        with self._publish_lock:
+            previous, self._current = self._current, config
+
+        return previous
+
+    def reload(
+        self,
+        *filepaths: str | Path,
+        mode: ConfigMode = "eager",
+        overrides: Iterable[str] = (),
+        environ: Mapping[str, str] | None = None,
+        interpolate: bool = False,
+    ) -> Config:
+        """Load configuration files and publish the result as `current`.
+
+        Reloads are serialized, so a slow reload can't overwrite the result of a
+        later one. Readers are never blocked. If loading fails, the error is raised
+        and `current` stays unchanged.
+
+        Args:
+            *filepaths: Files or a directory to load, see `load`.
+            mode: How the Config object is built, see `loads`.
+            overrides: ``key.path=value`` strings, see `loads`.
+            environ: Environment to read override variables from, see `loads`.
+            interpolate: Whether to resolve ``${...}`` references, see `loads`.
+
+        Returns:
+            Config: The newly published configuration.
+
+        Raises:
+            ValueError: If the configuration fails validation, see `load`.
+            FileNotFoundError: If any specified file path doesn't exist.
+            yaml.YAMLError: If any file contains invalid YAML.
+
+        """
+        with self._publish_lock:
+            config = self.load(
+                *filepaths,
+                mode=mode,
+                overrides=overrides,
+                environ=environ,
+                interpolate=interpolate,
+            )
+            self._current = config
+
+        return config
+
+    def add_instrumentation(self, instrumentation: Instrumentation, /) -> None:
+        """Register an instrumentation that receives timings and counters.
+
+        Args:
+            instrumentation: The instrumentation to notify on every load.
+
+        """
+        self._instrumentations.append(instrumentation)
+
+    def remove_instrumentation(self, instrumentation: Instrumentation, /) -> None:
+        """Unregister a previously added instrumentation.
+
+        Raises:
+            ValueError: If the instrumentation is not registered.
+
+        """
+        self._instrumentations.remove(instrumentation)
+
+    def _recorder(self) -> _Recorder | _NoRecorder:
+        """Return a recorder for one load, a no-op one without instrumentations."""
+        if self._instrumentations:
+            return _Recorder(self._instrumentations)
+
+        return _NoRecorder()
+
+    @property
+    def fingerprint(self) -> str:
+        """Structural fingerprint of all registered schemas.
+
+        Returns:
+            A hex digest that is stable across processes.
+
+        """
+        return digest(*sorted(schema.fingerprint for schema in self._schemas.values()))
+
+    def get_field(self, path: str, /) -> Field[typing.Any]:
+        """Return the field at a dotted path, see `Schema.get_field`.
+
+        Args:
+            path: Dotted path of the field including the schema name, e.g.
+                ``deployment.canary.weight``.
+
+        Raises:
+            KeyError: If there is no field at the path.
+
+        """
+        name, _, rest = path.partition(".")
+
+        return self._schemas[name].get_field(rest)
+
+    def iter_fields(self) -> Iterator[tuple[str, Field[typing.Any]]]:
+        """Iterate over the fields of all schemas as ``(dotted path, field)`` pairs."""
+        for name, schema in self._schemas.items():
+            for path, field in schema.iter_fields():
+                yield f"{name}.{path}", field
+
+    def find_fields(self, prefix: str, /) -> list[tuple[str, Field[typing.Any]]]:
+        """Return the fields at or below a dotted path prefix, see `Schema.find_fields`.
+
+        Args:
+            prefix: Dotted path starting with a schema name. An empty prefix matches
+                all fields.
+
+        Returns:
+            ``(dotted path, field)`` pairs sorted by path.
+
+        """
+        name, _, rest = prefix.partition(".")
+        names = sorted(self._schemas) if not prefix else [name]
+
+        return [
+            (f"{schema_name}.{path}", field)
+            for schema_name in names
+            if schema_name in self._schemas
+            for path, field in self._schemas[schema_name].find_fields(rest)
+        ]
 
     def validate(self, data: YamlDict, /) -> None:
         """Validate configuration data against all registered schemas.
@@ -53,8 +277,16 @@ class Manager:
                 or if the data fails schema validation.
 
         """
+        self._check_keys(data)
+
+        recorder = self._recorder()
+        for key in data:
+            recorder.section(key, self._schemas[key], data[key], self._validate_section)  # type: ignore  # noqa: PGH003
+
+    def _check_keys(self, keys: Iterable[str], /) -> None:
+        """Check that every top-level key of the data names a schema."""
         names: set[str] = set(self._schemas.keys())
-        keys: set[str] = set(data.keys())
+        keys = set(keys)
 
         if invalid := keys - names:
             raise ValueError(  # noqa: TRY003
@@ -62,28 +294,281 @@ class Manager:
                 f"Valid schema names are: {sorted(names)}",
             )
 
-        for key in data:
-            self._schemas[key].validate(data[key])  # type: ignore  # noqa: PGH003
+    def profile(self, data: YamlDict, /) -> ProfileReport:
+        """Validate configuration data while timing every field, constraint and group.
+
+        The validation cache is bypassed so that every node is actually evaluated.
+
+        Args:
+            data: Dictionary containing configuration data to validate.
+
+        Returns:
+            A report of the slowest nodes across all schemas, addressed by dotted
+            path, see `Schema.profile`.
+
+        Raises:
+            ValueError: If invalid keys are found or the data fails validation.
+
+        """
+        from ._profile import Profiler  # noqa: PLC0415
+
+        self._check_keys(data)
+
+        profiler = Profiler()
+        for key, value in data.items():
+            profiler.observe(self._schemas[key], key).validate(value)  # type: ignore  # noqa: PGH003
+
+        return profiler.report()
+
+    def _validate_section(
+        self,
+        schema: Schema,
+        data: YamlDict,
+        validate: Callable[[YamlDict], None] | None = None,
+    ) -> bool:
+        """Validate one top-level section, returning False on a cache hit.
+
+        `validate` replaces `Schema.validate`, e.g. with a walk that counts the
+        evaluations.
+        """
+        if self._validation_cache is None:
+            (schema.validate if validate is None else validate)(data)
+            return True
+
+        return self._validation_cache.validate(schema, data, validate)
+
+    def validation_cache_info(self) -> CacheInfo:
+        """Return hit/miss statistics of the validation cache.
+
+        Returns:
+            CacheInfo: Named tuple of ``hits``, ``misses``, ``maxsize`` and
+                ``currsize``.
+
+        Raises:
+            ValueError: If the manager was created without a validation cache.
+
+        """
+        if self._validation_cache is None:
+            raise ValueError("Validation cache is disabled")  # noqa: EM101, TRY003
+
+        return self._validation_cache.info()
+
+    def clear_validation_cache(self) -> None:
+        """Remove all entries and statistics from the validation cache, if enabled."""
+        if self._validation_cache is not None:
+            self._validation_cache.clear()
 
-    def loads(self, data: YamlDict) -> Config:
+    def loads(  # noqa: PLR0913
+        self,
+        data: YamlDict,
+        *,
+        mode: ConfigMode = "eager",
+        overrides: Iterable[str] = (),
+        environ: Mapping[str, str] | None = None,
+        interpolate: bool = False,
+        only: Collection[str] | None = None,
+    ) -> Config:
         """Load and validate configuration data from a dictionary.
 
-        Validates the provided data against all schemas and converts it to a
-        frozen dataclass Config object.
+        Applies overrides, validates the result against all schemas and converts it
+        to a frozen Config object.
+
+        Overrides replace single fields and are parsed according to the field type,
+        see `Field.parse`. Environment variables are named after the dotted path of
+        the field, upper-cased, with ``__`` as separator and ``-`` replaced by ``_``:
+        ``CONFFLOW__DEPLOYMENT__CANARY__WEIGHT=0.2`` is equivalent to
+        ``deployment.canary.weight=0.2``. Explicit `overrides` take precedence over
+        `environ`. The data passed in is never modified.
+
+        With `interpolate`, string values may reference other fields by their
+        absolute dotted path, e.g. ``"https://${deployment.region}.example.com"``.
+        References are resolved after the overrides are applied, see
+        `resolve_references`; ``$${...}`` is kept as a literal ``${...}``.
+
+        With `only`, the Config object contains just the requested sections. The
+        other sections are neither validated nor materialized, they are dropped
+        after the overrides and references are resolved, so references into them
+        still work. Top-level keys that don't name a schema are still an error.
 
         Args:
             data: Dictionary containing configuration data to load.
+            mode: How the Config object is built. ``"eager"`` converts the whole
+                data into nested frozen dataclasses up front. ``"lazy"`` wraps the
+                data and only builds nested sections when they are first accessed,
+                so the cost is proportional to what is actually read. ``"view"``
+                returns a read-only `Mapping` over the data that exposes lists as
+                tuples and copies nothing. In lazy and view mode the data is not
+                copied and must not be mutated afterwards.
+            overrides: ``key.path=value`` strings, applied in order.
+            environ: Environment to read override variables from, typically
+                `os.environ`. Only variables starting with the manager's
+                `env_prefix` followed by ``__`` are considered.
+            interpolate: Whether to resolve ``${...}`` references in string values.
+            only: Names of the schemas to load, all of them by default.
 
         Returns:
-            Config: A frozen dataclass containing the validated configuration.
+            Config: A frozen object containing the validated configuration.
 
         Raises:
-            ValueError: If the data fails validation.
+            ValueError: If an override or reference is invalid, the data fails
+                validation, `mode` is unknown or `only` names an unknown schema.
+
+        """
+        sections = self._requested(only)
+        recorder = self._recorder()
+
+        if overrides or environ:
+            data = self._apply_overrides(data, overrides, environ)
+            recorder.phase("override")
+        if interpolate:
+            data = resolve_references(data, self.get_field)
+            recorder.phase("interpolate")
+        if sections is not None:
+            self._check_keys(data)
+            data = _select(data, sections)
+        with compact_buffers():
+            self.validate(data)
+            recorder.phase("validate")
+            config = self._materialize(data, mode)
+            recorder.phase("materialize")
+
+        return config
+
+    def _requested(self, only: Collection[str] | None) -> frozenset[str] | None:
+        """Check the schema names passed as `only` to `loads` or `load`."""
+        if only is None:
+            return None
+
+        sections = frozenset(only)
+        if unknown := sections - self._schemas.keys():
+            raise ValueError(  # noqa: TRY003
+                f"Unknown schemas requested: {sorted(unknown)}. "  # noqa: EM102
+                f"Valid schema names are: {sorted(self._schemas)}",
+            )
+
+        return sections
+
+    def _apply_overrides(
+        self,
+        data: YamlDict,
+        overrides: Iterable[str],
+        environ: Mapping[str, str] | None,
+    ) -> YamlDict:
+        fingerprint = self.fingerprint
+        if self._override_index is None or self._override_index[0] != fingerprint:
+            index = OverrideIndex(dict(self.iter_fields()), self._env_prefix)
+            self._override_index = (fingerprint, index)
+
+        assignments = self._override_index[1].resolve(overrides, environ)
 
+        return apply_overrides(data, assignments)
+
+    def _materialize(
+        self,
+        data: YamlDict,
+        mode: ConfigMode,
+        memo: dict[tuple[int, str], tuple[typing.Any, Config]] | None = None,
+    ) -> Config:
+        data = {
+            key: self._schemas[key].materialize(section)  # type: ignore[arg-type]
+            for key, section in data.items()
+        }
+
+        if mode == "eager":
+            return dict_to_dataclass(
+                name="Config",
+                data=data,
+                frozen=True,
+                memo=memo,
+                layout=self._layout(),
+            )
+
+        if mode == "lazy":
+            return typing.cast("Config", LazyConfig("Config", data))
+
+        if mode == "view":
+            return typing.cast("Config", ConfigView("Config", data))
+
+        raise ValueError(f"Unknown config mode: {mode!r}")  # noqa: EM102, TRY003
+
+    def _layout(self) -> ConfigLayout:
+        """Layout of the top-level Config class, rebuilt when a schema changes.
+
+        The layouts of the schemas are dropped by `Schema._invalidate` when they
+        change, so comparing their identity is enough; unlike `fingerprint` it
+        doesn't hash the schemas (or import hashlib) on every load.
         """
-        self.validate(data)
+        layouts = tuple(
+            schema._config_layout  # noqa: SLF001
+            for schema in self._schemas.values()
+        )
+        if self._config_layout is None or any(
+            layout is not cached
+            for layout, cached in zip(layouts, self._config_layout[0], strict=True)
+        ):
+            kinds: dict[str, tuple[str, ConfigLayout | None]] = {
+                name: ("nested", layout)
+                for name, layout in zip(self._schemas, layouts, strict=True)
+            }
+            self._config_layout = (layouts, ConfigLayout(kinds, {}))
+
+        return self._config_layout[1]
+
+    def diff(self, old: Config, new: Config, /) -> list[Change]:
+        """Return the fields that differ between two configurations.
+
+        Both configurations are walked along the schemas, in any combination of
+        modes. Subtrees that are the same object in both are skipped without being
+        compared, and a section present in only one of them is reported as a single
+        change instead of one change per field.
 
-        return dict_to_dataclass(name="Config", data=data, frozen=True)
+        Args:
+            old: The previous configuration.
+            new: The current configuration.
+
+        Returns:
+            One `Change` of ``(path, old, new)`` per changed field or added/removed
+            section, in schema order. Empty if the configurations are equal.
+
+        """
+        from ._diff import diff_mapping  # noqa: PLC0415
+
+        changes: list[Change] = []
+        if old is new:
+            return changes
+
+        diff_mapping(self._schemas, old, new, "", changes)
+
+        return changes
+
+    def to_json_schema(self) -> dict[str, typing.Any]:
+        """Return a JSON Schema (draft 2020-12) of the configurations of this manager.
+
+        Every registered schema is a property, see `Schema.to_json_schema`, and any
+        other top-level key is rejected. Useful for editor autocompletion of
+        configuration files and for validating them in other components.
+
+        The result is cached per `fingerprint` of the schemas, so repeated calls
+        return the same object. Don't modify it, copy it with `copy.deepcopy` first.
+
+        Returns:
+            The JSON Schema, ready for `json.dump`.
+
+        """
+        fingerprint = self.fingerprint
+        if self._json_schema is None or self._json_schema[0] != fingerprint:
+            schema: dict[str, typing.Any] = {
+                "$schema": json_schema_dialect,
+                "type": "object",
+                "properties": {
+                    name: schema._json_object  # noqa: SLF001
+                    for name, schema in self._schemas.items()
+                },
+                "additionalProperties": False,
+            }
+            self._json_schema = (fingerprint, schema)
+
+        return self._json_schema[1]
 
     def create_templates(self, directory: str | Path, /) -> None:
         """Create individual template YAML files for each schema in a directory.
@@ -97,6 +582,8 @@ class Manager:
                 doesn't exist.
 
         """
+        from pathlib import Path  # noqa: PLC0415
+
         dir_path = Path(directory)
         dir_path.mkdir(parents=True, exist_ok=True)
 
@@ -107,9 +594,15 @@ class Manager:
                 encoding="utf-8",
             )
 
-    def load(
+    def load(  # noqa: PLR0913
         self,
         *filepaths: str | Path,
+        mode: ConfigMode = "eager",
+        overrides: Iterable[str] = (),
+        environ: Mapping[str, str] | None = None,
+        interpolate: bool = False,
+        only: Collection[str] | None = None,
+        streaming: bool = False,
     ) -> Config:
         """Load and merge configuration from multiple YAML files.
 
@@ -120,42 +613,467 @@ class Manager:
         If a single argument is provided and it's a directory, all files ending
         with .yml in that directory will be loaded (non-recursively).
 
+        Files may include other YAML files with an ``!include`` tag, e.g.
+        ``tls: !include shared/tls.yml``, relative to the including file. Every
+        included file is parsed once per load, no matter how often it is referenced,
+        and validation errors in included values name the file they came from.
+
+        With `only`, just the requested sections are validated and materialized,
+        see `loads`. Files whose top-level keys, found by a quick scan of the text,
+        include none of the requested sections aren't even parsed. Unless
+        `interpolate` is set, as references may point into any file.
+
+        With `streaming`, every file is validated while it is parsed, see
+        `validate_stream`, and loading stops at the first violation. Each file must
+        then be valid on its own, even in sections a later file replaces.
+
         Args:
             *filepaths: One or more file paths (str or Path) to load configuration
                 from. If a single directory path is provided, all .yml files in
                 that directory are loaded.
+            mode: How the Config object is built, see `loads`.
+            overrides: ``key.path=value`` strings applied to the merged data, see
+                `loads`.
+            environ: Environment to read override variables from, see `loads`.
+            interpolate: Whether to resolve ``${...}`` references, see `loads`.
+            only: Names of the schemas to load, all of them by default.
+            streaming: Whether to validate the files while parsing them.
 
         Returns:
-            Config: A frozen dataclass containing the validated merged configuration.
+            Config: A frozen object containing the validated merged configuration.
 
         Raises:
-            ValueError: If no filepaths are provided, or if the merged data fails
-                validation.
+            ValueError: If no filepaths are provided, if the merged data fails
+                validation, if includes form a cycle or if an include is outside of
+                the manager's `include_root`, if `only` names an unknown schema, or
+                if `streaming` is combined with overrides or interpolation.
             FileNotFoundError: If any specified file path doesn't exist.
             yaml.YAMLError: If any file contains invalid YAML.
 
         """
-        if not filepaths:
-            raise ValueError("At least one filepath is required")  # noqa: EM101, TRY003
+        sections = self._requested(only)
 
-        paths_to_load: list[str | Path] = list(filepaths)
+        if streaming:
+            if overrides or environ or interpolate:
+                raise ValueError(  # noqa: TRY003
+                    "Streaming can't be combined with overrides or interpolation",  # noqa: EM101
+                )
 
-        if len(filepaths) == 1:
-            path = Path(filepaths[0])
-            if path.is_dir():
-                # Load all .yml files from directory
-                paths_to_load = sorted(path.glob("*.yml"))
-                if not paths_to_load:
-                    raise ValueError(f"No .yml files found in directory: {path}")  # noqa: EM102, TRY003
+            with compact_buffers():
+                data = self._stream(filepaths, sections, retain=True)
+                recorder = self._recorder()
+                config = self._materialize(data, mode)
+                recorder.phase("materialize")
 
-        merged_data: YamlDict = {}
+            return config
+
+        merged_data, includes = self._read(
+            filepaths,
+            None if interpolate else sections,
+        )
 
-        for filepath in paths_to_load:
-            data = yaml.safe_load(
-                Path(filepath).read_text(encoding="utf-8"),
+        try:
+            return self.loads(
+                merged_data,
+                mode=mode,
+                overrides=overrides,
+                environ=environ,
+                interpolate=interpolate,
+                only=sections,
             )
+        except (ValidationError, ValueError, KeyError) as error:
+            if not includes.included:
+                raise
 
-            if data:
+            if overrides or environ:
+                merged_data = self._apply_overrides(merged_data, overrides, environ)
+            if interpolate:
+                merged_data = resolve_references(merged_data, self.get_field)
+            if sections is not None:
+                merged_data = _select(merged_data, sections)
+            origin = includes.origin(self._schemas, merged_data)
+            if origin is None:
+                raise
+
+            message = f"{origin[0]}: {error} (included from {origin[1]})"
+            raise type(error)(message) from error
+
+    def validate_stream(
+        self,
+        *filepaths: str | Path,
+        only: Collection[str] | None = None,
+    ) -> None:
+        """Validate configuration files while they are parsed, without loading them.
+
+        Files are read in chunks and validated from PyYAML's event stream, so the
+        first violation is raised before the rest of the file is read. Only one
+        field value is built at a time and dropped once it is validated, so memory
+        use doesn't grow with the size of the file. Every file is validated on its
+        own, like `load` with ``streaming=True``.
+
+        Mappings that can't be walked event by event, e.g. anchored sections or
+        aliases, are built as a whole and validated with `Schema.validate`. Group
+        checks of a mapping run after all its keys were read. The validation cache
+        isn't used.
+
+        Args:
+            *filepaths: Files (or a single directory) to validate, see `load`.
+            only: Names of the schemas to validate, all of them by default.
+                Other sections are skipped without being built.
+
+        Raises:
+            ValueError: If no filepaths are provided, if a file fails validation or
+                if `only` names an unknown schema. Validation errors name the file
+                and line of the offending key.
+            FileNotFoundError: If any specified file path doesn't exist.
+            yaml.YAMLError: If any file contains invalid YAML.
+
+        """
+        self._stream(filepaths, self._requested(only), retain=False)
+
+    def _stream(
+        self,
+        filepaths: tuple[str | Path, ...],
+        sections: frozenset[str] | None,
+        *,
+        retain: bool,
+    ) -> YamlDict:
+        """Validate files from their event streams, see `validate_stream`."""
+        from pathlib import Path  # noqa: PLC0415
+
+        from ._include import Includes  # noqa: PLC0415
+        from ._streaming import StreamValidator  # noqa: PLC0415
+
+        merged_data: YamlDict = {}
+        includes = Includes(self._include_root)
+
+        recorder = self._recorder()
+        for filepath in _paths_to_load(filepaths):
+            path = Path(filepath)
+            recorder.restart()
+            recorder.file(path)
+
+            with includes.stream(path) as loader:
+                data = StreamValidator(
+                    loader,
+                    self._schemas,
+                    sections,
+                    retain=retain,
+                ).run()
+
+            recorder.phase("stream")
+
+            if retain:
                 merged_data.update(data)
 
-        return self.loads(merged_data) if merged_data else self.loads({})
+        return merged_data
+
+    def _read(
+        self,
+        filepaths: tuple[str | Path, ...],
+        sections: frozenset[str] | None = None,
+    ) -> tuple[YamlDict, Includes]:
+        """Read, parse and merge configuration files, see `load`.
+
+        If `sections` is given, files that don't define any of them are skipped
+        without being parsed.
+        """
+        from pathlib import Path  # noqa: PLC0415
+
+        # PyYAML is only imported once a file is actually read
+        from ._include import Includes, top_level_keys  # noqa: PLC0415
+
+        merged_data: YamlDict = {}
+        includes = Includes(self._include_root)
+
+        recorder = self._recorder()
+        for filepath in _paths_to_load(filepaths):
+            recorder.restart()
+            content = Path(filepath).read_bytes()
+            recorder.file(Path(filepath), len(content))
+            recorder.phase("read")
+
+            text = content.decode("utf-8")
+            if sections is not None:
+                keys = top_level_keys(text)
+                if keys is not None and keys.isdisjoint(sections):
+                    # Skipped, but unknown keys are reported as if it was read
+                    self._check_keys(keys)
+                    continue
+
+            data = includes.load(text, Path(filepath))
+
+            recorder.phase("parse")
+
+            if data:
+                merged_data.update(data)  # type: ignore[arg-type]
+
+        return merged_data, includes
+
+    def load_profiles(
+        self,
+        *filepaths: str | Path,
+        overlays: Mapping[str, YamlDict | str | Path],
+        mode: ConfigMode = "eager",
+    ) -> dict[str, Config]:
+        """Load one configuration per profile from a shared base and overlays.
+
+        The base is read, parsed and validated once, like with `load`. Each overlay
+        is then merged into it section by section: nested sections are merged
+        recursively and all other values replace the ones of the base. Sections
+        an overlay doesn't touch are shared with the base and are neither copied
+        nor validated again, only the overlaid subtrees are, see
+        `Schema.revalidate`. In eager mode the shared sections are also
+        materialized only once and shared between the returned Config objects.
+
+        Args:
+            *filepaths: Files (or a single directory) of the base configuration,
+                see `load`.
+            overlays: Overlay per profile name, either as data or as the path of
+                a YAML file or directory.
+            mode: How the Config objects are built, see `loads`.
+
+        Returns:
+            A Config object per profile name.
+
+        Raises:
+            ValueError: If the base or any profile fails validation, see `load`.
+
+        """
+        base, _ = self._read(filepaths)
+        with compact_buffers():
+            self.validate(base)
+
+            memo: dict[tuple[int, str], tuple[typing.Any, Config]] = {}
+            configs: dict[str, Config] = {}
+
+            for profile, overlay in overlays.items():
+                overlay_data = (
+                    overlay if isinstance(overlay, dict) else self._read((overlay,))[0]
+                )
+                data = deep_merge(base, overlay_data)
+                self._check_keys(data)
+
+                for key, section in data.items():
+                    previous = base.get(key)
+                    if isinstance(previous, dict) and isinstance(section, dict):
+                        self._schemas[key].revalidate(section, previous)
+                    else:
+                        self._validate_section(self._schemas[key], section)  # type: ignore  # noqa: PGH003
+
+                configs[profile] = self._materialize(data, mode, memo)
+
+        return configs
+
+    def dump_snapshot(self, config: Config, path: str | Path, /) -> None:
+        """Write a validated configuration to a binary snapshot file.
+
+        The snapshot is stamped with a fingerprint of the registered schemas so that
+        `load_snapshot` can restore the configuration without parsing YAML or
+        validating it again. The file is written atomically.
+
+        Args:
+            config: A Config object previously returned by this manager.
+            path: Path of the snapshot file to write.
+
+        """
+        import os  # noqa: PLC0415
+        import pickle  # noqa: PLC0415
+        import tempfile  # noqa: PLC0415
+        from pathlib import Path  # noqa: PLC0415
+
+        snapshot_path = Path(path)
+        payload = (
+            _SNAPSHOT_MAGIC
+            + bytes.fromhex(self.fingerprint)
+            + pickle.dumps(config.to_dict(), protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        # A temporary file of its own per writer, so concurrent writers of the same
+        # snapshot can't publish each other's partial files
+        with tempfile.NamedTemporaryFile(
+            dir=snapshot_path.parent,
+            prefix=f"{snapshot_path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            temporary_path = file.name
+            try:
+                file.write(payload)
+            except BaseException:
+                file.close()
+                os.unlink(temporary_path)  # noqa: PTH108
+                raise
+
+        try:
+            os.replace(temporary_path, snapshot_path)  # noqa: PTH105
+        except BaseException:
+            os.unlink(temporary_path)  # noqa: PTH108
+            raise
+
+    def load_snapshot(
+        self,
+        path: str | Path,
+        /,
+        *filepaths: str | Path,
+        mode: ConfigMode = "eager",
+    ) -> Config:
+        """Load a configuration from a snapshot written by `dump_snapshot`.
+
+        The snapshot is memory-mapped and restored without YAML parsing or
+        validation. If the snapshot doesn't exist, was written for different
+        schemas or can't be read, e.g. because it is truncated or not a snapshot at
+        all, the configuration is loaded from `filepaths` with `load` instead.
+
+        Snapshots are unpickled, so only load snapshot files you trust.
+
+        Args:
+            path: Path of the snapshot file.
+            *filepaths: Configuration files (or a single directory) to fall back to,
+                see `load`.
+            mode: How the Config object is built, see `loads`.
+
+        Returns:
+            Config: A frozen object containing the configuration.
+
+        Raises:
+            ValueError: If falling back is needed but no filepaths are given.
+
+        """
+        from pathlib import Path  # noqa: PLC0415
+
+        snapshot_path = Path(path)
+        data = self._read_snapshot(snapshot_path)
+        if data is not None:
+            return self._materialize(data, mode)
+
+        if not filepaths:
+            raise ValueError(  # noqa: TRY003
+                f"Snapshot {snapshot_path} is missing, outdated or unreadable "  # noqa: EM102
+                "and no filepaths were given to fall back to",
+            )
+
+        return self.load(*filepaths, mode=mode)
+
+    def _read_snapshot(self, path: Path) -> YamlDict | None:
+        """Return the data of a snapshot, or None if it can't be used."""
+        import mmap  # noqa: PLC0415
+        import pickle  # noqa: PLC0415
+
+        header = _SNAPSHOT_MAGIC + bytes.fromhex(self.fingerprint)
+
+        try:
+            with (
+                path.open("rb") as file,
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            ):
+                if mapped[: len(header)] != header:
+                    return None
+
+                with memoryview(mapped) as view, view[len(header) :] as payload:
+                    return typing.cast("YamlDict", pickle.loads(payload))  # noqa: S301
+        # Missing, empty (can't be mapped), truncated or corrupt snapshots: a
+        # damaged pickle can raise almost anything, e.g. KeyError or ImportError
+        except Exception:  # noqa: BLE001
+            return None
+
+
+def _paths_to_load(filepaths: tuple[str | Path, ...]) -> list[str | Path]:
+    """Return the files to read, expanding a single directory to its .yml files."""
+    from pathlib import Path  # noqa: PLC0415
+
+    if not filepaths:
+        raise ValueError("At least one filepath is required")  # noqa: EM101, TRY003
+
+    if len(filepaths) == 1:
+        path = Path(filepaths[0])
+        if path.is_dir():
+            # Load all .yml files from directory
+            paths_to_load: list[str | Path] = sorted(path.glob("*.yml"))
+            if not paths_to_load:
+                raise ValueError(f"No .yml files found in directory: {path}")  # noqa: EM102, TRY003
+
+            return paths_to_load
+
+    return list(filepaths)
+
+
+def _select(data: YamlDict, sections: frozenset[str]) -> YamlDict:
+    """Return the requested top-level sections of data."""
+    return {key: value for key, value in data.items() if key in sections}
+
+
+@typing.final
+class _Recorder:
+    """Reports phases, files and sections of a load to the instrumentations.
+
+    A phase lasts from the previous phase (or `restart`) to the call of `phase`.
+    """
+
+    def __init__(self, instrumentations: list[Instrumentation]) -> None:
+        self._instrumentations = instrumentations
+        self._start = time.perf_counter()
+
+    def restart(self) -> None:
+        self._start = time.perf_counter()
+
+    def phase(self, phase: str) -> None:
+        end = time.perf_counter()
+        for instrumentation in self._instrumentations:
+            instrumentation.on_phase(phase, end - self._start)
+        self._start = end
+
+    def file(self, path: Path, size: int | None = None) -> None:
+        """Report a file, reading its size from the file system if not given."""
+        if size is None:
+            size = path.stat().st_size
+        for instrumentation in self._instrumentations:
+            instrumentation.on_file(path, size)
+
+    def section(
+        self,
+        name: str,
+        schema: Schema,
+        data: YamlDict,
+        validate: _SectionValidator,
+    ) -> None:
+        """Validate a section with an observed schema, see `Profiler`, and report it.
+
+        The observed schema runs the real validation code, so attaching an
+        instrumentation never changes which data is accepted.
+        """
+        from ._profile import Profiler  # noqa: PLC0415
+
+        profiler = Profiler(timed=False)
+        start = time.perf_counter()
+        validated = validate(
+            schema,
+            data,
+            profiler.observe(schema, name).validate,
+        )
+        seconds = time.perf_counter() - start
+        evaluations = profiler.evaluations if validated else 0
+        for instrumentation in self._instrumentations:
+            instrumentation.on_schema(name, seconds, evaluations)
+
+
+@typing.final
+class _NoRecorder:
+    """Stands in for `_Recorder` when no instrumentation is registered."""
+
+    def restart(self) -> None:
+        pass
+
+    def phase(self, phase: str) -> None:
+        pass
+
+    def file(self, path: Path, size: int | None = None) -> None:
+        pass
+
+    def section(
+        self,
+        name: str,  # noqa: ARG002
+        schema: Schema,
+        data: YamlDict,
+        validate: _SectionValidator,
+    ) -> None:
+        validate(schema, data, None)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+from confflow import IntegerField, Manager, Schema
+from confflow.cli import main
+
+
+class CommandTest(unittest.TestCase):
+    """Runs the commands against a manager importable as a module attribute."""
+
+    def setUp(self) -> None:
+        module = types.ModuleType("confflow_cli_test")
+        module.manager = Manager(  # type: ignore[attr-defined]
+            Schema("service", description="Service").add(
+                IntegerField("port", description="Port", ge=1),
+            ),
+        )
+        sys.modules[module.__name__] = module
+        self.addCleanup(sys.modules.pop, module.__name__)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def _write(self, name: str, text: str) -> str:
+        path = self.directory / name
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+
+    def _run(self, *argv: str) -> tuple[int, str, str]:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            status = main(argv)
+        return status, stdout.getvalue(), stderr.getvalue()
+
+
+class ValidateTest(CommandTest):
+    """`confflow validate` reports every path and exits with 1 if any is invalid."""
+
+    def test_text_and_json(self) -> None:
+        valid = self._write("valid.yaml", "service:\n  port: 80\n")
+        invalid = self._write("invalid.yaml", "service:\n  port: 0\n")
+        manager = "confflow_cli_test:manager"
+
+        status, stdout, _ = self._run("validate", manager, valid, "--jobs", "1")
+        self.assertEqual((status, stdout), (0, f"OK   {valid}\n"))
+
+        status, stdout, _ = self._run(
+            "validate",
+            manager,
+            valid,
+            invalid,
+            "--jobs",
+            "1",
+            "--format",
+            "json",
+        )
+        report = json.loads(stdout)
+        self.assertEqual(status, 1)
+        valid_flags = [result["valid"] for result in report["results"]]
+        self.assertEqual(valid_flags, [True, False])
+        self.assertTrue(report["results"][1]["error"].startswith("ValidationError"))
+
+    def test_invalid_manager_reference(self) -> None:
+        stderr = io.StringIO()
+        with (
+            contextlib.redirect_stderr(stderr),
+            self.assertRaises(SystemExit) as context,
+        ):
+            main(["validate", "confflow_cli_test", "config.yaml"])
+
+        self.assertEqual(context.exception.code, 2)
+        self.assertIn("expected 'module:attribute'", stderr.getvalue())
+
+
+class DiffTest(CommandTest):
+    """`confflow diff` exits with 0 if equal, 1 if different, 2 on errors."""
+
+    def _diff(self, old: str, new: str) -> tuple[int, str, str]:
+        return self._run("diff", "confflow_cli_test:manager", old, new)
+
+    def test_equal_and_different(self) -> None:
+        old = self._write("old.yaml", "service:\n  port: 80\n")
+        new = self._write("new.yaml", "service:\n  port: 81\n")
+
+        self.assertEqual(self._diff(old, old)[0], 0)
+        status, stdout, _ = self._diff(old, new)
+        self.assertEqual(status, 1)
+        self.assertIn("service.port: 80 -> 81", stdout)
+
+    def test_load_errors_exit_with_2(self) -> None:
+        old = self._write("old.yaml", "service:\n  port: 80\n")
+        for name, text, error in (
+            ("invalid.yaml", "service:\n  port: 0\n", "ValidationError"),
+            ("broken.yaml", "service: [\n", "Error"),
+            ("missing.yaml", None, "FileNotFoundError"),
+        ):
+            with self.subTest(name=name):
+                new = (
+                    str(self.directory / name)
+                    if text is None
+                    else self._write(name, text)
+                )
+                status, stdout, stderr = self._diff(old, new)
+                self.assertEqual(status, 2)
+                self.assertEqual(stdout, "")
+                self.assertIn(f"{new}: ", stderr)
+                self.assertIn(error, stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import typing
+import unittest
+
+from confflow import Floatlist, Integerlist, Manager, Schema
+from confflow._schema.fields.constraint import ValidationError
+
+
+class CompactListTest(unittest.TestCase):
+    """Compact numeric lists are stored as read-only typed buffers."""
+
+    def setUp(self) -> None:
+        self.manager = Manager(
+            Schema("series", description="Series")
+            .add(Integerlist("counts", description="Counts", compact=True, item_ge=0))
+            .add(Floatlist("ratios", description="Ratios", compact=True)),
+        )
+
+    def test_buffers_in_every_mode(self) -> None:
+        data: dict[str, typing.Any] = {
+            "series": {"counts": [1, 2, 3], "ratios": [0.5]},
+        }
+        for mode in ("eager", "lazy", "view"):
+            with self.subTest(mode=mode):
+                config: typing.Any = self.manager.loads(data, mode=mode)
+                counts = config.series.counts
+
+                self.assertIsInstance(counts, memoryview)
+                self.assertTrue(counts.readonly)
+                self.assertEqual(counts.tolist(), [1, 2, 3])
+                self.assertEqual(config.to_dict(), data)
+
+    def test_invalid_items(self) -> None:
+        cases: tuple[tuple[typing.Any, str], ...] = (
+            ([2**70], "Invalid item for a compact list"),
+            ([1.5], "Invalid item for a compact list"),
+            ([-1], "is not >="),
+        )
+        for counts, message in cases:
+            with (
+                self.subTest(counts=counts),
+                self.assertRaisesRegex(ValidationError, message),
+            ):
+                self.manager.loads({"series": {"counts": counts}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import typing
+import unittest
+from pathlib import Path
+
+from confflow import IntegerField, Manager, Schema, StringField
+from confflow._schema.fields.constraint import ValidationError
+
+
+class ConcurrentManagerTest(unittest.TestCase):
+    """A concurrent manager publishes whole configs and freezes its schemas."""
+
+    def setUp(self) -> None:
+        self.schema = Schema("service", description="Service").add(
+            IntegerField("port", description="Port", ge=1),
+        )
+        self.manager = Manager(self.schema, concurrent=True)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "config.yml"
+
+    def test_schemas_are_frozen(self) -> None:
+        self.assertTrue(self.manager.concurrent)
+        self.assertTrue(self.schema.frozen)
+        with self.assertRaisesRegex(ValueError, "is frozen"):
+            self.schema.add(StringField("name", description="Name"))
+
+    def test_current_before_publishing(self) -> None:
+        with self.assertRaisesRegex(ValueError, "No configuration has been published"):
+            _ = self.manager.current
+
+    def test_failed_reload_keeps_current(self) -> None:
+        self.path.write_text("service:\n  port: 80\n", encoding="utf-8")
+        config = self.manager.reload(self.path)
+
+        self.path.write_text("service:\n  port: 0\n", encoding="utf-8")
+        with self.assertRaises(ValidationError):
+            self.manager.reload(self.path)
+
+        self.assertIs(self.manager.current, config)
+
+    def test_readers_see_whole_configs(self) -> None:
+        configs = [self.manager.loads({"service": {"port": port}}) for port in (1, 2)]
+        self.manager.publish(configs[0])
+        seen: set[int] = set()
+
+        def read() -> None:
+            for _ in range(1000):
+                current: typing.Any = self.manager.current
+                seen.add(current.service.port)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        for index in range(1000):
+            self.manager.publish(configs[index % 2])
+        reader.join()
+
+        self.assertLessEqual(seen, {1, 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pickle
+import typing
+import unittest
+from collections.abc import Mapping
+
+from confflow import IntegerField, Manager, Schema, StringField, Stringlist
+
+
+class ConfigViewFieldNamesTest(unittest.TestCase):
+    """Fields named like `Mapping` methods must not be hidden by them."""
+
+    def setUp(self) -> None:
+        schema = (
+            Schema("api", description="API")
+            .add(StringField("keys", description="Keys"))
+            .add(Stringlist("items", description="Items"))
+            .add(IntegerField("values", description="Values"))
+            .add(StringField("get", description="Get"))
+        )
+        data: dict[str, typing.Any] = {
+            "api": {"keys": "a", "items": ["b"], "values": 1, "get": "c"},
+        }
+        self.config: typing.Any = Manager(schema).loads(data, mode="view")
+
+    def test_attribute_access_returns_field_values(self) -> None:
+        api = self.config.api
+
+        self.assertEqual(api.keys, "a")
+        self.assertEqual(api.items, ("b",))
+        self.assertEqual(api.values, 1)
+        self.assertEqual(api.get, "c")
+
+    def test_mapping_methods_stay_available(self) -> None:
+        api = self.config["api"]
+
+        self.assertIsInstance(api, Mapping)
+        self.assertEqual(list(Mapping.keys(api)), ["keys", "items", "values", "get"])
+        self.assertEqual(list(self.config.keys()), ["api"])
+        self.assertEqual(api["keys"], "a")
+
+    def test_pickle_round_trip(self) -> None:
+        restored = pickle.loads(pickle.dumps(self.config))  # noqa: S301
+
+        self.assertEqual(restored.api.keys, "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
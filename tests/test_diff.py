@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import typing
+import unittest
+
+from confflow import Change, IntegerField, Manager, Schema, StringField
+
+
+class DiffTest(unittest.TestCase):
+    """`Manager.diff` reports the changed fields and sections."""
+
+    def setUp(self) -> None:
+        database = Schema("database", description="Database").add(
+            IntegerField("port", description="Port"),
+        )
+        self.manager = Manager(
+            Schema("service", description="Service")
+            .add(StringField("name", description="Name"))
+            .add(database),
+            Schema("worker", description="Worker").add(
+                IntegerField("threads", description="Threads"),
+            ),
+        )
+        self.data: dict[str, typing.Any] = {
+            "service": {"name": "api", "database": {"port": 5432}},
+        }
+
+    def test_equal_configurations(self) -> None:
+        config = self.manager.loads(self.data)
+
+        self.assertEqual(self.manager.diff(config, config), [])
+        self.assertEqual(
+            self.manager.diff(config, self.manager.loads(self.data, mode="view")),
+            [],
+        )
+
+    def test_changed_fields_and_sections(self) -> None:
+        old = self.manager.loads(self.data)
+        new = self.manager.loads(
+            {
+                "service": {"name": "api", "database": {"port": 5433}},
+                "worker": {"threads": 4},
+            },
+            mode="lazy",
+        )
+
+        self.assertEqual(
+            self.manager.diff(old, new),
+            [
+                Change("service.database.port", 5432, 5433),
+                Change("worker", None, {"threads": 4}),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
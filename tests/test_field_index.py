@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import unittest
+
+from confflow import IntegerField, Manager, Schema, StringField
+
+
+class FieldIndexTest(unittest.TestCase):
+    """Fields are looked up by dotted path across the schema tree."""
+
+    def setUp(self) -> None:
+        self.canary = Schema("canary", description="Canary").add(
+            IntegerField("weight", description="Weight"),
+        )
+        self.schema = (
+            Schema("deployment", description="Deployment")
+            .add(StringField("region", description="Region"))
+            .add(IntegerField("canary_weight", description="Weight"))
+            .add(self.canary)
+        )
+        self.manager = Manager(self.schema)
+
+    def test_get_field(self) -> None:
+        field = self.manager.get_field("deployment.canary.weight")
+
+        self.assertIs(field, self.schema.get_field("canary.weight"))
+        with self.assertRaises(KeyError):
+            self.manager.get_field("deployment.canary.size")
+
+    def test_find_fields_matches_whole_keys(self) -> None:
+        paths = [path for path, _ in self.manager.find_fields("deployment.canary")]
+
+        self.assertEqual(paths, ["deployment.canary.weight"])
+        self.assertEqual(len(self.manager.find_fields("")), 3)
+
+    def test_index_follows_schema_changes(self) -> None:
+        self.assertEqual(
+            [path for path, _ in self.schema.iter_fields()],
+            ["region", "canary_weight", "canary.weight"],
+        )
+
+        self.canary.add(IntegerField("steps", description="Steps"))
+
+        field = self.manager.get_field("deployment.canary.steps")
+        self.assertEqual(field.name, "steps")
+
+
+if __name__ == "__main__":
+    unittest.main()
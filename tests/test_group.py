@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import unittest
+
+from confflow import IntegerField, OneOf, Schema, StringField
+
+
+class GroupFingerprintTest(unittest.TestCase):
+    """The fingerprint of a group is cached until one of its schemas changes."""
+
+    def setUp(self) -> None:
+        self.postgres = Schema("postgres", description="Postgres").add(
+            IntegerField("port", description="Port"),
+        )
+        self.sqlite = Schema("sqlite", description="SQLite")
+        self.group = OneOf(self.postgres, self.sqlite)
+
+    def test_fingerprint_is_cached(self) -> None:
+        fingerprint = self.group.fingerprint
+
+        self.assertIs(self.group.fingerprint, fingerprint)
+
+    def test_fingerprint_changes_with_a_schema(self) -> None:
+        database = Schema("database", description="Database").add(self.group)
+        group, schema = self.group.fingerprint, database.fingerprint
+
+        self.sqlite.add(StringField("path", description="Path"))
+
+        self.assertNotEqual(self.group.fingerprint, group)
+        self.assertNotEqual(database.fingerprint, schema)
+        rebuilt = OneOf(self.postgres, self.sqlite)
+        self.assertEqual(self.group.fingerprint, rebuilt.fingerprint)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import tempfile
+import typing
+import unittest
+from pathlib import Path
+
+from confflow import IntegerField, Manager, Schema, StringField
+from confflow._schema.fields.constraint import ValidationError
+
+
+class IncludesTest(unittest.TestCase):
+    """`!include` tags pull in fragments relative to the including file."""
+
+    def setUp(self) -> None:
+        tls = Schema("tls", description="TLS").add(
+            IntegerField("port", description="Port", ge=1),
+        )
+        self.schema = (
+            Schema("service", description="Service")
+            .add(StringField("host", description="Host"))
+            .add(tls)
+        )
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        (self.directory / "shared").mkdir()
+
+    def _write(self, name: str, text: str) -> Path:
+        path = self.directory / name
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_fragment_is_included(self) -> None:
+        self._write("shared/tls.yml", "port: 443\n")
+        path = self._write("service.yml", "service:\n  tls: !include shared/tls.yml\n")
+
+        config: typing.Any = Manager(self.schema).load(path)
+
+        self.assertEqual(config.service.tls.port, 443)
+
+    def test_errors_name_the_fragment(self) -> None:
+        self._write("shared/tls.yml", "port: 0\n")
+        path = self._write("service.yml", "service:\n  tls: !include shared/tls.yml\n")
+
+        with self.assertRaisesRegex(ValidationError, r"included from .*tls\.yml"):
+            Manager(self.schema).load(path)
+
+    def test_cycles_are_rejected(self) -> None:
+        self._write("shared/a.yml", "port: !include b.yml\n")
+        self._write("shared/b.yml", "port: !include a.yml\n")
+        path = self._write("service.yml", "service:\n  tls: !include shared/a.yml\n")
+
+        with self.assertRaisesRegex(ValueError, "Include cycle"):
+            Manager(self.schema).load(path)
+
+    def test_include_root(self) -> None:
+        self._write("tls.yml", "port: 443\n")
+        path = self._write(
+            "shared/service.yml",
+            "service:\n  tls: !include ../tls.yml\n",
+        )
+        manager = Manager(self.schema, include_root=self.directory / "shared")
+
+        with self.assertRaisesRegex(ValueError, "outside of"):
+            manager.load(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import unittest
+
+from confflow import InMemoryAggregator, IntegerField, Manager, Schema
+from confflow._schema.fields.constraint import ValidationError
+
+
+class NotThirteen(IntegerField):
+    """A custom field whose `validate` does more than run its constraints."""
+
+    def validate(self, value: int, /) -> None:
+        if value == 13:  # noqa: PLR2004
+            raise ValidationError("13 is not allowed")  # noqa: EM101, TRY003
+
+        super().validate(value)
+
+
+class InstrumentationTest(unittest.TestCase):
+    """Attaching an instrumentation must not change which data is accepted."""
+
+    def setUp(self) -> None:
+        self.manager = Manager(
+            Schema("service", description="Service")
+            .add(NotThirteen("port", description="Port", ge=1))
+            .add(IntegerField("workers", description="Workers", le=64)),
+        )
+        self.aggregator = InMemoryAggregator()
+        self.manager.add_instrumentation(self.aggregator)
+
+    def test_custom_field_still_validates(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.manager.loads({"service": {"port": 13}})
+
+    def test_reports_phases_and_evaluations(self) -> None:
+        self.manager.loads({"service": {"port": 80, "workers": 4}})
+
+        self.assertEqual(self.aggregator.evaluations, {"service": 2})
+        self.assertEqual(self.aggregator.schemas["service"].count, 1)
+        self.assertIn("validate", self.aggregator.phases)
+
+    def test_removed_instrumentation_is_not_notified(self) -> None:
+        self.manager.remove_instrumentation(self.aggregator)
+
+        self.manager.loads({"service": {"port": 80}})
+
+        self.assertEqual(self.aggregator.summary()["schemas"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import copy
+import typing
+import unittest
+
+from confflow import (
+    FloatField,
+    IntegerField,
+    Integerlist,
+    Manager,
+    Schema,
+    SchemaList,
+    StringField,
+)
+
+
+class InterpolationTest(unittest.TestCase):
+    """`${...}` references are resolved in dependency order before validation."""
+
+    def setUp(self) -> None:
+        upstream = Schema("upstream", description="Upstream").add(
+            StringField("host", description="Host"),
+        )
+        self.manager = Manager(
+            Schema("deployment", description="Deployment")
+            .add(StringField("region", description="Region"))
+            .add(StringField("host", description="Host"))
+            .add(IntegerField("port", description="Port")),
+            Schema("service", description="Service")
+            .add(StringField("endpoint", description="Endpoint"))
+            .add(IntegerField("port", description="Port"))
+            .add(FloatField("ratio", description="Ratio"))
+            .add(Integerlist("ports", description="Ports"))
+            .add(SchemaList("upstreams", upstream, description="Upstreams")),
+        )
+
+    def _load(self, **service: typing.Any) -> typing.Any:  # noqa: ANN401
+        data: dict[str, typing.Any] = {
+            "deployment": {
+                "region": "eu",
+                "host": "api.${deployment.region}.example.com",
+                "port": 8080,
+            },
+            "service": service,
+        }
+        original = copy.deepcopy(data)
+        config = self.manager.loads(data, interpolate=True)
+        self.assertEqual(data, original)
+        return config
+
+    def test_references_are_resolved_in_order(self) -> None:
+        config = self._load(
+            endpoint="https://${deployment.host}/v1",
+            port="${deployment.port}",
+            ratio="0.${deployment.port}",
+        )
+
+        self.assertEqual(config.service.endpoint, "https://api.eu.example.com/v1")
+        self.assertEqual(config.service.port, 8080)
+        self.assertEqual(config.service.ratio, 0.808)
+
+    def test_list_items(self) -> None:
+        config = self._load(
+            ports=[80, "${deployment.port}"],
+            upstreams=[{"host": "${deployment.region}"}],
+            endpoint="${service.upstreams[0].host}:${service.ports[1]}",
+        )
+
+        self.assertEqual(list(config.service.ports), [80, 8080])
+        self.assertEqual(config.service.endpoint, "eu:8080")
+
+    def test_literal_reference(self) -> None:
+        config = self._load(endpoint="$${deployment.host}")
+
+        self.assertEqual(config.service.endpoint, "${deployment.host}")
+
+    def test_invalid_references(self) -> None:
+        for service, message in (
+            ({"endpoint": "${deployment.zone}"}, "Unknown reference"),
+            ({"endpoint": "${deployment}"}, "is a section"),
+            ({"endpoint": "${service.ratio}", "ratio": "${service.endpoint}"}, "cycle"),
+            ({"port": "${deployment.region}"}, "Invalid interpolated value"),
+        ):
+            with (
+                self.subTest(service=service),
+                self.assertRaisesRegex(ValueError, message),
+            ):
+                self._load(**service)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import typing
+import unittest
+from datetime import date, datetime, timezone
+
+from confflow import (
+    Booleanlist,
+    BytesField,
+    Byteslist,
+    DateField,
+    Datelist,
+    Manager,
+    Schema,
+)
+from confflow._schema.fields.constraint import ValidationError
+
+
+class ItemConstraintsTest(unittest.TestCase):
+    """Date and bytes constraints, and item constraints of the other lists."""
+
+    def setUp(self) -> None:
+        self.manager = Manager(
+            Schema("release", description="Release")
+            .add(DateField("date", description="Date", after=datetime(2024, 5, 1)))  # noqa: DTZ001
+            .add(
+                Datelist(
+                    "windows",
+                    description="Windows",
+                    item_before=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                ),
+            )
+            .add(BytesField("key", description="Key", min_size=1))
+            .add(Byteslist("tokens", description="Tokens", item_max_size=2))
+            .add(Booleanlist("flags", description="Flags", item_enum=[True])),
+        )
+
+    def test_valid(self) -> None:
+        self.manager.validate(
+            {
+                "release": {
+                    "date": date(2024, 5, 2),
+                    "windows": [datetime(2024, 1, 1, tzinfo=timezone.utc)],
+                    "key": b"k",
+                    "tokens": [b"ab"],
+                    "flags": [True, True],
+                },
+            },
+        )
+
+    def test_invalid(self) -> None:
+        cases: tuple[tuple[dict[str, typing.Any], str], ...] = (
+            ({"date": date(2024, 5, 1)}, "is not after"),
+            ({"date": datetime(2024, 5, 2, tzinfo=timezone.utc)}, "no UTC offset"),
+            ({"windows": [datetime(2024, 1, 1)]}, "no UTC offset"),  # noqa: DTZ001
+            ({"windows": [datetime(2026, 1, 1, tzinfo=timezone.utc)]}, "not before"),
+            ({"key": b""}, "minimum size"),
+            ({"tokens": [b"ab", b"abc"]}, "maximum size"),
+            ({"flags": [True, False]}, "is not one of"),
+        )
+        for release, message in cases:
+            with (
+                self.subTest(release=release),
+                self.assertRaisesRegex(ValidationError, message),
+            ):
+                self.manager.validate({"release": release})
+
+
+if __name__ == "__main__":
+    unittest.main()
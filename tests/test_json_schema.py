@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import unittest
+
+from confflow import (
+    IntegerField,
+    Manager,
+    MapField,
+    OneOf,
+    Schema,
+    StringField,
+    Stringlist,
+)
+
+
+class JsonSchemaTest(unittest.TestCase):
+    """Schemas export to JSON Schema, cached until they change."""
+
+    def setUp(self) -> None:
+        self.schema = (
+            Schema("service", description="Service")
+            .add(IntegerField("port", description="Port", ge=1, le=65535))
+            .add(Stringlist("tags", description="Tags", item_enum=["a", "b"]))
+            .add(
+                MapField(
+                    "limits",
+                    IntegerField("limit", description="Limit"),
+                    description="Limits",
+                    key_regex=r"[a-z]+$",
+                ),
+            )
+            .add(
+                OneOf(
+                    Schema("postgres", description="Postgres"),
+                    Schema("sqlite", description="SQLite"),
+                ),
+            )
+        )
+        self.manager = Manager(self.schema)
+
+    def test_keywords(self) -> None:
+        document = self.manager.to_json_schema()
+        service = document["properties"]["service"]
+        properties = service["properties"]
+
+        self.assertEqual(
+            document["$schema"],
+            "https://json-schema.org/draft/2020-12/schema",
+        )
+        self.assertFalse(service["additionalProperties"])
+        self.assertEqual(
+            properties["port"],
+            {"type": "integer", "minimum": 1, "maximum": 65535, "description": "Port"},
+        )
+        self.assertEqual(properties["tags"]["items"]["enum"], ["a", "b"])
+        self.assertEqual(
+            properties["limits"]["propertyNames"],
+            {"pattern": "^(?:[a-z]+$)"},
+        )
+        self.assertEqual(
+            service["oneOf"],
+            [{"required": ["postgres"]}, {"required": ["sqlite"]}],
+        )
+
+    def test_cached_until_a_schema_changes(self) -> None:
+        document = self.manager.to_json_schema()
+
+        self.assertIs(self.manager.to_json_schema(), document)
+        self.assertIs(self.schema.to_json_schema(), self.schema.to_json_schema())
+
+        self.schema.add(StringField("name", description="Name"))
+
+        updated = self.manager.to_json_schema()
+        self.assertIsNot(updated, document)
+        self.assertIn("name", updated["properties"]["service"]["properties"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import dataclasses
+import typing
+import unittest
+
+from confflow import IntegerField, Manager, Schema, SchemaList, StringField
+
+
+class LazyConfigTest(unittest.TestCase):
+    """Lazy configs build nested sections on first access and stay read-only."""
+
+    def setUp(self) -> None:
+        database = Schema("database", description="Database").add(
+            IntegerField("port", description="Port"),
+        )
+        replica = Schema("replica", description="Replica").add(
+            StringField("host", description="Host"),
+        )
+        self.manager = Manager(
+            Schema("service", description="Service")
+            .add(StringField("name", description="Name"))
+            .add(database)
+            .add(SchemaList("replicas", replica, description="Replicas")),
+        )
+        self.data: dict[str, typing.Any] = {
+            "service": {
+                "name": "api",
+                "database": {"port": 5432},
+                "replicas": [{"host": "a"}, {"host": "b"}],
+            },
+        }
+        self.config: typing.Any = self.manager.loads(self.data, mode="lazy")
+
+    def test_nested_sections_are_built_once(self) -> None:
+        database = self.config.service.database
+
+        self.assertEqual(database.port, 5432)
+        self.assertIs(self.config.service.database, database)
+        hosts = [replica.host for replica in self.config.service.replicas]
+        self.assertEqual(hosts, ["a", "b"])
+
+    def test_matches_eager_mode(self) -> None:
+        eager: typing.Any = self.manager.loads(self.data)
+
+        self.assertEqual(self.config.to_dict(), eager.to_dict())
+        self.assertEqual(self.config["service"]["name"], eager.service.name)
+
+    def test_is_read_only(self) -> None:
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            self.config.service.name = "web"
+        with self.assertRaises(AttributeError):
+            _ = self.config.service.missing
+
+
+if __name__ == "__main__":
+    unittest.main()
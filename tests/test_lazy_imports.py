@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import typing
+import unittest
+
+from confflow import IntegerField, Manager, Schema, StringField
+
+_LOADS: str = """
+import json
+import sys
+import typing
+
+before = set(sys.modules)
+from confflow import IntegerField, Manager, Schema
+
+manager = Manager(
+    Schema("service", description="Service").add(
+        IntegerField("port", description="Port", ge=1),
+    ),
+)
+manager.loads({{"service": {{"port": 80}}}}, mode={mode!r})
+sys.stdout.write(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+
+class LazyImportTest(unittest.TestCase):
+    """Loading data doesn't import modules only other features need."""
+
+    def _imported(self, mode: str) -> set[str]:
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", _LOADS.format(mode=mode)],
+            check=True,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        ).stdout
+        return set(json.loads(output))
+
+    def test_loads_imports_no_extra_modules(self) -> None:
+        for mode in ("eager", "view"):
+            with self.subTest(mode=mode):
+                imported = self._imported(mode)
+                for name in ("yaml", "pickle", "hashlib", "threading", "graphlib"):
+                    self.assertNotIn(name, imported)
+
+
+class LayoutTest(unittest.TestCase):
+    """The Config layout is rebuilt when a registered schema changes."""
+
+    def test_added_field_is_materialized(self) -> None:
+        schema = Schema("service", description="Service").add(
+            IntegerField("port", description="Port"),
+        )
+        manager = Manager(schema)
+        manager.loads({"service": {"port": 80}})
+
+        schema.add(StringField("name", description="Name"))
+        config: typing.Any = manager.loads({"service": {"port": 80, "name": "api"}})
+
+        self.assertEqual(config.service.name, "api")
+
+
+if __name__ == "__main__":
+    unittest.main()
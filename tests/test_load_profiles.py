@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import tempfile
+import typing
+import unittest
+from pathlib import Path
+
+from confflow import IntegerField, Manager, Schema, StringField
+from confflow._schema.fields.constraint import ValidationError
+
+
+class LoadProfilesTest(unittest.TestCase):
+    """Profiles share the base and only revalidate what their overlay touches."""
+
+    def setUp(self) -> None:
+        database = Schema("database", description="Database").add(
+            IntegerField("port", description="Port", ge=1),
+        )
+        self.manager = Manager(
+            Schema("service", description="Service")
+            .add(StringField("name", description="Name"))
+            .add(database),
+            Schema("worker", description="Worker").add(
+                IntegerField("threads", description="Threads", ge=1),
+            ),
+        )
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.base = self.directory / "base.yml"
+        self.base.write_text(
+            "service:\n  name: api\n  database:\n    port: 5432\n"
+            "worker:\n  threads: 2\n",
+            encoding="utf-8",
+        )
+
+    def test_overlays_are_merged_per_section(self) -> None:
+        staging = self.directory / "staging.yml"
+        staging.write_text("worker:\n  threads: 8\n", encoding="utf-8")
+
+        configs: dict[str, typing.Any] = self.manager.load_profiles(
+            self.base,
+            overlays={
+                "prod": {"service": {"database": {"port": 6432}}},
+                "staging": staging,
+                "dev": {"worker": {"threads": 1}},
+            },
+        )
+
+        prod, staging_config = configs["prod"], configs["staging"]
+        self.assertEqual(prod.service.name, "api")
+        self.assertEqual(prod.service.database.port, 6432)
+        self.assertEqual(prod.worker.threads, 2)
+        self.assertEqual(staging_config.worker.threads, 8)
+        self.assertIs(staging_config.service, configs["dev"].service)
+
+    def test_invalid_overlay(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.manager.load_profiles(
+                self.base,
+                overlays={"prod": {"service": {"database": {"port": 0}}}},
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import types
+import typing
+import unittest
+
+from confflow import IntegerField, Manager, MapField, Schema
+from confflow._schema.fields.constraint import ValidationError
+
+
+class MapFieldTest(unittest.TestCase):
+    """Map fields check their keys as a set and every value with one validator."""
+
+    def setUp(self) -> None:
+        limit = Schema("limit", description="Limit").add(
+            IntegerField("rps", description="Requests per second", ge=1),
+        )
+        self.manager = Manager(
+            Schema("service", description="Service")
+            .add(MapField("limits", limit, description="Limits", key_regex=r"[a-z]+$"))
+            .add(
+                MapField(
+                    "weights",
+                    IntegerField("weight", description="Weight", le=100),
+                    description="Weights",
+                    key_enum=["eu", "us"],
+                ),
+            ),
+        )
+
+    def _load(self, **service: typing.Any) -> typing.Any:  # noqa: ANN401
+        return self.manager.loads({"service": service})
+
+    def test_values_are_materialized_read_only(self) -> None:
+        config = self._load(limits={"eu": {"rps": 10}}, weights={"us": 5})
+
+        self.assertIsInstance(config.service.limits, types.MappingProxyType)
+        self.assertEqual(config.service.limits["eu"].rps, 10)
+        self.assertEqual(config.service.weights["us"], 5)
+
+    def test_invalid_maps(self) -> None:
+        for service, message in (
+            ({"limits": ["eu"]}, "is not a mapping"),
+            ({"limits": {"EU": {"rps": 10}}}, "do not match"),
+            ({"weights": {"asia": 5}}, "are not one of"),
+            ({"limits": {"eu": {"rps": 0}}}, "is not >="),
+            ({"weights": {"eu": 101}}, "is not <="),
+        ):
+            with (
+                self.subTest(service=service),
+                self.assertRaisesRegex(ValidationError, message),
+            ):
+                self._load(**service)
+
+
+if __name__ == "__main__":
+    unittest.main()
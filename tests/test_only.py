@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import tempfile
+import typing
+import unittest
+from pathlib import Path
+
+from confflow import IntegerField, Manager, Schema
+
+
+class OnlyTest(unittest.TestCase):
+    """`only` loads the requested sections but still rejects unknown keys."""
+
+    def setUp(self) -> None:
+        self.manager = Manager(
+            Schema("service", description="Service").add(
+                IntegerField("port", description="Port"),
+            ),
+            Schema("worker", description="Worker").add(
+                IntegerField("threads", description="Threads", ge=1),
+            ),
+        )
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def _write(self, name: str, text: str) -> Path:
+        path = self.directory / name
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_other_sections_are_not_validated(self) -> None:
+        config: typing.Any = self.manager.loads(
+            {"service": {"port": 80}, "worker": {"threads": 0}},
+            only=["service"],
+        )
+
+        self.assertEqual(config.service.port, 80)
+        self.assertNotIn("worker", config.to_dict())
+
+    def test_unknown_schema_requested(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Unknown schemas requested"):
+            self.manager.loads({"service": {"port": 80}}, only=["database"])
+
+    def test_unknown_keys_are_rejected(self) -> None:
+        data = {"service": {"port": 80}, "servce": {"port": 81}}
+        with self.assertRaisesRegex(ValueError, "Invalid keys found"):
+            self.manager.loads(data, only=["service"])  # type: ignore[arg-type]
+
+    def test_unknown_keys_in_skipped_files_are_rejected(self) -> None:
+        service = self._write("service.yml", "service:\n  port: 80\n")
+        typo = self._write("typo.yml", "servce:\n  port: 81\n")
+
+        for streaming in (False, True):
+            with (
+                self.subTest(streaming=streaming),
+                self.assertRaisesRegex(ValueError, "Invalid keys found"),
+            ):
+                self.manager.load(
+                    service,
+                    typo,
+                    only=["service"],
+                    streaming=streaming,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import copy
+import typing
+import unittest
+
+from confflow import IntegerField, Manager, Schema, StringField
+from confflow._schema.fields.constraint import ValidationError
+
+
+class OverridesTest(unittest.TestCase):
+    """Overrides from strings and the environment are applied before validation."""
+
+    def setUp(self) -> None:
+        deployment = Schema("deployment", description="Deployment").add(
+            IntegerField("weight", description="Weight", le=100),
+        )
+        self.manager = Manager(
+            Schema("service", description="Service")
+            .add(StringField("name", description="Name"))
+            .add(IntegerField("port", description="Port"))
+            .add(deployment),
+        )
+        self.data: dict[str, typing.Any] = {"service": {"name": "api", "port": 80}}
+
+    def _load(self, *overrides: str, **environ: str) -> typing.Any:  # noqa: ANN401
+        return self.manager.loads(self.data, overrides=overrides, environ=environ)
+
+    def test_overrides_are_typed_and_create_sections(self) -> None:
+        original = copy.deepcopy(self.data)
+
+        config = self._load("service.port=8080", "service.deployment.weight=5")
+
+        self.assertEqual(config.service.port, 8080)
+        self.assertEqual(config.service.deployment.weight, 5)
+        self.assertEqual(self.data, original)
+
+    def test_overrides_win_over_environment(self) -> None:
+        config = self._load(
+            "service.port=8080",
+            CONFFLOW__SERVICE__PORT="9090",
+            CONFFLOW__SERVICE__NAME="web",
+            OTHER="ignored",
+        )
+
+        self.assertEqual((config.service.name, config.service.port), ("web", 8080))
+
+    def test_invalid_overrides(self) -> None:
+        for overrides, environ, message in (
+            (("service.port",), {}, "expected 'key.path=value'"),
+            (("service.prot=1",), {}, "Unknown override path"),
+            (("service.port=eighty",), {}, "Invalid override for 'service.port'"),
+            ((), {"CONFFLOW__SERVICE__PROT": "1"}, "Unknown override variable"),
+        ):
+            with (
+                self.subTest(overrides=overrides, environ=environ),
+                self.assertRaisesRegex(ValueError, message),
+            ):
+                self._load(*overrides, **environ)
+
+    def test_overridden_values_are_validated(self) -> None:
+        with self.assertRaises(ValidationError):
+            self._load("service.deployment.weight=101")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import typing
+import unittest
+
+from confflow import IntegerField, Manager, MapField, Schema, SchemaList
+from confflow._schema.fields.constraint import ValidationError
+
+
+class NotThirteen(IntegerField):
+    """A custom field whose `validate` does more than run its constraints."""
+
+    def validate(self, value: int, /) -> None:
+        if value == 13:  # noqa: PLR2004
+            raise ValidationError("13 is not allowed")  # noqa: EM101, TRY003
+
+        super().validate(value)
+
+
+class ProfileTest(unittest.TestCase):
+    """`profile` must accept exactly what `validate` accepts."""
+
+    def setUp(self) -> None:
+        item = Schema("item", description="Item").add(
+            IntegerField("n", description="N", ge=0),
+        )
+        self.schema = (
+            Schema("service", description="Service")
+            .add(NotThirteen("port", description="Port", ge=1))
+            .add(SchemaList("items", item, description="Items"))
+            .add(
+                MapField(
+                    "limits",
+                    NotThirteen("limit", description="L"),
+                    description="L",
+                ),
+            )
+        )
+
+    def test_profile_and_validate_agree_for_custom_field(self) -> None:
+        for data in (
+            {"port": 13},
+            {"limits": {"eu": 13}},
+            {"items": [{"n": -1}]},
+        ):
+            with self.subTest(data=data):
+                with self.assertRaises(ValidationError):
+                    self.schema.validate(data)  # type: ignore[arg-type]
+                with self.assertRaises(ValidationError):
+                    self.schema.profile(data)  # type: ignore[arg-type]
+
+    def test_report_covers_nested_items(self) -> None:
+        data: dict[str, typing.Any] = {
+            "port": 80,
+            "items": [{"n": 1}, {"n": 2}],
+            "limits": {"eu": 1},
+        }
+        report = self.schema.profile(data)
+        entries = {(entry.path, entry.kind): entry for entry in report}
+
+        self.assertIn(("service.port", "field"), entries)
+        self.assertIn(("service.limits.*", "field"), entries)
+        item_constraint = next(
+            entry for entry in report if entry.path.startswith("service.items[].n:")
+        )
+        self.assertEqual(item_constraint.calls, 2)
+
+    def test_profile_leaves_schema_untouched(self) -> None:
+        manager = Manager(self.schema)
+        fingerprint = manager.fingerprint
+
+        manager.profile({"service": {"port": 80}})
+
+        self.assertEqual(manager.fingerprint, fingerprint)
+        with self.assertRaises(ValidationError):
+            manager.validate({"service": {"port": 13}})
+
+
+if __name__ == "__main__":
+    unittest.main()
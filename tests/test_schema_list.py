@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import unittest
+
+from confflow import IntegerField, Schema, SchemaList
+from confflow._schema.fields.constraint import ValidationError
+
+
+class NotThirteen(IntegerField):
+    """A custom field without constraints whose `validate` rejects 13."""
+
+    def validate(self, value: int, /) -> None:
+        if value == 13:  # noqa: PLR2004
+            raise ValidationError("13 is not allowed")  # noqa: EM101, TRY003
+
+        super().validate(value)
+
+
+class SchemaListTest(unittest.TestCase):
+    """The compiled validator must run every field of a list item."""
+
+    def setUp(self) -> None:
+        item = Schema("item", description="Item").add(NotThirteen("n", description="N"))
+        self.schema = Schema("service", description="Service").add(
+            SchemaList("items", item, description="Items"),
+        )
+
+    def test_custom_field_in_items_is_validated(self) -> None:
+        self.schema.validate({"items": [{"n": 1}, {"n": 2}]})
+
+        with self.assertRaises(ValidationError):
+            self.schema.validate({"items": [{"n": 1}, {"n": 13}]})
+
+    def test_non_mapping_item_reports_its_index(self) -> None:
+        with self.assertRaises(ValidationError) as context:
+            self.schema.validate({"items": [{"n": 1}, 5]})
+
+        self.assertIn("Item 1", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+import pickle
+import typing
+import unittest
+from datetime import date
+
+import yaml
+
+from confflow import DateField, IntegerField, Integerlist, Manager, Schema
+
+
+class SerializationTest(unittest.TestCase):
+    """Every config mode serializes to the same plain data and pickles."""
+
+    def setUp(self) -> None:
+        self.manager = Manager(
+            Schema("release", description="Release")
+            .add(DateField("date", description="Date"))
+            .add(Integerlist("ports", description="Ports"))
+            .add(IntegerField("build", description="Build")),
+        )
+        self.data: dict[str, typing.Any] = {
+            "release": {
+                "date": date(2026, 1, 2),
+                "ports": [80, 443],
+                "build": 7,
+            },
+        }
+
+    def test_to_dict_yaml_and_json(self) -> None:
+        for mode in ("eager", "lazy", "view"):
+            with self.subTest(mode=mode):
+                config = self.manager.loads(self.data, mode=mode)
+
+                self.assertEqual(config.to_dict(), self.data)
+                self.assertEqual(yaml.safe_load(config.to_yaml()), self.data)
+                self.assertEqual(
+                    json.loads(config.to_json())["release"]["date"],
+                    "2026-01-02",
+                )
+
+    def test_pickle_round_trip(self) -> None:
+        for mode in ("eager", "lazy", "view"):
+            with self.subTest(mode=mode):
+                config = self.manager.loads(self.data, mode=mode)
+
+                restored = pickle.loads(pickle.dumps(config))  # noqa: S301
+
+                self.assertEqual(restored.to_dict(), self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
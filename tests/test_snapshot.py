@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pickle
+import tempfile
+import typing
+import unittest
+from pathlib import Path
+
+from confflow import IntegerField, Manager, Schema
+from confflow.manager import _SNAPSHOT_MAGIC
+
+
+class SnapshotTest(unittest.TestCase):
+    """Unusable snapshots fall back to loading the configuration files."""
+
+    def setUp(self) -> None:
+        self.manager = Manager(
+            Schema("service", description="Service").add(
+                IntegerField("port", description="Port"),
+            ),
+        )
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.fallback = self.directory / "config.yml"
+        self.fallback.write_text("service:\n  port: 81\n", encoding="utf-8")
+        self.snapshot = self.directory / "config.snapshot"
+
+    def _port(self) -> int:
+        config: typing.Any = self.manager.load_snapshot(self.snapshot, self.fallback)
+        return typing.cast("int", config.service.port)
+
+    def test_round_trip(self) -> None:
+        self.manager.dump_snapshot(
+            self.manager.loads({"service": {"port": 80}}),
+            self.snapshot,
+        )
+
+        self.assertEqual(self._port(), 80)
+
+    def test_unusable_snapshots_fall_back(self) -> None:
+        header = _SNAPSHOT_MAGIC + bytes.fromhex(self.manager.fingerprint)
+        payload = pickle.dumps({"service": {"port": 80}})
+        for name, content in (
+            ("empty", b""),
+            ("other schemas", _SNAPSHOT_MAGIC + bytes(32) + payload),
+            ("truncated", header + payload[:-4]),
+            ("unknown module", header + b"cno_such_module\nname\n."),
+            ("unknown attribute", header + b"cbuiltins\nno_such_name\n."),
+            ("bad opcode", header + b"\xff"),
+        ):
+            with self.subTest(name=name):
+                self.snapshot.write_bytes(content)
+
+                self.assertEqual(self._port(), 81)
+
+    def test_missing_snapshot_falls_back(self) -> None:
+        self.assertEqual(self._port(), 81)
+
+
+if __name__ == "__main__":
+    unittest.main()
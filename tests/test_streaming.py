@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import tempfile
+import typing
+import unittest
+from pathlib import Path
+
+import yaml
+
+from confflow import IntegerField, Manager, OneOf, Schema, StringField
+from confflow._schema.fields.constraint import ValidationError
+
+_BOTH_DATABASES: str = """\
+service:
+  database:
+    postgres:
+      port: 1
+    sqlite:
+      path: x
+"""
+
+
+class StreamingTest(unittest.TestCase):
+    """Streaming validation accepts what `load` accepts and names the failing line."""
+
+    def setUp(self) -> None:
+        postgres = Schema("postgres", description="Postgres").add(
+            IntegerField("port", description="Port", ge=1),
+        )
+        sqlite = Schema("sqlite", description="SQLite").add(
+            StringField("path", description="Path"),
+        )
+        database = Schema("database", description="Database").add(
+            OneOf(postgres, sqlite),
+        )
+        self.manager = Manager(
+            Schema("service", description="Service")
+            .add(IntegerField("port", description="Port", ge=1))
+            .add(database),
+        )
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def _write(self, text: str) -> Path:
+        path = self.directory / "config.yml"
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_matches_load(self) -> None:
+        path = self._write(
+            "service:\n  port: 80\n  database:\n    sqlite:\n      path: x\n",
+        )
+
+        self.manager.validate_stream(path)
+        config: typing.Any = self.manager.load(path, streaming=True)
+
+        self.assertEqual(config.to_dict(), self.manager.load(path).to_dict())
+
+    def test_errors_name_the_line(self) -> None:
+        cases: tuple[tuple[str, type[Exception], str], ...] = (
+            ("service:\n  port: 0\n", ValidationError, r"config\.yml:2: "),
+            ("service:\n  prot: 80\n", KeyError, r"config\.yml:2: "),
+            ("servce:\n  port: 80\n", ValueError, "Invalid keys found"),
+            (_BOTH_DATABASES, ValueError, "Expected exactly one of"),
+            ("service: [\n", yaml.YAMLError, ""),
+        )
+        for text, error, message in cases:
+            with (
+                self.subTest(text=text),
+                self.assertRaisesRegex(error, message),
+            ):
+                self.manager.validate_stream(self._write(text))
+
+    def test_streaming_rejects_overrides(self) -> None:
+        path = self._write("service:\n  port: 80\n")
+
+        with self.assertRaisesRegex(ValueError, "can't be combined"):
+            self.manager.load(path, streaming=True, overrides=["service.port=81"])
+
+
+if __name__ == "__main__":
+    unittest.main()
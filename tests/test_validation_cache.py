@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import unittest
+
+from confflow import IntegerField, Manager, Schema, StringField
+from confflow._schema.fields.constraint import ValidationError
+
+
+class ValidationCacheTest(unittest.TestCase):
+    """Sections that already passed validation aren't validated again."""
+
+    def setUp(self) -> None:
+        self.schema = Schema("service", description="Service").add(
+            IntegerField("port", description="Port", ge=1),
+        )
+        self.manager = Manager(self.schema, validation_cache_size=2)
+
+    def test_hits_and_misses(self) -> None:
+        self.manager.validate({"service": {"port": 80}})
+        self.manager.validate({"service": {"port": 80}})
+        self.manager.validate({"service": {"port": 81}})
+
+        info = self.manager.validation_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+    def test_invalid_sections_are_not_cached(self) -> None:
+        for _ in range(2):
+            with self.assertRaises(ValidationError):
+                self.manager.validate({"service": {"port": 0}})
+
+        self.assertEqual(self.manager.validation_cache_info().currsize, 0)
+
+    def test_schema_change_misses(self) -> None:
+        self.manager.validate({"service": {"port": 80}})
+        self.schema.add(StringField("name", description="Name"))
+        self.manager.validate({"service": {"port": 80}})
+
+        self.assertEqual(self.manager.validation_cache_info().hits, 0)
+
+    def test_clear(self) -> None:
+        self.manager.validate({"service": {"port": 80}})
+        self.manager.clear_validation_cache()
+
+        self.assertEqual(self.manager.validation_cache_info().currsize, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()